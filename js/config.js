@@ -46,6 +46,23 @@ const PADAKANAJA_COMBINED_FILES = [
     'padakanaja/combined_dictionaries_ultra.json'
 ];
 
+// Padakanaja shard packs (scripts/parsing/build_shard_packs.py): small gzipped shards fetched
+// concurrently and searchable as each arrives; PADAKANAJA_COMBINED_FILES is the fallback
+// when the shard manifest is not deployed
+const PADAKANAJA_SHARD_MANIFEST = 'padakanaja/shards/shard_manifest.json';
+const SHARD_FETCH_CONCURRENCY = 4;
+
+// Build manifest (scripts/parsing/build_manifest.py): content hash of the current build
+// and patches from earlier builds, so a cached client only downloads what changed
+const BUILD_MANIFEST_URL = 'padakanaja/build_manifest.json';
+
+// Compact prebuilt Alar index (scripts/parsing/build_alar_client_index.py), read through
+// typed arrays instead of building the reverse index from entries; cached in IndexedDB
+const ALAR_CLIENT_INDEX = {
+    file: 'padakanaja/alar_client_index.bin',
+    gzip: 'padakanaja/alar_client_index.bin.gz'
+};
+
 // Pre-built reverse index for Alar (removed - building from entries instead)
 // Reverse index is now built on-the-fly from entries for simplicity
 const ALAR_REVERSE_INDEX_FILES = []; // Empty - will build from entries
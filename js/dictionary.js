@@ -25,9 +25,8 @@ async function loadAlarFromYAML() {
                             dictionaryReady = true;
                             console.log(`✓ Loaded ${alarEntries.length} Alar entries from cache`);
                             
-                            // Build reverse index from entries (no pre-built index)
-                            buildReverseIndex();
-                            console.log(`✓ Alar reverse index built from entries. Total words: ${reverseIndex.size}`);
+                            // Prebuilt index (cached), or build it from entries
+                            await useCachedAlarIndex();
                             return;
                         }
                     } else if (cachedData.alar && Array.isArray(cachedData.alar)) {
@@ -35,9 +34,8 @@ async function loadAlarFromYAML() {
                         dictionaryReady = true;
                         console.log(`✓ Loaded ${dictionary.length} Alar entries from cache`);
                         
-                        // Build reverse index from entries (no pre-built index)
-                        buildReverseIndex();
-                        console.log(`✓ Alar reverse index built from entries. Total words: ${reverseIndex.size}`);
+                        // Prebuilt index (cached), or build it from entries
+                        await useCachedAlarIndex();
                         return;
                     }
                 }
@@ -46,8 +44,9 @@ async function loadAlarFromYAML() {
             }
         }
         
-        // Fetch from YAML (the original fast way)
+        // Fetch from YAML (the original fast way), and the prebuilt index alongside it
         console.log('Fetching Alar dictionary from YAML...');
+        const alarIndexRequest = fetchAlarIndex();
         const primaryEntries = await fetchDictionaryFile(PRIMARY_DICTIONARY);
         
         if (!primaryEntries || !Array.isArray(primaryEntries)) {
@@ -65,13 +64,14 @@ async function loadAlarFromYAML() {
         dictionaryReady = true;
         console.log(`✓ Loaded ${primaryEntries.length} Alar entries from YAML`);
         
-                            // Build reverse index from entries (no pre-built index)
-                            buildReverseIndex();
-                            console.log(`✓ Alar reverse index built from entries. Total words: ${reverseIndex.size}`);
+        // Prebuilt index if it is deployed, otherwise build it from entries
+        const alarIndex = await alarIndexRequest;
+        const usingAlarIndex = useAlarIndex(alarIndex);
         
         // Cache for offline use
         try {
             await setCachedDictionary({ alar: dictionary });
+            if (usingAlarIndex) await setCachedAlarIndex(alarIndex);
             await setCachedVersion(CACHE_VERSION);
             console.log('✓ Alar dictionary cached for offline use');
         } catch (error) {
@@ -94,7 +94,7 @@ async function loadDictionary() {
     // Try to load from cache first (unless bypassed or version mismatch)
     if (!bypassCache && versionMatches) {
         try {
-            const cachedData = await getCachedDictionary();
+            const cachedData = await updateCachedDictionary(await getCachedDictionary());
             // Handle both old format (array) and new format (object with alar/padakanaja)
             if (cachedData) {
                 if (Array.isArray(cachedData)) {
@@ -184,6 +184,110 @@ async function loadDictionary() {
     await fetchAndCacheDictionary();
 }
 
+// Fetch the build manifest (null if it is not deployed)
+async function fetchBuildManifest() {
+    try {
+        const response = await fetch(BUILD_MANIFEST_URL, { cache: 'no-cache' });
+        if (!response.ok) return null;
+        return await response.json();
+    } catch (error) {
+        console.warn('Build manifest not available:', error);
+        return null;
+    }
+}
+
+// Record which build the cached data belongs to (after caching it). A partial cache
+// (Alar only, before the additional dictionaries arrived) belongs to no build, so the
+// next visit fetches fresh data instead of serving it as current
+async function recordCachedBuild(complete = true) {
+    if (!complete) {
+        await setCachedBuild(null);
+        return;
+    }
+    const manifest = await fetchBuildManifest();
+    await setCachedBuild(manifest ? manifest.build : null);
+}
+
+// Identity of an expanded padakanaja entry, as a delta row [k, e, t?] of dictionary dictKey maps to it
+function deltaEntryKey(dictKey, kannada, english, type) {
+    return `${dictKey}\t${kannada}\t${english}\t${normalizeType(type || 'Noun')}`;
+}
+
+// Apply a delta from scripts/parsing/build_manifest.py to expanded entries:
+// drop whole dictionaries, remove rows (each once per occurrence), then append added rows
+function applyDictionaryDelta(entries, delta) {
+    const dropped = new Set();
+    const removals = new Map();
+    const additions = {};
+    for (const filePatch of Object.values(delta.files)) {
+        for (const dictKey of filePatch.drop) {
+            dropped.add(dictKey.includes('|') ? dictKey : `${dictKey}|`);
+        }
+        for (const [dictKey, rows] of Object.entries(filePatch.remove)) {
+            const key = dictKey.includes('|') ? dictKey : `${dictKey}|`;
+            for (const row of rows) {
+                const entryKey = deltaEntryKey(key, row[0], row[1], row[2]);
+                removals.set(entryKey, (removals.get(entryKey) || 0) + 1);
+            }
+        }
+        for (const [dictKey, rows] of Object.entries(filePatch.add)) {
+            additions[dictKey] = (additions[dictKey] || []).concat(rows);
+        }
+    }
+
+    const kept = entries.filter(entry => {
+        if (entry.source === 'alar') return true;
+        const dictKey = `${entry.source}|${entry.dict_title || ''}`;
+        if (dropped.has(dictKey)) return false;
+        const def = entry.defs && entry.defs[0];
+        const entryKey = deltaEntryKey(dictKey, entry.entry, def ? def.entry : '', def ? def.type : '');
+        const count = removals.get(entryKey);
+        if (count) {
+            removals.set(entryKey, count - 1);
+            return false;
+        }
+        return true;
+    });
+    return kept.concat(normalizeEntryTypes(expandOptimizedEntries(additions)));
+}
+
+// Bring cached data up to the current build: unchanged if it is current (or there is no
+// manifest), patched if the manifest has a delta from the cached build, otherwise null
+async function updateCachedDictionary(cachedData) {
+    if (!cachedData) return cachedData;
+    const manifest = await fetchBuildManifest();
+    if (!manifest) return cachedData;
+
+    const cachedBuild = await getCachedBuild();
+    if (cachedBuild === manifest.build) return cachedData;
+    const delta = cachedBuild && manifest.deltas ? manifest.deltas[cachedBuild] : null;
+    if (!delta) {
+        console.log(`Cached build ${cachedBuild || 'unknown'} has no delta to ${manifest.build}, fetching fresh data`);
+        return null;
+    }
+
+    try {
+        const response = await fetch(delta.file);
+        if (!response.ok) throw new Error(`Failed to fetch ${delta.file} (${response.status})`);
+        const patch = await response.json();
+        if (Array.isArray(cachedData)) {
+            cachedData = applyDictionaryDelta(cachedData, patch);
+        } else if (Array.isArray(cachedData.padakanaja)) {
+            cachedData.padakanaja = applyDictionaryDelta(cachedData.padakanaja, patch);
+        } else if (cachedData.padakanaja) {
+            return null;
+        }
+        // Alar-only cache (mobile): the delta has nothing to apply
+        await setCachedDictionary(cachedData);
+        await setCachedBuild(manifest.build);
+        console.log(`✓ Updated cache ${cachedBuild} -> ${manifest.build} with a ${(delta.bytes / 1024).toFixed(1)} KB delta`);
+        return cachedData;
+    } catch (error) {
+        console.warn('Failed to apply dictionary delta, fetching fresh data:', error);
+        return null;
+    }
+}
+
 // Expand optimized dictionary format to flat array
 // Supports both old format: {source: {dict_title: [[k, e, t?], ...]}}
 // and new ultra-compact format: {source|dict_title: [[k, e, t?], ...]}
@@ -231,16 +335,17 @@ function expandOptimizedEntries(optimized) {
         // Process entries list (ultra-compact format)
         if (Array.isArray(entriesList)) {
             for (const entryData of entriesList) {
-                // Handle both [k, e] and [k, e, t] formats
-                let kannada, english, type;
-                if (entryData.length === 3) {
-                    [kannada, english, type] = entryData;
+                // Handle [k, e], [k, e, t] and [k, e, t, also] formats; also lists the other
+                // "source|dict_title" keys of a collapsed near-duplicate
+                let kannada, english, type, also;
+                if (entryData.length >= 3) {
+                    [kannada, english, type, also] = entryData;
                 } else {
                     [kannada, english] = entryData;
                     type = '';
                 }
                 
-                entries.push({
+                const expanded = {
                     entry: kannada,
                     defs: [{
                         entry: english,
@@ -248,7 +353,11 @@ function expandOptimizedEntries(optimized) {
                     }],
                     source: source,
                     dict_title: dictTitle
-                });
+                };
+                if (also && also.length > 0) {
+                    expanded.also = also;
+                }
+                entries.push(expanded);
             }
         }
     }
@@ -256,11 +365,21 @@ function expandOptimizedEntries(optimized) {
     return entries;
 }
 
+// Same as normalize_kannada in scripts/parsing/kannada_text.py: NFC, invisible
+// characters and joiners that do not follow a Kannada letter removed
+function normalizeKannada(text) {
+    if (!text) return '';
+    return text.normalize('NFC')
+        .replace(/[\u200B\u2060\uFEFF\u00AD]/g, '')
+        .replace(/(?<![\u0C80-\u0CFF\u200C\u200D])[\u200C\u200D]+/g, '')
+        .replace(/\s+/g, ' ').trim();
+}
+
 // Clean Kannada entry text - remove brackets, parentheses, numbers, and other non-text characters
 function cleanKannadaEntry(text) {
     if (!text) return '';
     // Remove brackets: [], (), {}, 【】, 「」, etc.
-    let cleaned = text.replace(/[\[\](){}【】「」〈〉《》『』〔〕［］（）｛｝]/g, '');
+    let cleaned = normalizeKannada(text).replace(/[\[\](){}【】「」〈〉《》『』〔〕［］（）｛｝]/g, '');
     // Remove other common punctuation that shouldn't be in dictionary keys
     cleaned = cleaned.replace(/[<>"']/g, '');
     // Remove numbers (data entry errors) - ASCII digits and digit sequences
@@ -416,6 +535,64 @@ async function fetchDictionaryFile(source, onProgress = null) {
     }
 }
 
+// Fetch the shard pack manifest (null if shard packs are not deployed)
+async function fetchShardManifest() {
+    try {
+        const response = await fetch(PADAKANAJA_SHARD_MANIFEST, { cache: 'no-cache' });
+        if (!response.ok) return null;
+        const manifest = await response.json();
+        return manifest && Array.isArray(manifest.files) && manifest.files.length > 0 ? manifest : null;
+    } catch (error) {
+        console.warn('Shard manifest not available:', error);
+        return null;
+    }
+}
+
+// Fetch a build output that has a precompressed .gz copy; returns the uncompressed bytes
+// (ArrayBuffer). The .gz copy is decompressed in the browser when DecompressionStream is available.
+async function fetchPrecompressed(file, gzipFile, init = {}) {
+    const useGzip = gzipFile && typeof DecompressionStream !== 'undefined';
+    const url = useGzip ? gzipFile : file;
+    const response = await fetch(url, init);
+    if (!response.ok) throw new Error(`Failed to fetch ${url} (${response.status} ${response.statusText})`);
+
+    const buffer = await response.arrayBuffer();
+    const bytes = new Uint8Array(buffer, 0, Math.min(2, buffer.byteLength));
+    // Servers that send .gz files with Content-Encoding: gzip have already removed the gzip layer
+    if (bytes[0] === 0x1f && bytes[1] === 0x8b) {
+        const stream = new Blob([buffer]).stream().pipeThrough(new DecompressionStream('gzip'));
+        return await new Response(stream).arrayBuffer();
+    }
+    return buffer;
+}
+
+// Fetch one shard pack and expand it like any ultra-compact file
+async function fetchShardPack(shard) {
+    const buffer = await fetchPrecompressed(shard.file, shard.gzip);
+    return normalizeEntryTypes(expandOptimizedEntries(JSON.parse(new TextDecoder().decode(buffer))));
+}
+
+// Fetch all shard packs, SHARD_FETCH_CONCURRENCY at a time. onShard(entries, shard) runs as
+// each one arrives, so its entries are searchable before the rest. Returns the shards loaded.
+async function loadShardPacks(manifest, onShard) {
+    let next = 0;
+    let loaded = 0;
+    const fetchNext = async () => {
+        while (next < manifest.files.length) {
+            const shard = manifest.files[next++];
+            try {
+                onShard(await fetchShardPack(shard), shard);
+                loaded++;
+            } catch (error) {
+                console.error(`Error loading shard ${shard.file}:`, error);
+            }
+        }
+    };
+    const workers = Math.min(SHARD_FETCH_CONCURRENCY, manifest.files.length);
+    await Promise.all(Array.from({ length: workers }, fetchNext));
+    return loaded;
+}
+
 // Progress tracking for background dictionary loading
 let backgroundLoadProgress = {
     current: 0,
@@ -477,6 +654,7 @@ async function fetchAndCacheDictionary() {
         createProgressIndicator();
         updateProgressIndicator(0, null, 0, 'Loading Alar Dictionary...');
         
+        const alarIndexRequest = fetchAlarIndex();
         const primaryEntries = await fetchDictionaryFile(
             PRIMARY_DICTIONARY,
             (loaded, total, percent) => {
@@ -500,16 +678,10 @@ async function fetchAndCacheDictionary() {
         dictionaryReady = true; // Alar is ready for search - spinner can be removed now
         console.log(`✓ Loaded ${primaryEntries.length} entries from ${PRIMARY_DICTIONARY.name}`);
         
-        // Load pre-built Alar reverse index instead of building it client-side
-        console.log('Loading pre-built Alar reverse index...');
-        try {
-            await loadPreBuiltReverseIndex(ALAR_REVERSE_INDEX_FILES, ALAR_REVERSE_INDEX_METADATA, 'Alar');
-            console.log(`✓ Alar reverse index loaded. Total words: ${reverseIndex.size}`);
-        } catch (error) {
-            console.warn('Failed to load pre-built Alar reverse index, building from entries:', error);
-            // Build reverse index from entries (no pre-built index)
-            buildReverseIndex();
-            console.log(`✓ Alar reverse index built from entries. Total words: ${reverseIndex.size}`);
+        // Use the prebuilt Alar index (fetched alongside the entries) instead of building it client-side
+        const alarIndex = await alarIndexRequest;
+        if (useAlarIndex(alarIndex)) {
+            await setCachedAlarIndex(alarIndex);
         }
         
         // Don't hide progress indicator yet - padakanaja is still loading
@@ -533,11 +705,61 @@ async function fetchAndCacheDictionary() {
         
         console.log(`Loading additional dictionaries in background (non-blocking)...`);
         
-        const loadPadakanajaAsync = () => {
+        const loadPadakanajaAsync = async () => {
             // Show progress immediately for padakanaja loading
             createProgressIndicator();
             updateProgressIndicator(0, PADAKANAJA_COMBINED_FILES.length, 0, 'Loading Additional Dictionaries...');
             
+            // Shard packs: fetched concurrently, each searchable as soon as it arrives
+            const shardManifest = await fetchShardManifest();
+            if (shardManifest) {
+                const shardCount = shardManifest.files.length;
+                const startTime = performance.now();
+                let arrived = 0;
+                const loaded = await loadShardPacks(shardManifest, (entries) => {
+                    dictionary = dictionary.concat(entries);
+                    padakanajaInMemory = true;
+                    arrived++;
+                    if (arrived === 1) {
+                        console.log(`✓ First padakanaja shard searchable after ${Math.round(performance.now() - startTime)} ms`);
+                    }
+                    updateProgressIndicator(arrived, shardCount, Math.round(arrived / shardCount * 100),
+                        `Loading Additional Dictionaries... (${arrived}/${shardCount})`);
+                });
+                console.log(`✓ Loaded ${loaded}/${shardCount} padakanaja shards in ${Math.round(performance.now() - startTime)} ms`);
+                console.log(`✓ Total loaded: ${dictionary.length} entries in memory`);
+                
+                // A partial dictionary must not be cached: recordCachedBuild would mark it as
+                // the current build, and the missing shards would not be fetched again
+                if (loaded === shardCount) {
+                    // Update cache asynchronously (non-blocking)
+                    if ('requestIdleCallback' in window) {
+                        requestIdleCallback(() => {
+                            updateCache(true);
+                        }, { timeout: 5000 });
+                    } else {
+                        setTimeout(() => {
+                            updateCache(true);
+                        }, 100);
+                    }
+                } else if (loaded > 0) {
+                    console.warn(`⚠ ${shardCount - loaded} padakanaja shards failed to load - not caching this session`);
+                }
+                
+                updateProgressIndicator(shardCount, shardCount, 100, loaded === shardCount ? 'All Dictionaries Loaded'
+                    : loaded > 0 ? 'Some Dictionaries Failed to Load' : 'Alar Dictionary Ready');
+                setTimeout(() => {
+                    const progressEl = document.getElementById('dict-progress');
+                    if (progressEl) {
+                        progressEl.style.opacity = '0';
+                        setTimeout(() => {
+                            progressEl.style.display = 'none';
+                        }, 300);
+                    }
+                }, 500);
+                return;
+            }
+            
             // Load all chunks sequentially
             let allPadakanajaEntries = [];
             let loadedChunks = 0;
@@ -566,6 +788,7 @@ async function fetchAndCacheDictionary() {
                             // Cache padakanaja separately
                             try {
                                 await setCachedPadakanaja(allPadakanaja);
+                                await recordCachedBuild();
                                 console.log('✓ Padakanaja cached to IndexedDB - will search on-demand');
                             } catch (error) {
                                 console.error('Failed to cache padakanaja:', error);
@@ -579,11 +802,11 @@ async function fetchAndCacheDictionary() {
                             // Update cache asynchronously (non-blocking)
                             if ('requestIdleCallback' in window) {
                                 requestIdleCallback(() => {
-                                    updateCache();
+                                    updateCache(true);
                                 }, { timeout: 5000 });
                             } else {
                                 setTimeout(() => {
-                                    updateCache();
+                                    updateCache(true);
                                 }, 100);
                             }
                         }
@@ -753,7 +976,7 @@ async function fetchAndCacheDictionary() {
         window.searchPadakanajaFromIndexedDB = searchPadakanajaFromIndexedDB;
         
         // Cache function (called separately)
-        async function updateCache() {
+        async function updateCache(complete = false) {
         try {
             // On mobile, cache Alar and padakanaja separately
             // On desktop, cache everything together
@@ -768,6 +991,7 @@ async function fetchAndCacheDictionary() {
                 
                 await setCachedDictionary({ alar: alarEntries });
                 await setCachedVersion(CACHE_VERSION);
+                await recordCachedBuild(complete);
                 
                 console.log(`✓ Alar cached successfully in IndexedDB (${sizeMB} MB)`);
             } else {
@@ -786,6 +1010,7 @@ async function fetchAndCacheDictionary() {
             await setCachedDictionary(dictionary);
                 }
             await setCachedVersion(CACHE_VERSION);
+            await recordCachedBuild(complete);
             
             // Verify cache was saved
             const verifyCache = await getCachedDictionary();
@@ -886,6 +1111,130 @@ async function loadPreBuiltReverseIndex(indexFiles, metadataFile, sourceName = '
     }
 }
 
+// Preamble of a prebuilt Alar index: magic, version, header size, content hash
+const COMPACT_INDEX_VERSION = 2;
+const COMPACT_INDEX_PREAMBLE_SIZE = 32;
+
+// Content hash of a prebuilt Alar index, read from its preamble (null if it is not one)
+function compactIndexHash(buffer) {
+    if (!buffer || buffer.byteLength < COMPACT_INDEX_PREAMBLE_SIZE) return null;
+    const view = new DataView(buffer);
+    const magic = new TextDecoder().decode(new Uint8Array(buffer, 0, 8));
+    if (magic !== 'RALAIDX1' || view.getUint32(8, true) !== COMPACT_INDEX_VERSION) return null;
+    return new TextDecoder().decode(new Uint8Array(buffer, 16, 16));
+}
+
+// Reverse index over a prebuilt Alar index (scripts/parsing/build_alar_client_index.py).
+// Answers has/get/keys/size like the Map built by buildReverseIndex; a word's postings
+// are decoded from the typed arrays on its first get.
+function openCompactReverseIndex(buffer) {
+    const MISSING = 0xFFFFFFFF;
+    if (compactIndexHash(buffer) === null) {
+        throw new Error(`Not an Alar client index (version ${COMPACT_INDEX_VERSION})`);
+    }
+    const headerSize = new DataView(buffer).getUint32(12, true);
+    const header = JSON.parse(new TextDecoder().decode(
+        new Uint8Array(buffer, COMPACT_INDEX_PREAMBLE_SIZE, headerSize)));
+    const section = (name, ArrayType) => {
+        const [offset, count] = header.sections[name];
+        return new ArrayType(buffer, COMPACT_INDEX_PREAMBLE_SIZE + headerSize + offset, count);
+    };
+    const termOffsets = section('term_offsets', Uint32Array);
+    const postings = section('postings', Uint32Array);
+    const recordEntry = section('record_entry', Uint32Array);
+    const recordDefinition = section('record_definition', Uint32Array);
+    const entryStrings = section('entry_strings', Uint32Array);
+    const stringOffsets = section('string_offsets', Uint32Array);
+    const recordType = section('record_type', Uint16Array);
+    const heapBytes = section('heap', Uint8Array);
+
+    let heap = null; // decoded on the first lookup
+    const string = ref => {
+        if (ref === MISSING) return undefined;
+        if (heap === null) heap = new TextDecoder().decode(heapBytes);
+        return heap.substring(stringOffsets[ref], stringOffsets[ref + 1]);
+    };
+
+    const terms = new Map();
+    header.terms.forEach((term, i) => terms.set(term, i));
+    const decoded = new Map();
+
+    return {
+        size: terms.size,
+        has: word => terms.has(word),
+        keys: () => terms.keys(),
+        get(word) {
+            if (decoded.has(word)) return decoded.get(word);
+            const term = terms.get(word);
+            if (term === undefined) return undefined;
+            const results = [];
+            for (let i = termOffsets[term]; i < termOffsets[term + 1]; i++) {
+                const record = postings[i];
+                const row = recordEntry[record];
+                const id = header.ids[row];
+                results.push({
+                    kannada: string(entryStrings[3 * row]),
+                    phone: string(entryStrings[3 * row + 1]),
+                    definition: string(recordDefinition[record]),
+                    type: header.types[recordType[record]],
+                    head: string(entryStrings[3 * row + 2]),
+                    id: id === null ? undefined : id,
+                    dict_title: header.dict_title,
+                    source: header.source
+                });
+            }
+            decoded.set(word, results);
+            return results;
+        }
+    };
+}
+
+// Fetch the prebuilt Alar index (null if it is not deployed)
+async function fetchAlarIndex(init = {}) {
+    try {
+        return await fetchPrecompressed(ALAR_CLIENT_INDEX.file, ALAR_CLIENT_INDEX.gzip, init);
+    } catch (error) {
+        console.warn('Prebuilt Alar index not available:', error);
+        return null;
+    }
+}
+
+// Use a prebuilt Alar index as the reverse index; without one (or if it does not decode),
+// build the reverse index from the loaded entries. Returns true if the prebuilt index is used.
+function useAlarIndex(buffer) {
+    if (buffer) {
+        try {
+            reverseIndex = openCompactReverseIndex(buffer);
+            for (const word of reverseIndex.keys()) {
+                allEnglishWords.add(word);
+            }
+            console.log(`✓ Alar reverse index loaded from prebuilt index. Total words: ${reverseIndex.size}`);
+            return true;
+        } catch (error) {
+            console.warn('Invalid prebuilt Alar index, building from entries:', error);
+        }
+    }
+    buildReverseIndex();
+    console.log(`✓ Alar reverse index built from entries. Total words: ${reverseIndex.size}`);
+    return false;
+}
+
+// Prebuilt Alar index for data loaded from the cache: the cached copy if the build manifest
+// lists the same content hash (or there is no manifest), else a fresh download
+async function useCachedAlarIndex() {
+    const [cachedIndex, manifest] = await Promise.all([getCachedAlarIndex(), fetchBuildManifest()]);
+    const current = manifest && manifest.indexes ? manifest.indexes[ALAR_CLIENT_INDEX.file] : null;
+    const stale = Boolean(cachedIndex && current && compactIndexHash(cachedIndex) !== current.hash);
+    if (stale) {
+        console.log(`Cached Alar index is not build ${current.hash}, fetching the current one`);
+    }
+    if (cachedIndex && !stale && useAlarIndex(cachedIndex)) return;
+    const alarIndex = await fetchAlarIndex(stale ? { cache: 'no-cache' } : {});
+    if (useAlarIndex(alarIndex)) {
+        await setCachedAlarIndex(alarIndex);
+    }
+}
+
 // Add entries to reverse index incrementally
 function addToReverseIndex(entries) {
     for (let i = 0; i < entries.length; i++) {
@@ -2,33 +2,6 @@
 // search.js - Search functions: direct search, synonym search, highlighting
 // ============================================================================
 
-// Clean Kannada entry text - remove brackets, parentheses, numbers, and other non-text characters
-function cleanKannadaEntry(text) {
-    if (!text) return '';
-    // Remove brackets: [], (), {}, 【】, 「」, etc.
-    let cleaned = text.replace(/[\[\](){}【】「」〈〉《》『』〔〕［］（）｛｝]/g, '');
-    // Remove other common punctuation that shouldn't be in dictionary keys
-    cleaned = cleaned.replace(/[<>"']/g, '');
-    // Remove numbers (data entry errors) - ASCII digits and digit sequences
-    cleaned = cleaned.replace(/\d+/g, '');
-    // Remove multiple spaces and trim
-    cleaned = cleaned.replace(/\s+/g, ' ').trim();
-    return cleaned;
-}
-
-// Count words in Kannada text (split by spaces)
-function countWords(text) {
-    if (!text) return 0;
-    const cleaned = cleanKannadaEntry(text);
-    const words = cleaned.split(/\s+/).filter(w => w.length > 0);
-    return words.length;
-}
-
-// Check if entry is a long phrase (>4 words)
-function isLongPhrase(text) {
-    return countWords(text) > 4;
-}
-
 // Check if entry is a description (more than 2 words) - these are low priority
 function isDescription(text) {
     return countWords(text) > 2;
@@ -370,6 +343,7 @@ function searchLocalAlar(query) {
                             head: entry.head || '',
                             id: entry.id || '',
                             dict_title: entry.dict_title || '',
+                            also: entry.also || [],
                             source: entry.source || 'alar',
                             matchedWord: word,
                             matchType: 'direct'
@@ -399,6 +373,7 @@ function searchLocalAlar(query) {
                             head: entry.head || '',
                             id: entry.id || '',
                             dict_title: entry.dict_title || '',
+                            also: entry.also || [],
                             source: entry.source || 'alar',
                             matchedWord: exactPhrase,
                             matchType: 'exact-phrase'
@@ -419,6 +394,7 @@ function searchLocalAlar(query) {
                                 head: entry.head || '',
                                 id: entry.id || '',
                                 dict_title: entry.dict_title || '',
+                                also: entry.also || [],
                                 source: entry.source || 'alar',
                                 matchedWord: exactPhrase,
                                 matchType: 'all-words'
@@ -477,6 +453,7 @@ async function searchDirect(query) {
                 head: result.head || '',
                 id: result.id || '',
                 dict_title: result.dict_title || '',
+                also: result.also || [],
                 source: result.source || '',
                 matchedWord: result.matchedWord || query,
                 matchType: result.matchType || 'direct'
@@ -612,6 +589,7 @@ async function searchDirect(query) {
                             head: entry.head,
                             id: entry.id,
                             dict_title: entry.dict_title,
+                            also: entry.also || [],
                             source: entry.source,
                             matchedWord: matchedWord,
                             matchType: 'wildcard'
@@ -774,6 +752,7 @@ async function searchDirect(query) {
                                 head: entry.head || '',
                                 id: entry.id || '',
                                 dict_title: entry.dict_title || '',
+                                also: entry.also || [],
                                 source: entry.source || '',
                                 matchedWord: matchedPattern,
                                 matchType: 'exact-phrase'
@@ -840,6 +819,7 @@ async function searchDirect(query) {
                                 head: entry.head,
                                 id: entry.id,
                                 dict_title: entry.dict_title,
+                                also: entry.also || [],
                                 source: entry.source,
                                 matchedWord: wildcardLower,
                                 matchType: 'exact-phrase'
@@ -919,6 +899,7 @@ async function searchDirect(query) {
                                     head: entry.head || '',
                                     id: entry.id || '',
                                     dict_title: entry.dict_title || '',
+                                    also: entry.also || [],
                                     source: entry.source || '',
                                     matchedWord: word,
                                     matchType: 'any-word'
@@ -1010,6 +991,7 @@ async function searchDirect(query) {
                                 head: entry.head || '',
                                 id: entry.id || '',
                                 dict_title: entry.dict_title || '',
+                                also: entry.also || [],
                                 source: entry.source || '',
                                 matchedWord: word,
                                 matchType: 'direct'
@@ -1138,6 +1120,7 @@ async function searchWithSynonyms(query, progressCallback = null) {
                                 head: result.head || '',
                                 id: result.id || '',
                                 dict_title: result.dict_title || '',
+                                also: result.also || [],
                                 source: result.source || '',
                                 matchedWord: relWord,
                                 originalQuery: queryLower,
@@ -1268,6 +1251,7 @@ async function searchWithSynonyms(query, progressCallback = null) {
                                         head: entry.head || '',
                                         id: entry.id || '',
                                         dict_title: entry.dict_title || '',
+                                        also: entry.also || [],
                                         source: entry.source || '',
                                         matchedWord: relWord,
                                         originalQuery: queryLower,
@@ -1396,6 +1380,7 @@ async function searchWithSynonyms(query, progressCallback = null) {
                                     head: entry.head || '',
                                     id: entry.id || '',
                                     dict_title: entry.dict_title || '',
+                                    also: entry.also || [],
                                     source: entry.source || '',
                                     matchedWord: relWord,
                                     originalQuery: word,
@@ -116,6 +116,68 @@ async function setCachedVersion(version) {
     }
 }
 
+// Build id (from BUILD_MANIFEST_URL) of the cached dictionary data
+async function getCachedBuild() {
+    try {
+        const db = await openDB();
+        return new Promise((resolve, reject) => {
+            const transaction = db.transaction([STORE_NAME], 'readonly');
+            const store = transaction.objectStore(STORE_NAME);
+            const request = store.get('build');
+            request.onerror = () => reject(request.error);
+            request.onsuccess = () => resolve(request.result);
+        });
+    } catch (error) {
+        return null;
+    }
+}
+
+async function setCachedBuild(build) {
+    try {
+        const db = await openDB();
+        return new Promise((resolve, reject) => {
+            const transaction = db.transaction([STORE_NAME], 'readwrite');
+            const store = transaction.objectStore(STORE_NAME);
+            const request = store.put(build, 'build');
+            request.onerror = () => reject(request.error);
+            request.onsuccess = () => resolve();
+        });
+    } catch (error) {
+        console.error('Failed to save build to IndexedDB:', error);
+    }
+}
+
+// Prebuilt Alar index (ArrayBuffer), cached alongside the Alar entries
+async function getCachedAlarIndex() {
+    try {
+        const db = await openDB();
+        return new Promise((resolve, reject) => {
+            const transaction = db.transaction([STORE_NAME], 'readonly');
+            const store = transaction.objectStore(STORE_NAME);
+            const request = store.get('alar_index');
+            request.onerror = () => reject(request.error);
+            request.onsuccess = () => resolve(request.result);
+        });
+    } catch (error) {
+        return null;
+    }
+}
+
+async function setCachedAlarIndex(buffer) {
+    try {
+        const db = await openDB();
+        return new Promise((resolve, reject) => {
+            const transaction = db.transaction([STORE_NAME], 'readwrite');
+            const store = transaction.objectStore(STORE_NAME);
+            const request = store.put(buffer, 'alar_index');
+            request.onerror = () => reject(request.error);
+            request.onsuccess = () => resolve();
+        });
+    } catch (error) {
+        console.error('Failed to save Alar index to IndexedDB:', error);
+    }
+}
+
 // Check if URL has refresh parameter (for hard refresh bypass)
 function shouldBypassCache() {
     const urlParams = new URLSearchParams(window.location.search);
@@ -138,6 +200,16 @@ async function clearRalaCache() {
                 const req = store.delete('version');
                 req.onsuccess = () => resolve();
                 req.onerror = () => reject(req.error);
+            }),
+            new Promise((resolve, reject) => {
+                const req = store.delete('build');
+                req.onsuccess = () => resolve();
+                req.onerror = () => reject(req.error);
+            }),
+            new Promise((resolve, reject) => {
+                const req = store.delete('alar_index');
+                req.onsuccess = () => resolve();
+                req.onerror = () => reject(req.error);
             })
         ]);
         console.log('✓ Rala cache cleared from IndexedDB. Refresh the page to reload from network.');
@@ -2,18 +2,6 @@
 // ui.js - UI rendering functions: results display and result cards
 // ============================================================================
 
-// Clean Kannada entry text - remove brackets, parentheses, and other non-text characters
-function cleanKannadaEntry(text) {
-    if (!text) return '';
-    // Remove brackets: [], (), {}, 【】, 「」, etc.
-    let cleaned = text.replace(/[\[\](){}【】「」〈〉《》『』〔〕［］（）｛｝]/g, '');
-    // Remove other common punctuation that shouldn't be in dictionary keys
-    cleaned = cleaned.replace(/[<>"']/g, '');
-    // Remove multiple spaces and trim
-    cleaned = cleaned.replace(/\s+/g, ' ').trim();
-    return cleaned;
-}
-
 function renderResults(directResults, synonymResults, synonymsUsed, query, loadingDirect = false, loadingIndirect = false, showDirectMobileLimit = false, showSynonymMobileLimit = false) {
     let html = '';
     
@@ -232,7 +220,15 @@ function renderResultCard(result, query, isSynonym = false) {
     const sourceId = `source-${result.id || 'no-id'}-${result.kannada.replace(/[^a-zA-Z0-9]/g, '-')}`;
     const escapedSourceText = sourceText.replace(/'/g, "&#39;").replace(/"/g, '&quot;');
     const escapedSourceTextKannada = (sourceTextKannada || '').replace(/'/g, "&#39;").replace(/"/g, '&quot;');
-    const tooltipText = sourceTextKannada ? `${escapedSourceTextKannada}<br>${escapedSourceText}` : escapedSourceText;
+    let tooltipText = sourceTextKannada ? `${escapedSourceTextKannada}<br>${escapedSourceText}` : escapedSourceText;
+    // Collapsed near-duplicates list the other dictionaries they were found in ("source|dict_title")
+    if (result.also && result.also.length > 0) {
+        const otherTitles = result.also.map(key => {
+            const [otherSource, otherTitle] = key.split('|', 2);
+            return (otherTitle || otherSource).replace(/'/g, "&#39;").replace(/"/g, '&quot;').replace(/</g, '&lt;');
+        });
+        tooltipText += `<br>Also in: ${otherTitles.join('; ')}`;
+    }
     
     const sourceDisplay = sourceText ? `
         <span class="dict-source-wrapper" id="${sourceId}-wrapper">
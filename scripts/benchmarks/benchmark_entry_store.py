@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Peak RSS of the Padakanaja load: list of entry dicts vs EntryStore.
+
+Each representation is measured in a fresh interpreter, so the peak-RSS
+numbers do not include the other run:
+
+    dicts   one dict per entry (what load_padakanaja returned before EntryStore)
+    store   scripts/parsing/entry_store.py column store
+
+With --with-index the run continues into build_reverse_index, the stage
+that consumes the entries, and reports the peak over both.
+
+Usage:
+    python benchmark_entry_store.py [--padakanaja padakanaja/combined_dictionaries_ultra.json] [--with-index] [--output FILE]
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.parsing.create_padakanaja_reverse_index import build_reverse_index
+from scripts.parsing.entry_store import EntryStore
+from scripts.parsing.instrumentation import peak_rss_mb
+from scripts.parsing.json_stream import iter_json_members
+
+DEFAULT_PADAKANAJA = 'padakanaja/combined_dictionaries_ultra.json'
+MODES = ('dicts', 'store')
+
+
+def load_dicts(ultra_file):
+    """The previous representation: one dict per entry"""
+    entries = []
+    for key, rows in iter_json_members(ultra_file):
+        source, dict_title = key.split('|', 1) if '|' in key else (key, '')
+        for row in rows:
+            if isinstance(row, list) and len(row) >= 2:
+                entries.append({'kannada': row[0], 'english': row[1],
+                                'type': row[2] if len(row) > 2 and row[2] else 'Noun',
+                                'source': source, 'dict_title': dict_title, 'id': ''})
+    return entries
+
+
+def run_mode(mode, ultra_file, with_index):
+    """Measure one representation in this process; returns the result record"""
+    gc.collect()
+    start_rss = peak_rss_mb()
+    start = time.perf_counter()
+    entries = load_dicts(ultra_file) if mode == 'dicts' else EntryStore.load_ultra(ultra_file)
+    result = {
+        'mode': mode,
+        'entries': len(entries),
+        'start_rss_mb': round(start_rss, 1),
+        'load_seconds': round(time.perf_counter() - start, 3),
+        'load_peak_rss_mb': round(peak_rss_mb(), 1)
+    }
+    if with_index:
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            reverse_index = build_reverse_index(entries)
+        result['index_seconds'] = round(time.perf_counter() - start, 3)
+        result['index_peak_rss_mb'] = round(peak_rss_mb(), 1)
+        result['words'] = len(reverse_index)
+    return result
+
+
+def benchmark(ultra_file, with_index=False, output_file=None):
+    print("=" * 80)
+    print("Entry Store Benchmark (peak RSS)")
+    print("=" * 80)
+    print(f"Input: {ultra_file}\n")
+
+    results = {}
+    for mode in MODES:
+        command = [sys.executable, __file__, '--measure', mode, '--padakanaja', str(ultra_file)]
+        if with_index:
+            command.append('--with-index')
+        completed = subprocess.run(command, check=True, capture_output=True, text=True)
+        results[mode] = json.loads(completed.stdout.strip().splitlines()[-1])
+
+    fields = [('load_peak_rss_mb', 'load peak RSS (MB)'), ('load_seconds', 'load time (s)')]
+    if with_index:
+        fields += [('index_peak_rss_mb', '+ index peak RSS (MB)'), ('index_seconds', 'index time (s)')]
+    print(f"{results['dicts']['entries']:,} entries (interpreter baseline "
+          f"{results['store']['start_rss_mb']:.1f} MB)\n")
+    print(f"  {'':24s} {'dicts':>10s} {'store':>10s} {'change':>9s}")
+    for field, label in fields:
+        before, after = results['dicts'][field], results['store'][field]
+        change = (after - before) / before * 100 if before else 0
+        print(f"  {label:24s} {before:>10,.2f} {after:>10,.2f} {change:>8.1f}%")
+
+    # Entries' own footprint: peak minus what the interpreter had before loading
+    before = results['dicts']['load_peak_rss_mb'] - results['dicts']['start_rss_mb']
+    after = results['store']['load_peak_rss_mb'] - results['store']['start_rss_mb']
+    print(f"\n📊 Padakanaja load: {before:.1f} MB -> {after:.1f} MB above baseline "
+          f"({(1 - after / before) * 100 if before else 0:.0f}% less)")
+
+    report = {'input': str(ultra_file), 'results': results}
+    if output_file:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"✓ Saved report to {output_file}")
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Peak RSS of entry dicts vs EntryStore')
+    parser.add_argument('--padakanaja', default=DEFAULT_PADAKANAJA, help='Ultra-compact Padakanaja dictionary')
+    parser.add_argument('--with-index', action='store_true', help='Also build the reverse index from the entries')
+    parser.add_argument('--output', help='Save the report as JSON')
+    parser.add_argument('--measure', choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(run_mode(args.measure, args.padakanaja, args.with_index)))
+        return
+    benchmark(args.padakanaja, args.with_index, args.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Stage-level benchmarks for the dictionary build pipeline.
+
+Runs the main stages on a fixed subset of the bundled padakanaja/ CSVs and
+records wall time, rows/sec and peak RSS for each:
+
+    parse_csv_to_yaml -> optimize_entries -> optimize_padakanaja
+        -> build_reverse_index -> split_into_chunks -> create_chunk_index
+
+Results can be saved as a baseline and later runs compared with it; a stage
+that gets slower (or uses more memory) than the threshold allows makes the
+run exit with status 1.
+
+Subsets take the CSVs in name order: small = 4 files, medium = 16, full = all.
+
+Usage:
+    python benchmark_pipeline.py [--subset small] [--repeat 3] [--save-baseline]
+    python benchmark_pipeline.py [--subset small] [--baseline FILE] [--threshold 0.25]
+"""
+
+import argparse
+import contextlib
+import csv
+import io
+import json
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.parsing.batch_parse_padakanaja import get_dictionary_title
+from scripts.parsing.create_padakanaja_reverse_index import build_reverse_index, create_chunk_index, split_into_chunks
+from scripts.parsing.csv_to_yaml_parser import parse_csv_to_yaml
+from scripts.parsing.entry_store import EntryStore
+from scripts.parsing.instrumentation import peak_rss_mb
+from scripts.parsing.optimize_dictionary_format import optimize_entries
+from scripts.parsing.optimize_padakanaja_ultra import optimize_padakanaja
+
+PADAKANAJA_DIR = Path(__file__).parent.parent.parent / 'padakanaja'
+DEFAULT_BASELINE = Path(__file__).parent / 'pipeline_baseline.json'
+
+SUBSETS = {'small': 4, 'medium': 16, 'full': None}
+
+STAGES = ('parse_csv_to_yaml', 'optimize_entries', 'optimize_padakanaja',
+          'build_reverse_index', 'split_into_chunks', 'create_chunk_index')
+
+
+def reset_peak_rss():
+    """Reset the kernel's peak-RSS mark so the next reading covers one stage (Linux only)"""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def subset_files(subset):
+    """CSV files of a benchmark subset"""
+    files = sorted(PADAKANAJA_DIR.glob('*.csv'))
+    return files[:SUBSETS[subset]] if SUBSETS[subset] else files
+
+
+def count_csv_rows(csv_files):
+    total = 0
+    for csv_file in csv_files:
+        with open(csv_file, 'r', encoding='utf-8') as f:
+            total += max(0, sum(1 for _ in csv.reader(f)) - 1)  # Minus header
+    return total
+
+
+def compact_to_entries(compact):
+    """Ultra-compact {source|dict_title: [[k, e, t?], ...]} -> reverse index input entries"""
+    return EntryStore.from_compact(compact.items())
+
+
+def measure(results, name, rows, func, *args):
+    """Run one stage quietly and record its time, throughput and peak RSS"""
+    reset_peak_rss()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        output = func(*args)
+    seconds = time.perf_counter() - start
+    peak = round(peak_rss_mb(), 1)
+
+    # Keep the fastest pass and the highest memory seen
+    previous = results.get(name)
+    if previous:
+        seconds = min(seconds, previous['seconds'])
+        peak = max(peak, previous['peak_rss_mb'])
+    results[name] = {
+        'seconds': round(seconds, 4),
+        'rows': rows,
+        'rows_per_sec': round(rows / seconds, 1) if seconds else None,
+        'peak_rss_mb': peak
+    }
+    return output
+
+
+def run_pipeline(csv_files, csv_rows, results, work_dir):
+    """One pass over all stages, each fed by the previous stage's output"""
+    def parse_all():
+        entries = []
+        for csv_file in csv_files:
+            entries.extend(parse_csv_to_yaml(str(csv_file), csv_file.stem, get_dictionary_title(csv_file.stem)))
+        return entries
+
+    yaml_entries = measure(results, 'parse_csv_to_yaml', csv_rows, parse_all)
+    optimized = measure(results, 'optimize_entries', len(yaml_entries), optimize_entries, yaml_entries)
+
+    optimized_file = work_dir / 'combined_dictionaries_part1.json'
+    with open(optimized_file, 'w', encoding='utf-8') as f:
+        json.dump(optimized, f, ensure_ascii=False, separators=(',', ':'))
+    compact = measure(results, 'optimize_padakanaja', len(yaml_entries), optimize_padakanaja,
+                      optimized_file, work_dir / 'combined_dictionaries_ultra.json')
+
+    entries = compact_to_entries(compact)
+    reverse_index = measure(results, 'build_reverse_index', len(entries), build_reverse_index, entries)
+    chunks = measure(results, 'split_into_chunks', len(reverse_index), split_into_chunks, reverse_index)
+    measure(results, 'create_chunk_index', len(reverse_index), create_chunk_index, chunks)
+
+
+def compare(results, baseline, threshold, rss_threshold, min_seconds):
+    """Regressions of results against a baseline: list of messages"""
+    regressions = []
+    print(f"\n📊 Compared with baseline ({baseline.get('created', 'unknown date')}):")
+    for name in STAGES:
+        current = results[name]
+        before = baseline['stages'].get(name)
+        if before is None:
+            print(f"  {name:22s} (no baseline)")
+            continue
+        time_change = current['seconds'] / before['seconds'] - 1 if before['seconds'] else 0.0
+        rss_change = current['peak_rss_mb'] / before['peak_rss_mb'] - 1 if before['peak_rss_mb'] else 0.0
+        slower = time_change > threshold and current['seconds'] - before['seconds'] > min_seconds
+        bigger = rss_change > rss_threshold
+        marker = '❌' if slower or bigger else '✓'
+        print(f"  {marker} {name:22s} time {time_change:+7.1%}  peak RSS {rss_change:+7.1%}")
+        if slower:
+            regressions.append(f"{name}: {before['seconds']:.3f}s -> {current['seconds']:.3f}s ({time_change:+.1%})")
+        if bigger:
+            regressions.append(f"{name}: peak RSS {before['peak_rss_mb']} -> {current['peak_rss_mb']} MB ({rss_change:+.1%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the dictionary pipeline stages')
+    parser.add_argument('--subset', choices=SUBSETS, default='small', help='Corpus subset (default: small)')
+    parser.add_argument('--repeat', type=int, default=3, help='Pipeline passes; the fastest time per stage is kept')
+    parser.add_argument('--baseline', default=str(DEFAULT_BASELINE), help='Baseline file to compare with or save to')
+    parser.add_argument('--save-baseline', action='store_true', help='Store this run as the baseline')
+    parser.add_argument('--threshold', type=float, default=0.25, help='Allowed slowdown per stage (default: 0.25 = 25%%)')
+    parser.add_argument('--rss-threshold', type=float, default=0.25, help='Allowed peak RSS growth per stage (default: 0.25)')
+    parser.add_argument('--min-seconds', type=float, default=0.05,
+                        help='Ignore slowdowns smaller than this many seconds (timer noise)')
+    parser.add_argument('--output', help='Also write the results JSON here')
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("Pipeline Stage Benchmarks")
+    print("=" * 80)
+    print()
+
+    csv_files = subset_files(args.subset)
+    csv_rows = count_csv_rows(csv_files)
+    print(f"📚 Subset '{args.subset}': {len(csv_files)} CSV files, {csv_rows:,} rows, {args.repeat} passes")
+    if not reset_peak_rss():
+        print("⚠ Cannot reset peak RSS on this platform; peak RSS is the process-wide maximum")
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for i in range(args.repeat):
+            print(f"  Pass {i + 1}/{args.repeat}...")
+            run_pipeline(csv_files, csv_rows, results, Path(tmp))
+
+    print(f"\n{'Stage':24s} {'Time (s)':>10s} {'Rows':>10s} {'Rows/sec':>12s} {'Peak RSS (MB)':>14s}")
+    for name in STAGES:
+        r = results[name]
+        print(f"{name:24s} {r['seconds']:10.3f} {r['rows']:10,d} {r['rows_per_sec']:12,.0f} {r['peak_rss_mb']:14.1f}")
+
+    report = {
+        'created': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'subset': args.subset,
+        'files': len(csv_files),
+        'repeat': args.repeat,
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'stages': results
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n✓ Saved results to {args.output}")
+
+    baseline_file = Path(args.baseline)
+    if args.save_baseline:
+        with open(baseline_file, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n✓ Saved baseline to {baseline_file}")
+        return
+
+    if not baseline_file.exists():
+        print(f"\n⚠ No baseline at {baseline_file}; run with --save-baseline to create one")
+        return
+
+    with open(baseline_file, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    if baseline.get('subset') != args.subset:
+        print(f"\n⚠ Baseline is for subset '{baseline.get('subset')}', not '{args.subset}'; skipping comparison")
+        return
+
+    regressions = compare(results, baseline, args.threshold, args.rss_threshold, args.min_seconds)
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s):")
+        for message in regressions:
+            print(f"  - {message}")
+        sys.exit(1)
+    print("\n✓ No regressions")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Load test for the search API.
+
+Replays a query corpus against an endpoint (the deployed Worker, `wrangler
+dev`, or scripts/search/search_server.py) and reports latency percentiles,
+throughput, error rate and cache-hit ratio as JSON, so chunk layouts and
+index formats can be compared on the same numbers.
+
+Corpora:
+- glossary: the words of data/glossary_words.json, in order
+- zipf: a synthetic mix drawn from the glossary words with Zipf weights,
+  so a few words repeat a lot (like real traffic)
+- <file>: a query log (one query per line, or JSON lines such as requests.jsonl)
+
+Load is either closed-loop (--concurrency workers sending back to back) or
+open-loop (--qps arrivals per second, at most --concurrency in flight).
+Open-loop latency is measured from each request's scheduled send time, so
+time spent queued behind --concurrency counts (no coordinated omission);
+the report also counts the requests that went out late.
+The cache-hit ratio comes from the X-Rala-Cache response header that the
+local server sets; it is null for endpoints that do not send it.
+
+Usage:
+    python load_test.py [--url http://127.0.0.1:8787/] [--corpus zipf] [--requests 2000]
+                        [--concurrency 16 | --qps 200] [--output report.json]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import ssl
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from urllib.parse import quote, urlsplit
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.parsing.optimize_chunk_layout import load_query_log
+
+GLOSSARY_WORDS_FILE = Path(__file__).parent.parent.parent / 'data' / 'glossary_words.json'
+CACHE_HEADER = 'x-rala-cache'
+LATE_SEND_MS = 1.0  # Open loop: a request sent later than this after its scheduled time is late
+
+
+def load_corpus(corpus, count, zipf_s=1.1, seed=42):
+    """Queries to replay, repeated or sampled up to count"""
+    if corpus in ('glossary', 'zipf'):
+        with open(GLOSSARY_WORDS_FILE, 'r', encoding='utf-8') as f:
+            words = json.load(f)
+        if corpus == 'zipf':
+            rng = random.Random(seed)
+            shuffled = words[:]
+            rng.shuffle(shuffled)  # Popularity rank independent of alphabetical order
+            weights = [1 / (rank ** zipf_s) for rank in range(1, len(shuffled) + 1)]
+            return rng.choices(shuffled, weights=weights, k=count)
+        queries = words
+    else:
+        queries = [q for q in load_query_log(corpus) if q.strip()]
+
+    if not queries:
+        raise ValueError(f"Corpus {corpus} has no queries")
+    return [queries[i % len(queries)] for i in range(count)]
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+class HttpConnection:
+    """Minimal keep-alive HTTP/1.1 client connection (Content-Length and chunked bodies)"""
+
+    def __init__(self, url):
+        parts = urlsplit(url)
+        self.host = parts.hostname
+        self.https = parts.scheme == 'https'
+        self.port = parts.port or (443 if self.https else 80)
+        self.path = parts.path or '/'
+        self.reader = None
+        self.writer = None
+
+    async def connect(self):
+        ssl_context = ssl.create_default_context() if self.https else None
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port, ssl=ssl_context)
+
+    def close(self):
+        if self.writer:
+            self.writer.close()
+            self.writer = None
+
+    async def get(self, query):
+        """GET ?q=query; returns (status, headers, body bytes)"""
+        if self.writer is None:
+            await self.connect()
+        request = (f'GET {self.path}?q={quote(query)} HTTP/1.1\r\n'
+                   f'Host: {self.host}\r\nUser-Agent: rala-load-test\r\nAccept: application/json\r\n\r\n')
+        self.writer.write(request.encode('ascii'))
+        await self.writer.drain()
+
+        head = await self.reader.readuntil(b'\r\n\r\n')
+        lines = head.decode('latin-1').split('\r\n')
+        status = int(lines[0].split(' ', 2)[1])
+        headers = {}
+        for line in lines[1:]:
+            if ':' in line:
+                name, value = line.split(':', 1)
+                headers[name.strip().lower()] = value.strip()
+
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            body = bytearray()
+            while True:
+                size = int((await self.reader.readuntil(b'\r\n')).split(b';')[0], 16)
+                if size == 0:
+                    await self.reader.readuntil(b'\r\n')
+                    break
+                body += await self.reader.readexactly(size)
+                await self.reader.readexactly(2)
+            body = bytes(body)
+        else:
+            body = await self.reader.readexactly(int(headers.get('content-length') or 0))
+
+        if headers.get('connection', '').lower() == 'close':
+            self.close()
+        return status, headers, body
+
+
+class LoadTest:
+    """Replays queries and collects per-request measurements"""
+
+    def __init__(self, url, queries, concurrency=16, qps=None, timeout=30):
+        self.url = url
+        self.queries = queries
+        self.concurrency = concurrency
+        self.qps = qps
+        self.timeout = timeout
+        self.latencies_ms = []
+        self.statuses = Counter()
+        self.errors = Counter()
+        self.cache = Counter()
+        self.late = 0
+        self.max_send_delay_ms = 0.0
+        self._pool = []
+
+    async def _request(self, query, scheduled=None):
+        """Send one query; latency counts from scheduled (open loop) or from now"""
+        connection = self._pool.pop() if self._pool else HttpConnection(self.url)
+        start = time.perf_counter()
+        if scheduled is not None:
+            send_delay_ms = (start - scheduled) * 1000
+            if send_delay_ms > LATE_SEND_MS:
+                self.late += 1
+            self.max_send_delay_ms = max(self.max_send_delay_ms, send_delay_ms)
+            start = scheduled
+        try:
+            status, headers, body = await asyncio.wait_for(connection.get(query), self.timeout)
+            if status == 200:
+                json.loads(body)
+        except Exception as error:
+            connection.close()
+            self.errors[type(error).__name__] += 1
+            return
+        self.latencies_ms.append((time.perf_counter() - start) * 1000)
+        self.statuses[status] += 1
+        if status != 200:
+            self.errors[f'HTTP {status}'] += 1
+        if CACHE_HEADER in headers:
+            self.cache[headers[CACHE_HEADER].upper()] += 1
+        self._pool.append(connection)
+
+    async def _closed_loop(self):
+        pending = iter(self.queries)
+
+        async def worker():
+            for query in pending:
+                await self._request(query)
+
+        await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+
+    async def _open_loop(self):
+        in_flight = asyncio.Semaphore(self.concurrency)
+        tasks = []
+        start = time.perf_counter()
+
+        async def send(query, scheduled):
+            async with in_flight:
+                await self._request(query, scheduled)
+
+        for i, query in enumerate(self.queries):
+            scheduled = start + i / self.qps
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.ensure_future(send(query, scheduled)))
+        await asyncio.gather(*tasks)
+
+    async def run(self):
+        start = time.perf_counter()
+        if self.qps:
+            await self._open_loop()
+        else:
+            await self._closed_loop()
+        duration = time.perf_counter() - start
+        for connection in self._pool:
+            connection.close()
+        return duration
+
+    def report(self, duration, corpus):
+        latencies = sorted(self.latencies_ms)
+        total = len(self.queries)
+        error_count = sum(self.errors.values())
+        cache_total = self.cache['HIT'] + self.cache['MISS']
+        return {
+            'url': self.url,
+            'corpus': corpus,
+            'mode': 'open-loop' if self.qps else 'closed-loop',
+            'concurrency': self.concurrency,
+            'target_qps': self.qps,
+            'requests': total,
+            'completed': len(latencies),
+            'errors': error_count,
+            'error_rate': round(error_count / total, 4) if total else 0.0,
+            'error_kinds': dict(self.errors),
+            'status_counts': {str(k): v for k, v in sorted(self.statuses.items())},
+            'duration_s': round(duration, 3),
+            'throughput_rps': round(len(latencies) / duration, 1) if duration else 0.0,
+            'latency_ms': {
+                'min': round(latencies[0], 2) if latencies else None,
+                'mean': round(sum(latencies) / len(latencies), 2) if latencies else None,
+                'p50': round(percentile(latencies, 0.50), 2) if latencies else None,
+                'p95': round(percentile(latencies, 0.95), 2) if latencies else None,
+                'p99': round(percentile(latencies, 0.99), 2) if latencies else None,
+                'max': round(latencies[-1], 2) if latencies else None
+            },
+            'late_requests': self.late if self.qps else None,
+            'max_send_delay_ms': round(self.max_send_delay_ms, 2) if self.qps else None,
+            'cache': {
+                'hits': self.cache['HIT'],
+                'misses': self.cache['MISS'],
+                'hit_ratio': round(self.cache['HIT'] / cache_total, 4) if cache_total else None
+            }
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test the search API')
+    parser.add_argument('--url', default='http://127.0.0.1:8787/', help='Search endpoint (default: local search_server.py)')
+    parser.add_argument('--corpus', default='zipf', help="'glossary', 'zipf' or a query log file (default: zipf)")
+    parser.add_argument('--requests', type=int, default=2000, help='Requests to send (default: 2000)')
+    parser.add_argument('--warmup', type=int, default=0, help='Requests sent first and left out of the report')
+    parser.add_argument('--concurrency', type=int, default=16, help='Workers, or max in flight with --qps (default: 16)')
+    parser.add_argument('--qps', type=float, help='Open-loop arrival rate instead of closed-loop workers')
+    parser.add_argument('--zipf-s', type=float, default=1.1, help='Zipf exponent of the synthetic mix (default: 1.1)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--timeout', type=float, default=30, help='Per-request timeout in seconds')
+    parser.add_argument('--output', help='Write the JSON report to this file')
+    args = parser.parse_args()
+
+    queries = load_corpus(args.corpus, args.warmup + args.requests, args.zipf_s, args.seed)
+
+    if args.warmup:
+        print(f"🔥 Warming up with {args.warmup:,} requests...", file=sys.stderr)
+        asyncio.run(LoadTest(args.url, queries[:args.warmup], args.concurrency, None, args.timeout).run())
+
+    mode = f"{args.qps:g} QPS" if args.qps else f"concurrency {args.concurrency}"
+    print(f"🚀 {args.requests:,} requests to {args.url} ({args.corpus} corpus, {mode})...", file=sys.stderr)
+    load_test = LoadTest(args.url, queries[args.warmup:], args.concurrency, args.qps, args.timeout)
+    duration = asyncio.run(load_test.run())
+    report = load_test.report(duration, args.corpus)
+
+    latency = report['latency_ms']
+    print(f"✓ {report['throughput_rps']} req/s, p50 {latency['p50']} ms, p95 {latency['p95']} ms, "
+          f"p99 {latency['p99']} ms, error rate {report['error_rate']:.2%}", file=sys.stderr)
+    if args.qps:
+        print(f"  {report['late_requests']:,} requests sent late (max {report['max_send_delay_ms']} ms "
+              f"after their scheduled time)", file=sys.stderr)
+
+    report_json = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(report_json + '\n')
+        print(f"✓ Saved report to {args.output}", file=sys.stderr)
+    else:
+        print(report_json)
+
+
+if __name__ == '__main__':
+    main()
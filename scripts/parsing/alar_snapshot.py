@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Local snapshot of the Alar dictionary.
+
+alar.yml is ~156k entries; downloading and parsing it takes
+longer than most of the stages that use it. It is ingested once into a
+snapshot keyed by the SHA-256 of the YAML content:
+
+    .rala_build/alar/alar.yml                 last downloaded copy
+    .rala_build/alar/alar-<sha256[:16]>.pickle  parsed entries (same list as yaml.safe_load)
+    .rala_build/alar/alar_snapshot.json       which snapshot is current (hash, source, entry count)
+
+Every Alar stage reads the current snapshot with load_alar_entries(). Only
+when there is no snapshot yet is alar.yml downloaded and ingested. Offline
+mode (--offline on the stage scripts, or RALA_OFFLINE=1) never touches the
+network and fails if no snapshot exists. Ingesting the same content again
+reuses the existing snapshot, so the pointer file only changes when Alar
+does.
+
+Usage:
+    python alar_snapshot.py ingest [alar.yml | URL]   # default: download from GitHub
+    python alar_snapshot.py info
+"""
+
+import argparse
+import gc
+import hashlib
+import json
+import os
+import pickle
+import sys
+import time
+from pathlib import Path
+from urllib.request import urlopen
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.parsing.instrumentation import instrument, phase
+from scripts.parsing.yaml_stream import iter_yaml_entries
+
+ALAR_URL = 'https://raw.githubusercontent.com/alar-dict/data/master/alar.yml'
+SNAPSHOT_DIR = Path(__file__).resolve().parent.parent.parent / '.rala_build' / 'alar'
+POINTER_FILE = 'alar_snapshot.json'
+OFFLINE_ENV = 'RALA_OFFLINE'
+
+# Values up to this length (types, heads) repeat across entries; see share_strings()
+SHARED_STRING_LENGTH = 16
+
+
+class SnapshotMissing(RuntimeError):
+    """No Alar snapshot exists and the network may not be used"""
+
+
+def is_offline(offline=None):
+    """Explicit flag if given, otherwise RALA_OFFLINE"""
+    if offline is not None:
+        return offline
+    return os.environ.get(OFFLINE_ENV, '').lower() in ('1', 'true', 'yes')
+
+
+def is_url(source):
+    return '://' in str(source)
+
+
+def read_pointer(snapshot_dir=SNAPSHOT_DIR):
+    pointer_file = Path(snapshot_dir) / POINTER_FILE
+    if not pointer_file.exists():
+        return None
+    with open(pointer_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def share_strings(value):
+    """Same structure with keys and short strings interned.
+
+    Pickle memoises repeated objects, so every interned string is stored once
+    and loaded once; this cuts snapshot size and load time by about a third.
+    """
+    if isinstance(value, dict):
+        return {sys.intern(k) if isinstance(k, str) else k: share_strings(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [share_strings(v) for v in value]
+    if isinstance(value, str) and len(value) <= SHARED_STRING_LENGTH:
+        return sys.intern(value)
+    return value
+
+
+def read_snapshot(snapshot_file):
+    """Unpickle a snapshot with the cyclic GC paused (it would rescan the growing list repeatedly)"""
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        with open(snapshot_file, 'rb') as f:
+            return pickle.load(f)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def ingest(source=ALAR_URL, snapshot_dir=SNAPSHOT_DIR, offline=None):
+    """Snapshot alar.yml from a local file or URL; returns the pointer record"""
+    snapshot_dir = Path(snapshot_dir)
+    snapshot_dir.mkdir(parents=True, exist_ok=True)
+
+    if is_url(source):
+        if is_offline(offline):
+            raise SnapshotMissing(f"Offline: not downloading {source}")
+        print(f"Downloading Alar dictionary from: {source}")
+        with urlopen(source) as response, phase('download_alar'):
+            content = response.read()
+        (snapshot_dir / 'alar.yml').write_bytes(content)
+    else:
+        print(f"Reading Alar dictionary from: {source}")
+        content = Path(source).read_bytes()
+
+    sha256 = hashlib.sha256(content).hexdigest()
+    snapshot_file = snapshot_dir / f'alar-{sha256[:16]}.pickle'
+    current = read_pointer(snapshot_dir)
+    if current and current['sha256'] == sha256 and snapshot_file.exists():
+        print(f"✓ Snapshot {snapshot_file.name} is current ({current['entries']:,} entries)")
+        return current
+
+    if snapshot_file.exists():
+        entry_count = len(read_snapshot(snapshot_file))
+    else:
+        with phase('parse_alar_yaml', bytes=len(content)):
+            entries = list(iter_yaml_entries(content))
+        if not entries or not isinstance(entries, list):
+            raise ValueError(f"Invalid Alar dictionary format in {source}")
+        entry_count = len(entries)
+        tmp_file = snapshot_file.with_suffix('.tmp')
+        with open(tmp_file, 'wb') as f, phase('write_alar_snapshot'):
+            pickle.dump(share_strings(entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, snapshot_file)
+
+    pointer = {
+        'sha256': sha256,
+        'snapshot': snapshot_file.name,
+        'source': str(source),
+        'entries': entry_count,
+        'yaml_bytes': len(content),
+        'ingested_at': time.strftime('%Y-%m-%dT%H:%M:%S')
+    }
+    with open(snapshot_dir / POINTER_FILE, 'w', encoding='utf-8') as f:
+        json.dump(pointer, f, ensure_ascii=False, indent=2)
+
+    # Earlier snapshots are never read again
+    for old_file in snapshot_dir.glob('alar-*.pickle'):
+        if old_file != snapshot_file:
+            old_file.unlink()
+
+    print(f"✓ Snapshot {snapshot_file.name}: {entry_count:,} entries "
+          f"({snapshot_file.stat().st_size / 1024 / 1024:.1f} MB)")
+    return pointer
+
+
+def load_alar_entries(source=ALAR_URL, snapshot_dir=SNAPSHOT_DIR, offline=None):
+    """Alar entries from the current snapshot, ingesting source first if there is none.
+
+    A local file given as source is always (re)ingested; that only parses the
+    YAML when its content differs from the current snapshot.
+    """
+    snapshot_dir = Path(snapshot_dir)
+    pointer = read_pointer(snapshot_dir)
+    if not is_url(source) or pointer is None or not (snapshot_dir / pointer['snapshot']).exists():
+        if is_url(source) and is_offline(offline):
+            raise SnapshotMissing(f"No Alar snapshot in {snapshot_dir}; run "
+                                  "`python scripts/parsing/alar_snapshot.py ingest [alar.yml]` first")
+        pointer = ingest(source, snapshot_dir, offline)
+
+    with phase('load_alar_snapshot'):
+        entries = read_snapshot(snapshot_dir / pointer['snapshot'])
+    print(f"✓ Loaded {len(entries):,} Alar entries from snapshot {pointer['sha256'][:16]}")
+    return entries
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Cached local snapshot of the Alar dictionary')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    ingest_parser = subparsers.add_parser('ingest', help='Snapshot alar.yml (local file or URL)')
+    ingest_parser.add_argument('source', nargs='?', default=ALAR_URL,
+                               help='Local alar.yml or URL (default: GitHub)')
+    ingest_parser.add_argument('--snapshot-dir', default=SNAPSHOT_DIR, help='Snapshot directory')
+    ingest_parser.add_argument('--offline', action='store_true', default=None,
+                               help='Fail instead of downloading')
+
+    info_parser = subparsers.add_parser('info', help='Show the current snapshot and time loading it')
+    info_parser.add_argument('--snapshot-dir', default=SNAPSHOT_DIR, help='Snapshot directory')
+
+    args = parser.parse_args()
+
+    try:
+        if args.command == 'ingest':
+            ingest(args.source, args.snapshot_dir, args.offline)
+            return
+
+        pointer = read_pointer(args.snapshot_dir)
+        if pointer is None:
+            raise SnapshotMissing(f"No Alar snapshot in {args.snapshot_dir}")
+        print(json.dumps(pointer, ensure_ascii=False, indent=2))
+        start = time.perf_counter()
+        load_alar_entries(snapshot_dir=args.snapshot_dir, offline=True)
+        print(f"  Loaded in {(time.perf_counter() - start) * 1000:.0f} ms")
+    except SnapshotMissing as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    with instrument('alar_snapshot'):
+        main()
@@ -15,6 +15,11 @@ sys.path.insert(0, str(Path(__file__).parent))
 from csv_to_yaml_parser import parse_csv_to_yaml, save_yaml
 from collections import defaultdict
 
+# Add project root to path for shared helpers
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.parsing.instrumentation import instrument, phase
+
 
 def get_dictionary_title_mapping():
     """Get mapping of filenames to correct dictionary titles (fixing typos)."""
@@ -344,14 +349,17 @@ def analyze_csv_metadata(csv_file_path):
     return metadata
 
 
-def process_all_csv_files(padakanaja_dir='padakanaja'):
-    """Process all CSV files in padakanaja directory."""
+def process_all_csv_files(padakanaja_dir='padakanaja', only=None):
+    """Process all CSV files in padakanaja directory (or only the named ones)."""
     padakanaja_path = Path(padakanaja_dir)
     if not padakanaja_path.exists():
         print(f"Error: Directory {padakanaja_dir} not found")
         return
     
     csv_files = sorted(padakanaja_path.glob('*.csv'))
+    if only:
+        names = {Path(name).name for name in only}
+        csv_files = [f for f in csv_files if f.name in names]
     print(f"Found {len(csv_files)} CSV files to process\n")
     
     all_metadata = []
@@ -374,11 +382,13 @@ def process_all_csv_files(padakanaja_dir='padakanaja'):
         yaml_file = csv_file.with_suffix('.yml')
         try:
             dict_title = metadata.get('dict_title')
-            entries = parse_csv_to_yaml(str(csv_file), metadata['source_name'], dict_title)
+            with phase('parse_csv_to_yaml', file=csv_file.name):
+                entries = parse_csv_to_yaml(str(csv_file), metadata['source_name'], dict_title)
             metadata['entry_count'] = len(entries)
             
             # Save YAML (will overwrite existing)
-            save_yaml(entries, str(yaml_file))
+            with phase('save_yaml', file=yaml_file.name, entries=len(entries)):
+                save_yaml(entries, str(yaml_file))
             metadata['yaml_file'] = yaml_file.name
             
             if yaml_file.exists():
@@ -397,13 +407,19 @@ def process_all_csv_files(padakanaja_dir='padakanaja'):
 
 def main():
     """Main function."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Parse padakanaja/ CSV files into YAML dictionaries')
+    parser.add_argument('csv_files', nargs='*', help='Only parse these CSV files (default: all)')
+    args = parser.parse_args()
+    
     print("=" * 80)
     print("Batch Processing Padakanaja Dictionaries")
     print("=" * 80)
     print()
     
     # Process all CSV files
-    metadata_list = process_all_csv_files('padakanaja')
+    metadata_list = process_all_csv_files('padakanaja', only=args.csv_files)
     
     # Generate summary
     if metadata_list:
@@ -414,5 +430,5 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
-
+    with instrument('batch_parse_padakanaja'):
+        main()
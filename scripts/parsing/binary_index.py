@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Memory-mappable binary format for the reverse index.
+
+JSON chunks have to be parsed completely before the first lookup. The binary
+file can be opened with mmap and binary-searched in place, so a lookup only
+touches the pages it reads:
+
+    header       magic, version, counts and section offsets
+    schema       JSON list of posting field names
+    term table   term_count x (term_ref u32, first_posting u32, posting_count u32),
+                 sorted by the UTF-8 bytes of the term
+    postings     posting_count x (field_count x string_ref u32, score i64)
+    string refs  (string_count + 1) x u32 offsets into the heap
+    heap         interned UTF-8 strings (terms and posting values)
+
+A string_ref of 0xFFFFFFFF marks a field the posting does not have. List
+fields (LIST_FIELDS: the "also" dictionaries of a collapsed near-duplicate)
+are stored as one newline-joined string.
+
+Usage:
+    python binary_index.py build [--index-dir padakanaja] [--output FILE]
+    python binary_index.py lookup <word> [<word> ...] [--index FILE]
+"""
+
+import argparse
+import json
+import mmap
+import struct
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.parsing.export_kv_bulk import load_reverse_index_chunks
+from scripts.parsing.instrumentation import instrument, peak_rss_mb
+
+MAGIC = b'RALABIN1'
+FORMAT_VERSION = 1
+
+# magic, version, field_count, term_count, posting_count, string_count,
+# schema_offset, schema_size, terms_offset, postings_offset, string_refs_offset, heap_offset
+HEADER = struct.Struct('<8sHHIIIIQQQQQ')
+TERM_ENTRY = struct.Struct('<III')
+STRING_REF = struct.Struct('<I')
+SCORE = struct.Struct('<q')
+
+MISSING = 0xFFFFFFFF
+
+DEFAULT_FIELDS = ('kannada', 'english', 'type', 'source', 'dict_title', 'id')
+LIST_FIELDS = ('also',)
+
+BINARY_INDEX_NAME = 'padakanaja_reverse_index.rbin'
+
+
+def load_full_reverse_index(index_dir):
+    """Load the chunks and re-attach overflow pages so every posting list is complete"""
+    index_path = Path(index_dir)
+    reverse_index = load_reverse_index_chunks(index_path)
+
+    overflow_index_file = index_path / 'padakanaja_reverse_index_overflow_index.json'
+    overflow_dir = index_path / 'padakanaja_reverse_index_overflow'
+    if overflow_index_file.exists():
+        with open(overflow_index_file, 'r', encoding='utf-8') as f:
+            overflow_index = json.load(f)
+        for word, stats in overflow_index.items():
+            for page_num in range(1, stats['pages'] + 1):
+                page_file = overflow_dir / f'padakanaja_reverse_index_overflow_{word}_{page_num}.json'
+                with open(page_file, 'r', encoding='utf-8') as f:
+                    reverse_index.setdefault(word, []).extend(json.load(f))
+        print(f"✓ Re-attached overflow pages for {len(overflow_index):,} words")
+    return reverse_index
+
+
+def write_binary_index(reverse_index, output_file, fields=None):
+    """Write {word: [posting, ...]} to a binary index file"""
+    if fields is None:
+        seen = set()
+        for postings in reverse_index.values():
+            for posting in postings:
+                seen.update(posting)
+        seen.discard('score')
+        fields = [f for f in DEFAULT_FIELDS if f in seen] + sorted(seen - set(DEFAULT_FIELDS))
+    fields = list(fields)
+
+    strings = []
+    string_ids = {}
+
+    def intern(value):
+        if value not in string_ids:
+            string_ids[value] = len(strings)
+            strings.append(value)
+        return string_ids[value]
+
+    terms = sorted(reverse_index, key=lambda w: w.encode('utf-8'))
+    posting_struct = struct.Struct('<' + 'I' * len(fields) + 'q')
+
+    term_table = bytearray()
+    postings_region = bytearray()
+    posting_count = 0
+    for term in terms:
+        postings = reverse_index[term]
+        term_table += TERM_ENTRY.pack(intern(term), posting_count, len(postings))
+        for posting in postings:
+            refs = [MISSING if f not in posting or posting[f] is None
+                    else intern('\n'.join(posting[f])) if f in LIST_FIELDS else intern(str(posting[f]))
+                    for f in fields]
+            postings_region += posting_struct.pack(*refs, int(posting.get('score', 0)))
+        posting_count += len(postings)
+
+    heap = bytearray()
+    string_refs = bytearray()
+    for value in strings:
+        string_refs += STRING_REF.pack(len(heap))
+        heap += value.encode('utf-8')
+    string_refs += STRING_REF.pack(len(heap))
+
+    schema = json.dumps(fields).encode('utf-8')
+    schema_offset = HEADER.size
+    terms_offset = schema_offset + len(schema)
+    postings_offset = terms_offset + len(term_table)
+    string_refs_offset = postings_offset + len(postings_region)
+    heap_offset = string_refs_offset + len(string_refs)
+
+    with open(output_file, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(fields), len(terms), posting_count, len(strings),
+                            schema_offset, len(schema), terms_offset, postings_offset,
+                            string_refs_offset, heap_offset))
+        f.write(schema)
+        f.write(term_table)
+        f.write(postings_region)
+        f.write(string_refs)
+        f.write(heap)
+
+    return {
+        'terms': len(terms),
+        'postings': posting_count,
+        'strings': len(strings),
+        'bytes': heap_offset + len(heap)
+    }
+
+
+class IndexReader:
+    """Read-only view of a binary index file through mmap.
+
+    Nothing is deserialised up front: lookups binary-search the term table and
+    decode only the postings they return.
+
+        with IndexReader('padakanaja/padakanaja_reverse_index.rbin') as index:
+            postings = index.lookup('house')
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._file = open(self.path, 'rb')
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (magic, version, self.field_count, self.term_count, self.posting_count, self.string_count,
+         schema_offset, schema_size, self._terms_offset, self._postings_offset,
+         self._string_refs_offset, self._heap_offset) = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{self.path} is not a rala binary index")
+        if version != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"Unsupported binary index version: {version}")
+
+        self.fields = json.loads(self._mm[schema_offset:schema_offset + schema_size])
+        self._posting = struct.Struct('<' + 'I' * self.field_count + 'q')
+
+    def close(self):
+        self._mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.term_count
+
+    def __contains__(self, term):
+        return self._find(term) is not None
+
+    def _string_bytes(self, ref):
+        start, end = struct.unpack_from('<II', self._mm, self._string_refs_offset + ref * STRING_REF.size)
+        return self._mm[self._heap_offset + start:self._heap_offset + end]
+
+    def _string(self, ref):
+        return self._string_bytes(ref).decode('utf-8')
+
+    def _term_entry(self, i):
+        return TERM_ENTRY.unpack_from(self._mm, self._terms_offset + i * TERM_ENTRY.size)
+
+    def _lower_bound(self, key):
+        """First term-table position whose term is >= key (UTF-8 byte order)"""
+        lo, hi = 0, self.term_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._string_bytes(self._term_entry(mid)[0]) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _find(self, term):
+        key = term.encode('utf-8')
+        i = self._lower_bound(key)
+        if i < self.term_count:
+            entry = self._term_entry(i)
+            if self._string_bytes(entry[0]) == key:
+                return entry
+        return None
+
+    def _decode_posting(self, index):
+        values = self._posting.unpack_from(self._mm, self._postings_offset + index * self._posting.size)
+        posting = {}
+        for field, ref in zip(self.fields, values):
+            if ref != MISSING:
+                value = self._string(ref)
+                posting[field] = value.split('\n') if field in LIST_FIELDS else value
+        posting['score'] = values[-1]
+        return posting
+
+    def posting_count_for(self, term):
+        """Number of postings for a term without decoding them"""
+        entry = self._find(term)
+        return entry[2] if entry else 0
+
+    def lookup(self, term, limit=None, offset=0):
+        """Postings for a term (best first), optionally one page of them"""
+        entry = self._find(term)
+        if entry is None:
+            return []
+        _, first, count = entry
+        end = count if limit is None else min(count, offset + limit)
+        return [self._decode_posting(first + i) for i in range(offset, end)]
+
+    def iter_terms(self, prefix=''):
+        """Terms in byte order, optionally only those starting with prefix"""
+        key = prefix.encode('utf-8')
+        for i in range(self._lower_bound(key), self.term_count):
+            term = self._string_bytes(self._term_entry(i)[0])
+            if not term.startswith(key):
+                break
+            yield term.decode('utf-8')
+
+
+def build(index_dir='padakanaja', output_file=None):
+    """Convert the built chunks (JSON or compact) of index_dir into one binary index file"""
+    print("=" * 80)
+    print("Building Binary Reverse Index")
+    print("=" * 80)
+    print()
+
+    output_path = Path(output_file) if output_file else Path(index_dir) / BINARY_INDEX_NAME
+    reverse_index = load_full_reverse_index(index_dir)
+    print(f"💾 Writing {output_path}...")
+    stats = write_binary_index(reverse_index, output_path)
+    print(f"✓ {stats['terms']:,} terms, {stats['postings']:,} postings, {stats['strings']:,} interned strings "
+          f"({stats['bytes'] / 1024 / 1024:.2f} MB)")
+    return stats
+
+
+def lookup(index_file, words, limit=10):
+    """Time lookups against a binary index and report resident memory"""
+    start = time.perf_counter()
+    with IndexReader(index_file) as index:
+        open_ms = (time.perf_counter() - start) * 1000
+        print(f"✓ Opened {index_file} ({len(index):,} terms) in {open_ms:.2f} ms")
+        for word in words:
+            start = time.perf_counter()
+            postings = index.lookup(word, limit=limit)
+            lookup_ms = (time.perf_counter() - start) * 1000
+            print(f"\n🔍 {word}: {index.posting_count_for(word):,} postings ({lookup_ms:.2f} ms for {len(postings)})")
+            for posting in postings:
+                print(f"  {posting.get('kannada', '')} — {posting.get('english', '')}")
+    print(f"\n📊 Peak RSS: {peak_rss_mb():.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Memory-mappable binary reverse index')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = subparsers.add_parser('build', help='Build the binary index from the reverse index chunks')
+    build_parser.add_argument('--index-dir', default='padakanaja', help='Directory with built reverse index chunks')
+    build_parser.add_argument('--output', help=f'Output file (default: <index-dir>/{BINARY_INDEX_NAME})')
+
+    lookup_parser = subparsers.add_parser('lookup', help='Look up words in a binary index')
+    lookup_parser.add_argument('words', nargs='+')
+    lookup_parser.add_argument('--index', default=f'padakanaja/{BINARY_INDEX_NAME}', help='Binary index file')
+    lookup_parser.add_argument('--limit', type=int, default=10, help='Postings to print per word')
+
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        build(args.index_dir, args.output)
+    else:
+        lookup(args.index, args.words, args.limit)
+
+
+if __name__ == '__main__':
+    with instrument('binary_index'):
+        main()
@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+Compact Alar search index for the web client.
+
+The client builds its Alar reverse index (English word -> postings) at
+startup from the downloaded entries. generate_alar_reverse_index.py
+writes the same index as indent=2 JSON with a full entry object per word, which is larger
+than the dictionary itself. This target writes one binary file the client
+keeps as an ArrayBuffer (and caches in IndexedDB) and reads through typed
+arrays, without building anything:
+
+    preamble            magic, version, header size, content hash (struct '<8sII16s')
+    header              JSON: sorted term list, types, entry ids, section offsets;
+                        padded with spaces to a multiple of 4 bytes
+    term_offsets        Uint32 x (terms + 1)    term i's postings are postings[term_offsets[i]:term_offsets[i + 1]]
+    postings            Uint32 x postings       record numbers, in dictionary order
+    record_entry        Uint32 x records        entry of each record
+    record_definition   Uint32 x records        string ref of each record's definition
+    entry_strings       Uint32 x (entries x 3)  string refs of kannada, phone, head (0xFFFFFFFF: none)
+    string_offsets      Uint32 x (strings + 1)  UTF-16 offsets of each string in the heap
+    record_type         Uint16 x records        index into the header's types
+    heap                UTF-8 text of all strings, each stored once
+
+A record is one definition of one entry; a posting of word w for record r is
+what the client's buildReverseIndex() pushes for w, with the same words
+(extractWords), cleaned Kannada (cleanKannadaEntry) and type (normalizeType),
+so searches give the same results from either. Opening the index only parses
+the term list; the heap is decoded once, on the first lookup.
+
+The content hash (sha256 of everything after the preamble, 16 hex digits)
+is also listed in build_manifest.json, so a client with a cached copy can
+tell from the preamble alone whether it is current.
+
+Usage:
+    python build_alar_client_index.py build [--output padakanaja/alar_client_index.bin] [--offline]
+    python build_alar_client_index.py lookup house [word ...] [--index FILE]
+"""
+
+import argparse
+import array
+import gzip
+import hashlib
+import json
+import re
+import struct
+import sys
+import time
+from functools import lru_cache
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.parsing.alar_snapshot import ALAR_URL, SnapshotMissing, load_alar_entries
+from scripts.parsing.instrumentation import instrument, phase
+from scripts.parsing.kannada_text import clean_kannada_display
+
+MAGIC = b'RALAIDX1'
+FORMAT_VERSION = 2
+PREAMBLE = struct.Struct('<8sII16s')  # magic, version, header size, content hash
+DEFAULT_OUTPUT = 'padakanaja/alar_client_index.bin'
+DICT_TITLE = "V. Krishna's Alar"
+SOURCE = 'alar'
+MISSING = 0xFFFFFFFF  # string ref of a value the entry does not have
+
+# extractWords() in js/dictionary.js (not the stop list of generate_reverse_index.py)
+CLIENT_STOP_WORDS = frozenset([
+    'a', 'an', 'the', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
+    'should', 'may', 'might', 'must', 'shall', 'can', 'need', 'dare',
+    'to', 'of', 'in', 'for', 'on', 'with', 'at', 'by', 'from', 'up',
+    'about', 'into', 'over', 'after', 'or', 'and', 'but', 'if', 'as',
+    'etc', 'eg', 'ie', 'cf', 'vs', 'fig', 'esp', 'also', 'see'
+])
+NON_WORD_RE = re.compile(r'[^A-Za-z0-9_\s-]')  # JS [^\w\s-]: \w is ASCII, \s is Unicode
+
+# normalizeType() in js/dictionary.js
+CLIENT_TYPES = {
+    'n': 'Noun', 'v': 'Verb', 'adj': 'Adjective', 'adv': 'Adverb', 'pron': 'Pronoun',
+    'prep': 'Preposition', 'conj': 'Conjunction', 'interj': 'Interjection',
+    'noun': 'Noun', 'verb': 'Verb', 'adjective': 'Adjective', 'adverb': 'Adverb',
+    'pronoun': 'Pronoun', 'preposition': 'Preposition', 'conjunction': 'Conjunction',
+    'interjection': 'Interjection'
+}
+
+
+def client_words(definition):
+    """extractWords(definition.toLowerCase()) of the client, duplicates kept"""
+    return [word for word in NON_WORD_RE.sub(' ', definition.lower()).split()
+            if len(word) > 2 and word not in CLIENT_STOP_WORDS and not word.isdigit()]
+
+
+@lru_cache(maxsize=1024)
+def client_type(type_str):
+    """normalizeType() of the client"""
+    if not type_str:
+        return 'Noun'
+    type_str = str(type_str)
+    return CLIENT_TYPES.get(type_str.lower().strip()) or type_str[:1].upper() + type_str[1:].lower()
+
+
+def build_client_index(entries):
+    """Terms, entry table, records and postings of the client index"""
+    strings = []
+    string_refs = {}
+
+    def string_ref(value):
+        if value is None:
+            return MISSING
+        value = str(value)
+        ref = string_refs.get(value)
+        if ref is None:
+            ref = string_refs[value] = len(strings)
+            strings.append(value)
+        return ref
+
+    ids = []
+    entry_strings = array.array('I')  # kannada, phone, head of each entry
+    record_entry = array.array('I')
+    record_definition = array.array('I')
+    record_type = array.array('H')
+    types = []
+    type_codes = {}
+    postings_by_word = {}
+
+    for entry in entries:
+        defs = entry.get('defs')
+        if not defs:
+            continue
+        entry_row = None
+        for def_entry in defs:
+            definition = def_entry.get('entry') if isinstance(def_entry, dict) else None
+            if not definition:
+                continue
+            definition = str(definition)
+            words = client_words(definition)
+            if not words:
+                continue
+            if entry_row is None:
+                entry_row = len(ids)
+                ids.append(entry.get('id'))
+                entry_strings.extend((string_ref(clean_kannada_display(str(entry.get('entry') or ''))),
+                                      string_ref(entry.get('phone')), string_ref(entry.get('head'))))
+            type_str = client_type(def_entry.get('type'))
+            code = type_codes.get(type_str)
+            if code is None:
+                code = type_codes[type_str] = len(types)
+                types.append(type_str)
+
+            record = len(record_entry)
+            record_entry.append(entry_row)
+            record_definition.append(string_ref(definition))
+            record_type.append(code)
+            for word in words:
+                postings_by_word.setdefault(word, []).append(record)
+
+    terms = sorted(postings_by_word)
+    term_offsets = array.array('I', [0])
+    postings = array.array('I')
+    for term in terms:
+        postings.extend(postings_by_word[term])
+        term_offsets.append(len(postings))
+
+    # Offsets in UTF-16 code units: the client decodes the heap once and slices the string
+    string_offsets = array.array('I', [0])
+    for value in strings:
+        string_offsets.append(string_offsets[-1] + len(value.encode('utf-16-le')) // 2)
+
+    return {
+        'terms': terms,
+        'types': types,
+        'ids': ids,
+        'term_offsets': term_offsets,
+        'postings': postings,
+        'record_entry': record_entry,
+        'record_definition': record_definition,
+        'entry_strings': entry_strings,
+        'string_offsets': string_offsets,
+        'record_type': record_type,
+        'heap': ''.join(strings).encode('utf-8')
+    }
+
+
+# Section name -> array typecode (None: raw bytes); Uint32 sections first keeps them aligned
+SECTIONS = {
+    'term_offsets': 'I',
+    'postings': 'I',
+    'record_entry': 'I',
+    'record_definition': 'I',
+    'entry_strings': 'I',
+    'string_offsets': 'I',
+    'record_type': 'H',
+    'heap': None
+}
+
+
+def encode_client_index(index):
+    """Bytes of the index file (little-endian sections after the JSON header)"""
+    sections = {}
+    blobs = []
+    offset = 0
+    for name, typecode in SECTIONS.items():
+        values = index[name]
+        if typecode is None:
+            blob = values
+        else:
+            if sys.byteorder != 'little':
+                values = array.array(typecode, values)
+                values.byteswap()
+            blob = values.tobytes()
+        sections[name] = [offset, len(values)]  # byte offset after the header, element count
+        blobs.append(blob)
+        offset += len(blob)
+        padding = -offset % 4
+        blobs.append(b'\0' * padding)
+        offset += padding
+
+    header = {
+        'version': FORMAT_VERSION,
+        'source': SOURCE,
+        'dict_title': DICT_TITLE,
+        'terms': index['terms'],
+        'types': index['types'],
+        'ids': index['ids'],
+        'sections': sections
+    }
+    header_bytes = json.dumps(header, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    header_bytes += b' ' * (-(PREAMBLE.size + len(header_bytes)) % 4)
+    body = header_bytes + b''.join(blobs)
+    content_hash = hashlib.sha256(body).hexdigest()[:16].encode('ascii')
+    return PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header_bytes), content_hash) + body
+
+
+def read_index_hash(path):
+    """Content hash of an index file, read from its preamble (None if it is not an index)"""
+    with open(path, 'rb') as f:
+        preamble = f.read(PREAMBLE.size)
+    if len(preamble) < PREAMBLE.size:
+        return None
+    magic, version, _, content_hash = PREAMBLE.unpack(preamble)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        return None
+    return content_hash.decode('ascii')
+
+
+class ClientIndex:
+    """Reader for the index file with the client's lookups (has/get), for checks and the CLI"""
+
+    def __init__(self, data):
+        magic, version, header_size, content_hash = PREAMBLE.unpack_from(data)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"Not an Alar client index (version {FORMAT_VERSION})")
+        self.hash = content_hash.decode('ascii')
+        self.header = json.loads(data[PREAMBLE.size:PREAMBLE.size + header_size])
+        base = PREAMBLE.size + header_size
+        for name, typecode in SECTIONS.items():
+            offset, count = self.header['sections'][name]
+            if typecode is None:
+                # Kept as UTF-16 so the offsets slice it directly
+                self.heap = data[base + offset:base + offset + count].decode('utf-8').encode('utf-16-le')
+                continue
+            values = array.array(typecode)
+            values.frombytes(data[base + offset:base + offset + count * values.itemsize])
+            if sys.byteorder != 'little':
+                values.byteswap()
+            setattr(self, name, values)
+        self.term_numbers = {term: number for number, term in enumerate(self.header['terms'])}
+
+    @classmethod
+    def open(cls, path):
+        return cls(Path(path).read_bytes())
+
+    def __len__(self):
+        return len(self.term_numbers)
+
+    def has(self, word):
+        return word in self.term_numbers
+
+    def string(self, ref):
+        if ref == MISSING:
+            return None
+        return self.heap[2 * self.string_offsets[ref]:2 * self.string_offsets[ref + 1]].decode('utf-16-le')
+
+    def get(self, word):
+        """Postings of word as the client's reverse index holds them"""
+        number = self.term_numbers.get(word)
+        if number is None:
+            return []
+        header = self.header
+        results = []
+        for record in self.postings[self.term_offsets[number]:self.term_offsets[number + 1]]:
+            row = self.record_entry[record]
+            results.append({
+                'kannada': self.string(self.entry_strings[3 * row]),
+                'phone': self.string(self.entry_strings[3 * row + 1]),
+                'definition': self.string(self.record_definition[record]),
+                'type': header['types'][self.record_type[record]],
+                'head': self.string(self.entry_strings[3 * row + 2]),
+                'id': header['ids'][row],
+                'dict_title': header['dict_title'],
+                'source': header['source']
+            })
+        return results
+
+
+def build(output_file=DEFAULT_OUTPUT, alar_url=ALAR_URL, offline=None):
+    print("=" * 80)
+    print("Alar Client Index")
+    print("=" * 80)
+
+    try:
+        entries = load_alar_entries(alar_url, offline=offline)
+    except SnapshotMissing as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    with phase('build_client_index', entries=len(entries)):
+        index = build_client_index(entries)
+    with phase('encode_client_index'):
+        data = encode_client_index(index)
+
+    output_path = Path(output_file)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_bytes(data)
+    gzip_path = output_path.with_name(output_path.name + '.gz')
+    gzip_path.write_bytes(gzip.compress(data, compresslevel=9, mtime=0))
+
+    start = time.perf_counter()
+    ClientIndex(data)
+    decode_ms = (time.perf_counter() - start) * 1000
+
+    print(f"\n✓ {len(index['terms']):,} terms, {len(index['postings']):,} postings, "
+          f"{len(index['record_entry']):,} definitions of {len(index['ids']):,} entries")
+    print(f"✓ Saved {output_path} ({len(data) / 1024 / 1024:.2f} MB, "
+          f"{gzip_path.stat().st_size / 1024 / 1024:.2f} MB gzipped, hash {read_index_hash(output_path)})")
+    print(f"  Decoded in {decode_ms:.0f} ms (Python)")
+
+
+def lookup(index_file, words, limit=10):
+    index = ClientIndex.open(index_file)
+    for word in words:
+        postings = index.get(word.lower())
+        print(f"\n🔍 {word}: {len(postings)} postings")
+        for posting in postings[:limit]:
+            print(f"  {posting['kannada']} ({posting['type']}): {posting['definition']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compact Alar search index for the web client')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = subparsers.add_parser('build', help='Build the index from the Alar snapshot')
+    build_parser.add_argument('--output', default=DEFAULT_OUTPUT, help='Index file (a .gz copy is written next to it)')
+    build_parser.add_argument('--offline', action='store_true', default=None, help='Never download alar.yml')
+
+    lookup_parser = subparsers.add_parser('lookup', help='Look words up in a built index')
+    lookup_parser.add_argument('words', nargs='+')
+    lookup_parser.add_argument('--index', default=DEFAULT_OUTPUT, help='Index file')
+    lookup_parser.add_argument('--limit', type=int, default=10, help='Postings to show per word')
+
+    args = parser.parse_args()
+    if args.command == 'build':
+        build(args.output, offline=args.offline)
+    else:
+        lookup(args.index, args.words, args.limit)
+
+
+if __name__ == '__main__':
+    with instrument('build_alar_client_index'):
+        main()
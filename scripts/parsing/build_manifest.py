@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+Build manifest with content hashes, and entry-level deltas between builds.
+
+The web client caches the dictionaries in IndexedDB. Without a manifest the
+only way to invalidate that cache is bumping CACHE_VERSION by hand, after
+which every client downloads everything again. This script describes each
+client data file as shards (one per source|dict_title dictionary of the
+ultra-compact format) with a content hash each:
+
+    padakanaja/build_manifest.json
+        build       hash of all shard hashes (changes only when content does)
+        files       {path: {sha256, bytes, entries, shards: {dict_key: {sha256, entries}}}}
+        deltas      {previous build: {file, bytes}} patches to this build
+        indexes     {path: {hash, bytes}} prebuilt client indexes (the content hash in
+                    their preamble), so a cached copy from an older build is refetched
+
+Each build's files are kept in .rala_build/builds/<build>/ (the last --keep
+builds). When the content changes, the changed shards of every kept build
+are diffed against the new one entry by entry and written as a patch:
+
+    padakanaja/deltas/<from>-<to>.json
+        {"from", "to", "files": {path: {"add": {dict_key: [rows]},
+                                        "remove": {dict_key: [rows]},
+                                        "drop": [dict_key, ...]}}}
+
+A client whose cached build has a delta fetches only that patch; rows are
+matched exactly, so applying remove then add gives the new build's entries.
+A delta larger than --max-delta-ratio of the full download is not published
+(a full download is cheaper to parse).
+
+Usage:
+    python build_manifest.py build [FILE ...] [--keep 3] [--index padakanaja/alar_client_index.bin ...]
+                                                            # default FILE: padakanaja/combined_dictionaries_ultra.json
+    python build_manifest.py diff OLD.json NEW.json [--output patch.json]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.parsing.build_alar_client_index import DEFAULT_OUTPUT as ALAR_CLIENT_INDEX, read_index_hash
+from scripts.parsing.instrumentation import instrument, phase
+from scripts.parsing.json_stream import iter_json_members
+
+ROOT = Path(__file__).resolve().parent.parent.parent
+DEFAULT_FILES = ['padakanaja/combined_dictionaries_ultra.json']
+DEFAULT_INDEXES = [ALAR_CLIENT_INDEX]
+MANIFEST_FILE = ROOT / 'padakanaja' / 'build_manifest.json'
+DELTAS_DIR = ROOT / 'padakanaja' / 'deltas'
+BUILDS_DIR = ROOT / '.rala_build' / 'builds'
+KEEP_BUILDS = 3
+MAX_DELTA_RATIO = 0.5
+
+
+def canonical(value):
+    """JSON text used for hashing and comparing rows (same as the dictionary files)"""
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def content_hash(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def client_path(path):
+    """Path as the client requests it (relative to the site root)"""
+    path = Path(path).resolve()
+    try:
+        return path.relative_to(ROOT).as_posix()
+    except ValueError:
+        return path.name
+
+
+def describe_file(path):
+    """Manifest record of one ultra-compact dictionary file, read one shard at a time"""
+    shards = {}
+    for dict_key, rows in iter_json_members(path):
+        shards[dict_key] = {'sha256': content_hash(canonical(rows)), 'entries': len(rows)}
+    return {
+        'sha256': file_sha256(path),
+        'bytes': Path(path).stat().st_size,
+        'entries': sum(shard['entries'] for shard in shards.values()),
+        'shards': shards
+    }
+
+
+def describe_indexes(paths):
+    """{path: {hash, bytes}} of the prebuilt client indexes that exist"""
+    indexes = {}
+    for path in paths:
+        path = Path(path)
+        if path.exists():
+            indexes[client_path(path)] = {'hash': read_index_hash(path), 'bytes': path.stat().st_size}
+    return indexes
+
+
+def build_id(files):
+    """Hash of every file's shard hashes; equal content gives an equal build"""
+    return content_hash(canonical({
+        path: {dict_key: shard['sha256'] for dict_key, shard in record['shards'].items()}
+        for path, record in sorted(files.items())
+    }))
+
+
+def read_manifest(manifest_file=MANIFEST_FILE):
+    manifest_file = Path(manifest_file)
+    if not manifest_file.exists():
+        return None
+    with open(manifest_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_shards(path, dict_keys):
+    """{dict_key: rows} of the given shards of a file (others are skipped)"""
+    return {dict_key: rows for dict_key, rows in iter_json_members(path) if dict_key in dict_keys}
+
+
+def diff_rows(old_rows, new_rows):
+    """(removed, added) rows, as multisets: a row present twice and kept once is removed once"""
+    old_counts = Counter(canonical(row) for row in old_rows)
+    new_counts = Counter(canonical(row) for row in new_rows)
+    removed_counts = old_counts - new_counts
+    added_counts = new_counts - old_counts
+
+    def take(rows, counts):
+        taken = []
+        for row in rows:
+            key = canonical(row)
+            if counts[key] > 0:
+                counts[key] -= 1
+                taken.append(row)
+        return taken
+    return take(old_rows, removed_counts), take(new_rows, added_counts)
+
+
+def diff_file(old_path, new_path, old_record=None, new_record=None):
+    """Entry-level patch {add, remove, drop} turning old_path's dictionaries into new_path's.
+
+    Only shards whose hashes differ are read back in full.
+    """
+    old_record = old_record or describe_file(old_path)
+    new_record = new_record or describe_file(new_path)
+    old_shards = old_record['shards'] if old_path else {}
+    new_shards = new_record['shards'] if new_path else {}
+
+    changed = {dict_key for dict_key in new_shards
+               if dict_key not in old_shards or old_shards[dict_key]['sha256'] != new_shards[dict_key]['sha256']}
+    dropped = [dict_key for dict_key in old_shards if dict_key not in new_shards]
+
+    old_rows = load_shards(old_path, changed) if old_path and changed else {}
+    new_rows = load_shards(new_path, changed) if changed else {}
+    patch = {'add': {}, 'remove': {}, 'drop': dropped}
+    for dict_key in new_shards:
+        if dict_key not in changed:
+            continue
+        removed, added = diff_rows(old_rows.get(dict_key, []), new_rows[dict_key])
+        if removed:
+            patch['remove'][dict_key] = removed
+        if added:
+            patch['add'][dict_key] = added
+    return patch
+
+
+def patch_stats(patch):
+    """(rows added, rows removed, shards dropped) over all files of a delta"""
+    added = removed = dropped = 0
+    for file_patch in patch['files'].values():
+        added += sum(len(rows) for rows in file_patch['add'].values())
+        removed += sum(len(rows) for rows in file_patch['remove'].values())
+        dropped += len(file_patch['drop'])
+    return added, removed, dropped
+
+
+def archive_build(build, files, manifest_files, builds_dir=BUILDS_DIR):
+    """Copy this build's files to builds_dir/<build>/ so later builds can diff against them"""
+    build_dir = Path(builds_dir) / build
+    if (build_dir / 'manifest.json').exists():
+        return build_dir
+    tmp_dir = build_dir.with_suffix('.tmp')
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    for path, source in files.items():
+        target = tmp_dir / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(source, target)
+    with open(tmp_dir / 'manifest.json', 'w', encoding='utf-8') as f:
+        json.dump({'build': build, 'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                   'files': manifest_files}, f, ensure_ascii=False, indent=2)
+    shutil.rmtree(build_dir, ignore_errors=True)
+    os.replace(tmp_dir, build_dir)
+    return build_dir
+
+
+def previous_builds(current, builds_dir=BUILDS_DIR):
+    """Archived (build, manifest) pairs other than current, newest first"""
+    builds = []
+    for manifest_file in Path(builds_dir).glob('*/manifest.json'):
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest['build'] != current:
+            builds.append(manifest)
+    return sorted(builds, key=lambda manifest: manifest['created_at'], reverse=True)
+
+
+def write_delta(old_manifest, new_build, new_files, new_records, builds_dir, deltas_dir):
+    """Write the patch from an archived build to the new one; returns (delta file, patch)"""
+    old_dir = Path(builds_dir) / old_manifest['build']
+    patch = {'from': old_manifest['build'], 'to': new_build, 'files': {}}
+    for path in sorted(set(old_manifest['files']) | set(new_files)):
+        old_record = old_manifest['files'].get(path)
+        new_record = new_records.get(path)
+        file_patch = diff_file(old_dir / path if old_record else None,
+                               new_files.get(path),
+                               old_record or {'shards': {}}, new_record or {'shards': {}})
+        if file_patch['add'] or file_patch['remove'] or file_patch['drop']:
+            patch['files'][path] = file_patch
+
+    delta_file = Path(deltas_dir) / f"{old_manifest['build']}-{new_build}.json"
+    delta_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(delta_file, 'w', encoding='utf-8') as f:
+        f.write(canonical(patch))
+    return delta_file, patch
+
+
+def build(paths=DEFAULT_FILES, manifest_file=MANIFEST_FILE, deltas_dir=DELTAS_DIR,
+          builds_dir=BUILDS_DIR, keep=KEEP_BUILDS, max_delta_ratio=MAX_DELTA_RATIO, index_paths=DEFAULT_INDEXES):
+    """Write the manifest for paths, archive the build and publish deltas from the kept builds"""
+    print("=" * 80)
+    print("Build Manifest")
+    print("=" * 80)
+
+    files = {client_path(path): Path(path) for path in paths}
+    with phase('hash_shards'):
+        records = {path: describe_file(source) for path, source in files.items()}
+    current = build_id(records)
+    full_bytes = sum(record['bytes'] for record in records.values())
+    for path, record in records.items():
+        print(f"📄 {path}: {len(record['shards'])} shards, {record['entries']:,} entries, "
+              f"{record['bytes'] / 1024 / 1024:.1f} MB")
+    indexes = describe_indexes(index_paths)
+    for path, index in indexes.items():
+        print(f"🗂  {path}: hash {index['hash']}, {index['bytes'] / 1024 / 1024:.1f} MB")
+    print(f"\n🔖 Build {current}")
+
+    archive_build(current, files, records, builds_dir)
+    kept = previous_builds(current, builds_dir)
+    for stale in kept[keep:]:
+        shutil.rmtree(Path(builds_dir) / stale['build'], ignore_errors=True)
+    kept = kept[:keep]
+
+    deltas = {}
+    for old_manifest in kept:
+        delta_file = Path(deltas_dir) / f"{old_manifest['build']}-{current}.json"
+        if not delta_file.exists():
+            with phase('write_delta', base=old_manifest['build']):
+                delta_file, patch = write_delta(old_manifest, current, files, records, builds_dir, deltas_dir)
+            added, removed, dropped = patch_stats(patch)
+            print(f"  Δ {old_manifest['build']} -> {current}: +{added:,} / -{removed:,} rows, "
+                  f"{dropped} dictionaries dropped")
+        delta_bytes = delta_file.stat().st_size
+        if delta_bytes > full_bytes * max_delta_ratio:
+            print(f"  ⚠ Delta from {old_manifest['build']} is {delta_bytes / full_bytes:.0%} of a full "
+                  f"download; not published")
+            delta_file.unlink()
+            continue
+        deltas[old_manifest['build']] = {'file': client_path(delta_file), 'bytes': delta_bytes}
+        print(f"  ✓ {client_path(delta_file)} ({delta_bytes / 1024:.1f} KB, "
+              f"{delta_bytes / full_bytes:.1%} of a full download)")
+
+    # Deltas to earlier builds are never requested again
+    if Path(deltas_dir).exists():
+        published = {Path(delta['file']).name for delta in deltas.values()}
+        for delta_file in Path(deltas_dir).glob('*.json'):
+            if delta_file.name not in published:
+                delta_file.unlink()
+
+    manifest = {
+        'build': current,
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'files': records,
+        'deltas': deltas,
+        'indexes': indexes
+    }
+    previous = read_manifest(manifest_file)
+    if (previous and previous['build'] == current and previous.get('deltas') == deltas
+            and previous.get('indexes') == indexes):
+        print(f"\n✓ {client_path(manifest_file)} is current")
+        return previous
+    manifest_file = Path(manifest_file)
+    manifest_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(manifest_file, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, separators=(',', ':'))
+    print(f"\n✓ Saved {client_path(manifest_file)} ({len(deltas)} deltas)")
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build manifest with shard hashes and deltas between builds')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = subparsers.add_parser('build', help='Write the manifest and the deltas from kept builds')
+    build_parser.add_argument('files', nargs='*', default=DEFAULT_FILES, help='Ultra-compact dictionary files')
+    build_parser.add_argument('--manifest', default=MANIFEST_FILE, help='Manifest file')
+    build_parser.add_argument('--deltas-dir', default=DELTAS_DIR, help='Directory for delta files')
+    build_parser.add_argument('--builds-dir', default=BUILDS_DIR, help='Archive of previous builds')
+    build_parser.add_argument('--keep', type=int, default=KEEP_BUILDS, help='Previous builds to keep deltas for')
+    build_parser.add_argument('--max-delta-ratio', type=float, default=MAX_DELTA_RATIO,
+                              help='Largest delta to publish, as a fraction of the full download')
+    build_parser.add_argument('--index', action='append', dest='indexes',
+                              help=f'Prebuilt client index to list with its hash (default: {ALAR_CLIENT_INDEX})')
+
+    diff_parser = subparsers.add_parser('diff', help='Entry-level diff of two ultra-compact files')
+    diff_parser.add_argument('old', help='Previous build of the file')
+    diff_parser.add_argument('new', help='New build of the file')
+    diff_parser.add_argument('--output', help='Save the patch as JSON')
+
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        build(args.files, args.manifest, args.deltas_dir, args.builds_dir, args.keep, args.max_delta_ratio,
+              args.indexes or DEFAULT_INDEXES)
+        return
+
+    patch = {'files': {client_path(args.new): diff_file(args.old, args.new)}}
+    added, removed, dropped = patch_stats(patch)
+    text = canonical(patch)
+    print(f"+{added:,} rows, -{removed:,} rows, {dropped} dictionaries dropped "
+          f"({len(text.encode('utf-8')) / 1024:.1f} KB patch)")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text)
+        print(f"✓ Saved patch to {args.output}")
+
+
+if __name__ == '__main__':
+    with instrument('build_manifest'):
+        main()
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Split the ultra-compact Padakanaja dictionary into small precompressed shard packs.
+
+PADAKANAJA_COMBINED_FILES are sized for GitHub's 100MB limit, and the web
+client fetches them one after another before any Padakanaja entry is
+searchable. Shard packs are sized for browsers instead:
+
+    padakanaja/shards/padakanaja_shard_<nn>.json      {source|dict_title: [[k, e, t?], ...]}
+    padakanaja/shards/padakanaja_shard_<nn>.json.gz   same bytes, gzip -9 (mtime 0, reproducible)
+    padakanaja/shards/shard_manifest.json             shard count, hash, per-shard counts/sizes/sha256
+
+Each shard is in the same format as combined_dictionaries_ultra.json, so it
+parses on its own with expandOptimizedEntries. An entry goes to shard
+fnv1a_32(lowercased English) % shards; the shard count is a power of two, so
+an entry only moves when the count doubles, and all entries for one English
+headword are in the same shard. The client fetches several shards at once
+and searches the entries of each shard as soon as it arrives.
+
+After building, a report estimates time-to-first-result (first shard
+downloaded and parsed) against the single-file load for a few network
+profiles; the parse rate is measured on the shards with json.loads.
+
+Usage:
+    python build_shard_packs.py [--input padakanaja/combined_dictionaries_ultra.json] [--shard-size-mb 2] [--shards N]
+    python build_shard_packs.py report [--concurrency 4] [--output report.json]
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import math
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.parsing.export_kv_bulk import fnv1a_32
+from scripts.parsing.instrumentation import instrument, phase
+from scripts.parsing.json_stream import iter_json_members
+
+DEFAULT_INPUT = 'padakanaja/combined_dictionaries_ultra.json'
+DEFAULT_OUTPUT_DIR = 'padakanaja/shards'
+MANIFEST_NAME = 'shard_manifest.json'
+DEFAULT_SHARD_SIZE_MB = 2.0  # uncompressed JSON per shard (what the client parses at once)
+DEFAULT_CONCURRENCY = 4  # SHARD_FETCH_CONCURRENCY in js/config.js
+FORMAT_VERSION = 1
+
+# name: (downlink Mbit/s, round trip seconds)
+NETWORK_PROFILES = {
+    'slow-3g': (0.4, 0.4),
+    '3g': (1.6, 0.3),
+    '4g': (9.0, 0.17),
+    'broadband': (50.0, 0.03)
+}
+
+
+def shard_key(row):
+    """Stable sharding key of an ultra-compact row: its English headword"""
+    return row[1].strip().lower() if isinstance(row[1], str) else ''
+
+
+def shard_count_for(total_bytes, shard_size_mb):
+    """Smallest power of two that keeps shards under shard_size_mb on average"""
+    needed = max(1, math.ceil(total_bytes / (shard_size_mb * 1024 * 1024)))
+    return 1 << (needed - 1).bit_length()
+
+
+def shard_name(index, shards):
+    return f'padakanaja_shard_{index:0{max(2, len(str(shards - 1)))}d}.json'
+
+
+def write_shards(input_file, output_dir, shards):
+    """Stream the dictionary into shard files; returns per-shard entry counts"""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    files = [open(output_dir / shard_name(i, shards), 'w', encoding='utf-8') for i in range(shards)]
+    counts = [0] * shards
+    started = [False] * shards
+    shard_of = {}  # English headword -> shard (headwords repeat across dictionaries)
+    try:
+        for f in files:
+            f.write('{')
+        for dict_key, rows in iter_json_members(input_file):
+            grouped = {}
+            for row in rows:
+                if not isinstance(row, list) or len(row) < 2:
+                    continue
+                key = shard_key(row)
+                shard = shard_of.get(key)
+                if shard is None:
+                    shard = shard_of[key] = fnv1a_32(key) % shards
+                grouped.setdefault(shard, []).append(row)
+            for shard, shard_rows in grouped.items():
+                f = files[shard]
+                if started[shard]:
+                    f.write(',')
+                started[shard] = True
+                f.write(json.dumps(dict_key, ensure_ascii=False))
+                f.write(':')
+                f.write(json.dumps(shard_rows, ensure_ascii=False, separators=(',', ':')))
+                counts[shard] += len(shard_rows)
+        for f in files:
+            f.write('}')
+    finally:
+        for f in files:
+            f.close()
+    return counts
+
+
+def client_path(path):
+    return Path(path).as_posix()
+
+
+def build_shard_packs(input_file=DEFAULT_INPUT, output_dir=DEFAULT_OUTPUT_DIR,
+                      shard_size_mb=DEFAULT_SHARD_SIZE_MB, shards=None):
+    """Write the shards, their gzip copies and the manifest; returns the manifest"""
+    input_path = Path(input_file)
+    output_path = Path(output_dir)
+
+    print("=" * 80)
+    print("Padakanaja Shard Packs")
+    print("=" * 80)
+    total_bytes = input_path.stat().st_size
+    shards = shards or shard_count_for(total_bytes, shard_size_mb)
+    print(f"Input: {input_file} ({total_bytes / 1024 / 1024:.1f} MB)")
+    print(f"Shards: {shards} (target {shard_size_mb:g} MB each)\n")
+
+    with phase('write_shards', shards=shards):
+        counts = write_shards(input_path, output_path, shards)
+
+    files = []
+    with phase('compress_shards'):
+        for index in range(shards):
+            plain_path = output_path / shard_name(index, shards)
+            data = plain_path.read_bytes()
+            gzip_path = plain_path.with_name(plain_path.name + '.gz')
+            gzip_path.write_bytes(gzip.compress(data, compresslevel=9, mtime=0))
+            files.append({
+                'file': client_path(plain_path),
+                'gzip': client_path(gzip_path),
+                'entries': counts[index],
+                'bytes': len(data),
+                'gzip_bytes': gzip_path.stat().st_size,
+                'sha256': hashlib.sha256(data).hexdigest()[:16]
+            })
+
+    # Shards of an earlier, larger shard count are never requested again
+    current = {Path(f['file']).name for f in files} | {Path(f['gzip']).name for f in files}
+    for stale in output_path.glob('padakanaja_shard_*.json*'):
+        if stale.name not in current:
+            stale.unlink()
+
+    manifest = {
+        'version': FORMAT_VERSION,
+        'source': client_path(input_path),
+        'hash': 'fnv1a_32(english.strip().lower()) % shards',
+        'shards': shards,
+        'entries': sum(counts),
+        'bytes': sum(f['bytes'] for f in files),
+        'gzip_bytes': sum(f['gzip_bytes'] for f in files),
+        'files': files
+    }
+    with open(output_path / MANIFEST_NAME, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    sizes = [f['gzip_bytes'] for f in files]
+    print(f"✓ {manifest['entries']:,} entries in {shards} shards: "
+          f"{manifest['bytes'] / 1024 / 1024:.1f} MB, {manifest['gzip_bytes'] / 1024 / 1024:.1f} MB gzipped")
+    print(f"  gzipped shard size: {min(sizes) / 1024:.0f}-{max(sizes) / 1024:.0f} KB")
+    print(f"✓ Saved {output_path / MANIFEST_NAME}")
+    return manifest
+
+
+def parse_rate(paths):
+    """Measured json.loads throughput in MB/s over the given files"""
+    total_bytes = 0
+    seconds = 0.0
+    for path in paths:
+        text = Path(path).read_text(encoding='utf-8')
+        start = time.perf_counter()
+        json.loads(text)
+        seconds += time.perf_counter() - start
+        total_bytes += len(text.encode('utf-8'))
+    return total_bytes / 1024 / 1024 / seconds if seconds else float('inf')
+
+
+def estimate_load(manifest, single_gzip_bytes, concurrency, parse_mb_per_s):
+    """Estimated seconds to first result and to full load, per network profile.
+
+    Concurrent fetches share the downlink, so the first shard arrives after
+    min(concurrency, shards) shards' worth of bytes; the single file has to
+    arrive and parse in full before its first result.
+    """
+    files = manifest['files']
+    in_flight = min(concurrency, len(files))
+    first_gzip = max(f['gzip_bytes'] for f in files[:in_flight])
+    first_parse = max(f['bytes'] for f in files[:in_flight]) / 1024 / 1024 / parse_mb_per_s
+    rounds = math.ceil(len(files) / concurrency)
+    estimates = {}
+    for name, (mbit_per_s, rtt) in NETWORK_PROFILES.items():
+        bytes_per_s = mbit_per_s * 1_000_000 / 8
+        single = rtt + single_gzip_bytes / bytes_per_s + manifest['bytes'] / 1024 / 1024 / parse_mb_per_s
+        estimates[name] = {
+            'single_file_first_result_s': round(single, 2),
+            'shards_first_result_s': round(2 * rtt + in_flight * first_gzip / bytes_per_s + first_parse, 2),
+            'shards_all_loaded_s': round(rtt * (1 + rounds) + manifest['gzip_bytes'] / bytes_per_s + first_parse, 2)
+        }
+    return estimates
+
+
+def report(output_dir=DEFAULT_OUTPUT_DIR, concurrency=DEFAULT_CONCURRENCY, output_file=None):
+    """Print (and optionally save) the time-to-first-result estimate of the built shards"""
+    output_path = Path(output_dir)
+    with open(output_path / MANIFEST_NAME, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    single_file = Path(manifest['source'])
+    single_gzip_bytes = len(gzip.compress(single_file.read_bytes(), compresslevel=6, mtime=0)) \
+        if single_file.exists() else manifest['gzip_bytes']
+    rate = parse_rate(Path(f['file']) for f in manifest['files'])
+    estimates = estimate_load(manifest, single_gzip_bytes, concurrency, rate)
+
+    print(f"\n📊 Time to first result ({manifest['shards']} shards, {concurrency} concurrent fetches, "
+          f"parse {rate:.0f} MB/s)")
+    print(f"  {'network':12s} {'single file':>12s} {'first shard':>12s} {'all shards':>12s}")
+    for name, estimate in estimates.items():
+        print(f"  {name:12s} {estimate['single_file_first_result_s']:>11.2f}s "
+              f"{estimate['shards_first_result_s']:>11.2f}s {estimate['shards_all_loaded_s']:>11.2f}s")
+
+    result = {
+        'shards': manifest['shards'],
+        'concurrency': concurrency,
+        'parse_mb_per_s': round(rate, 1),
+        'single_file_gzip_bytes': single_gzip_bytes,
+        'shard_gzip_bytes': manifest['gzip_bytes'],
+        'networks': {name: {'mbit_per_s': mbit, 'rtt_s': rtt} for name, (mbit, rtt) in NETWORK_PROFILES.items()},
+        'estimates': estimates
+    }
+    if output_file:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+        print(f"✓ Saved report to {output_file}")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Split the Padakanaja dictionary into precompressed shard packs')
+    parser.add_argument('command', nargs='?', choices=['build', 'report'], default='build')
+    parser.add_argument('--input', default=DEFAULT_INPUT, help='Ultra-compact dictionary file')
+    parser.add_argument('--output-dir', default=DEFAULT_OUTPUT_DIR, help='Directory for shards and manifest')
+    parser.add_argument('--shard-size-mb', type=float, default=DEFAULT_SHARD_SIZE_MB,
+                        help='Target uncompressed size per shard (rounded to a power-of-two shard count)')
+    parser.add_argument('--shards', type=int, help='Exact shard count (overrides --shard-size-mb)')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help='Concurrent client fetches assumed by the report')
+    parser.add_argument('--output', help='Save the time-to-first-result report as JSON')
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        build_shard_packs(args.input, args.output_dir, args.shard_size_mb, args.shards)
+    report(args.output_dir, args.concurrency, args.output)
+
+
+if __name__ == '__main__':
+    with instrument('build_shard_packs'):
+        main()
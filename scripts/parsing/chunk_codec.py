@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Compact encoding for reverse index chunks.
+
+Plain JSON chunks repeat the full Kannada dict_title, source and type strings
+in every posting. The compact encoding stores:
+1. Per-chunk string tables for repeated fields (type, source, dict_title)
+2. Postings as positional arrays with integer references into those tables
+3. An optional gzip or lzma wrapper around the JSON document
+
+    {"format": "rala-chunk", "version": 2,
+     "fields": ["kannada", "english", "type", ...],
+     "strings": {"type": [...], "source": [...], "dict_title": [...]},
+     "words": {word: [[kannada, english, type_ref, ...], ...]}}
+
+A null in a row means the posting has no such field. A field whose value is
+None is written as {} instead (and an object value as {"v": value}), so it
+decodes back to None rather than disappearing.
+
+decode_chunk() detects the wrapper from the magic bytes, so callers never
+need to know how a chunk was written.
+
+Usage:
+    python chunk_codec.py benchmark [--index-dir padakanaja]
+"""
+
+import argparse
+import gzip
+import json
+import lzma
+import time
+from pathlib import Path
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.parsing.instrumentation import instrument
+
+FORMAT_NAME = 'rala-chunk'
+FORMAT_VERSION = 2
+
+# Fields whose values repeat across postings and go into string tables
+STRING_TABLE_FIELDS = ('type', 'source', 'dict_title')
+
+# Preferred field order; fields seen in postings but not listed here are appended
+FIELD_ORDER = ('kannada', 'english', 'type', 'source', 'dict_title', 'score', 'id')
+
+COMPRESSIONS = ('none', 'gzip', 'lzma')
+
+GZIP_MAGIC = b'\x1f\x8b'
+XZ_MAGIC = b'\xfd7zXZ\x00'
+
+
+def chunk_file_suffix(compression='none'):
+    """File suffix for a compact chunk with the given compression"""
+    return {'none': '.rchunk', 'gzip': '.rchunk.gz', 'lzma': '.rchunk.xz'}[compression]
+
+
+CHUNK_PREFIX = 'padakanaja_reverse_index_part'
+CHUNK_SUFFIXES = ('.json', '.rchunk', '.rchunk.gz', '.rchunk.xz')  # preference order when a part has several
+
+
+def chunk_part(path):
+    """(part number, suffix) of a reverse index chunk file name, or None for other files"""
+    name = Path(path).name
+    if not name.startswith(CHUNK_PREFIX):
+        return None
+    for suffix in CHUNK_SUFFIXES:
+        number = name[len(CHUNK_PREFIX):-len(suffix)]
+        if name.endswith(suffix) and number.isdigit():
+            return int(number), suffix
+    return None
+
+
+def find_chunk_files(index_dir):
+    """Reverse index chunk files in any encoding, one per part, ordered by part number.
+
+    When a part exists in several encodings the newest file wins, so a part
+    left over from a build in another encoding is never read instead.
+    """
+    parts = {}
+    for path in Path(index_dir).glob(CHUNK_PREFIX + '*'):
+        part = chunk_part(path)
+        if part is None:
+            continue
+        number, suffix = part
+        rank = (path.stat().st_mtime, -CHUNK_SUFFIXES.index(suffix))
+        if number not in parts or rank > parts[number][0]:
+            parts[number] = (rank, path)
+    return [parts[number][1] for number in sorted(parts)]
+
+
+def remove_stale_chunks(index_dir, current):
+    """Delete chunk files of index_dir that are not in current (other encodings, old parts)"""
+    current = {Path(path).name for path in current}
+    removed = []
+    for path in Path(index_dir).glob(CHUNK_PREFIX + '*'):
+        if chunk_part(path) is not None and path.name not in current:
+            path.unlink()
+            removed.append(path.name)
+    return removed
+
+
+def _encode_value(value):
+    """Row value for a non-table field: None and objects are wrapped so null can mean absent"""
+    if value is None:
+        return {}
+    if isinstance(value, dict):
+        return {'v': value}
+    return value
+
+
+def encode_chunk(chunk, compression='none'):
+    """Encode a {word: [posting, ...]} chunk into compact bytes"""
+    seen_fields = []
+    for postings in chunk.values():
+        for posting in postings:
+            for field in posting:
+                if field not in seen_fields:
+                    seen_fields.append(field)
+    fields = [f for f in FIELD_ORDER if f in seen_fields] + [f for f in seen_fields if f not in FIELD_ORDER]
+
+    tables = {field: [] for field in STRING_TABLE_FIELDS if field in fields}
+    refs = {field: {} for field in tables}
+
+    words = {}
+    for word, postings in chunk.items():
+        encoded_postings = []
+        for posting in postings:
+            row = []
+            for field in fields:
+                if field not in posting:
+                    row.append(None)
+                    continue
+                value = posting[field]
+                if field in tables:
+                    if value not in refs[field]:
+                        refs[field][value] = len(tables[field])
+                        tables[field].append(value)
+                    value = refs[field][value]
+                else:
+                    value = _encode_value(value)
+                row.append(value)
+            # Trailing absent fields are dropped
+            while row and row[-1] is None:
+                row.pop()
+            encoded_postings.append(row)
+        words[word] = encoded_postings
+
+    document = {
+        'format': FORMAT_NAME,
+        'version': FORMAT_VERSION,
+        'fields': fields,
+        'strings': tables,
+        'words': words
+    }
+    data = json.dumps(document, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    if compression == 'gzip':
+        return gzip.compress(data, compresslevel=9, mtime=0)
+    if compression == 'lzma':
+        return lzma.compress(data, preset=6)
+    return data
+
+
+def decompress(data):
+    """Strip a gzip/lzma wrapper if present"""
+    if data[:2] == GZIP_MAGIC:
+        return gzip.decompress(data)
+    if data[:6] == XZ_MAGIC:
+        return lzma.decompress(data)
+    return data
+
+
+def decode_chunk(data):
+    """Decode compact (optionally compressed) bytes back into a {word: [posting, ...]} chunk.
+
+    Plain JSON chunks are returned as they are, so any chunk file can be passed in.
+    """
+    document = json.loads(decompress(data))
+    if not isinstance(document, dict) or document.get('format') != FORMAT_NAME:
+        return document
+    if document.get('version') != FORMAT_VERSION:
+        raise ValueError(f"Unsupported {FORMAT_NAME} version: {document.get('version')}")
+
+    fields = document['fields']
+    tables = document['strings']
+    table_columns = [tables.get(field) for field in fields]
+
+    chunk = {}
+    for word, rows in document['words'].items():
+        postings = []
+        for row in rows:
+            posting = {}
+            for field, table, value in zip(fields, table_columns, row):
+                if value is None:
+                    continue
+                if table is not None:
+                    value = table[value]
+                elif isinstance(value, dict):
+                    value = value.get('v')
+                posting[field] = value
+            postings.append(posting)
+        chunk[word] = postings
+    return chunk
+
+
+def read_chunk_file(path):
+    """Read a chunk file in any supported encoding"""
+    with open(path, 'rb') as f:
+        return decode_chunk(f.read())
+
+
+def write_chunk_file(chunk, path, compression='none'):
+    """Write a chunk in compact encoding"""
+    with open(path, 'wb') as f:
+        f.write(encode_chunk(chunk, compression))
+
+
+def _time_decode(data, repeat):
+    """Best-of-N decode time in milliseconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        decode_chunk(data)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def benchmark(index_dir='padakanaja', repeat=3, limit=None):
+    """Compare size and decode time of plain JSON chunks and compact encodings"""
+    print("=" * 80)
+    print("Chunk Encoding Benchmark")
+    print("=" * 80)
+    print()
+
+    chunk_files = sorted(Path(index_dir).glob('padakanaja_reverse_index_part*.json'),
+                         key=lambda p: int(p.stem.rsplit('part', 1)[1]))[:limit]
+    if not chunk_files:
+        print(f"❌ No reverse index chunks found in {index_dir}")
+        return {}
+
+    variants = ['json'] + [f'compact+{c}' for c in COMPRESSIONS]
+    totals = {v: {'bytes': 0, 'decode_ms': 0.0} for v in variants}
+
+    for chunk_file in chunk_files:
+        raw = chunk_file.read_bytes()
+        chunk = decode_chunk(raw)
+        encoded = {'json': raw}
+        for compression in COMPRESSIONS:
+            encoded[f'compact+{compression}'] = encode_chunk(chunk, compression)
+        assert decode_chunk(encoded['compact+none']) == chunk, f"Round trip failed for {chunk_file.name}"
+
+        line = []
+        for variant in variants:
+            size = len(encoded[variant])
+            decode_ms = _time_decode(encoded[variant], repeat)
+            totals[variant]['bytes'] += size
+            totals[variant]['decode_ms'] += decode_ms
+            line.append(f"{variant} {size / 1024 / 1024:.2f}MB/{decode_ms:.0f}ms")
+        print(f"  {chunk_file.name}: " + ', '.join(line))
+
+    base_bytes = totals['json']['bytes']
+    print(f"\n📊 Totals over {len(chunk_files)} chunks:")
+    for variant in variants:
+        size_mb = totals[variant]['bytes'] / 1024 / 1024
+        ratio = totals[variant]['bytes'] / base_bytes
+        print(f"  {variant:14s} {size_mb:8.2f} MB ({ratio:6.1%} of JSON), decode {totals[variant]['decode_ms']:8.0f} ms")
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compact reverse index chunk codec')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    bench = subparsers.add_parser('benchmark', help='Compare compact encodings with the JSON chunks')
+    bench.add_argument('--index-dir', default='padakanaja', help='Directory with reverse index chunks')
+    bench.add_argument('--repeat', type=int, default=3, help='Decode repetitions per chunk (best time is kept)')
+    bench.add_argument('--limit', type=int, help='Only benchmark the first N chunks')
+
+    encode = subparsers.add_parser('encode', help='Encode a JSON chunk file')
+    encode.add_argument('input', help='JSON chunk file')
+    encode.add_argument('--compression', choices=COMPRESSIONS, default='gzip')
+
+    args = parser.parse_args()
+
+    if args.command == 'benchmark':
+        benchmark(args.index_dir, args.repeat, args.limit)
+    else:
+        input_path = Path(args.input)
+        output_path = input_path.with_name(input_path.stem + chunk_file_suffix(args.compression))
+        write_chunk_file(read_chunk_file(input_path), output_path, args.compression)
+        print(f"✓ {input_path.name} ({input_path.stat().st_size / 1024 / 1024:.2f} MB) -> "
+              f"{output_path.name} ({output_path.stat().st_size / 1024 / 1024:.2f} MB)")
+
+
+if __name__ == '__main__':
+    with instrument('chunk_codec'):
+        main()
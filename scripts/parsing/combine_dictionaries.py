@@ -14,18 +14,15 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from scripts.parsing.batch_parse_padakanaja import get_dictionary_title
+from scripts.parsing.instrumentation import instrument, phase
+from scripts.parsing.yaml_stream import iter_yaml_entries
 
 
 def load_yaml_file(file_path: Path) -> List[Dict[str, Any]]:
     """Load entries from a YAML file."""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
-            if data is None:
-                return []
-            if isinstance(data, list):
-                return data
-            return []
+        with phase('load_yaml', file=file_path.name):
+            return list(iter_yaml_entries(file_path))
     except Exception as e:
         print(f"  ⚠ Warning: Failed to load {file_path.name}: {e}")
         return []
@@ -127,5 +124,5 @@ def combine_all_dictionaries(
 
 
 if __name__ == '__main__':
-    combine_all_dictionaries()
-
+    with instrument('combine_dictionaries'):
+        combine_all_dictionaries()
@@ -6,13 +6,21 @@ Create an index that maps word prefixes to chunk numbers for efficient lookup
 import json
 from pathlib import Path
 from collections import defaultdict
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.parsing.instrumentation import instrument
+from scripts.parsing.json_stream import iter_json_members
 
 def create_chunk_index():
-    """Create index mapping word prefixes to chunk numbers"""
+    """Create index mapping word prefixes to chunk numbers (and per-chunk word counts)"""
     base_dir = Path('padakanaja')
     
-    # Load all chunk files and build index
+    # Stream each chunk once; prefixes and word counts come from the same pass
     chunk_index = defaultdict(set)  # prefix -> set of chunk numbers
+    chunk_stats = {}  # chunk number -> word count
     
     print("Building chunk index...")
     for i in range(1, 22):  # 21 chunks
@@ -21,17 +29,17 @@ def create_chunk_index():
             continue
         
         print(f"  Processing chunk {i}...")
-        with open(chunk_file, 'r', encoding='utf-8') as f:
-            chunk_data = json.load(f)
-        
+        word_count = 0
         # For each word in this chunk, add its prefixes to the index
-        for word in chunk_data.keys():
+        for word, _ in iter_json_members(chunk_file):
+            word_count += 1
             word_lower = word.lower()
             # Add first 1, 2, 3 characters as prefixes
             for prefix_len in [1, 2, 3]:
                 if len(word_lower) >= prefix_len:
                     prefix = word_lower[:prefix_len]
                     chunk_index[prefix].add(i)
+        chunk_stats[i] = word_count
     
     # Convert sets to sorted lists for JSON
     chunk_index_json = {k: sorted(list(v)) for k, v in chunk_index.items()}
@@ -44,15 +52,7 @@ def create_chunk_index():
     size_mb = index_file.stat().st_size / (1024 * 1024)
     print(f"✓ Created chunk index: {len(chunk_index_json):,} prefixes, {size_mb:.2f}MB")
     
-    # Also create reverse: chunk -> word count (for stats)
-    chunk_stats = {}
-    for i in range(1, 22):
-        chunk_file = base_dir / f"english_reverse_index_part{i}.json"
-        if chunk_file.exists():
-            with open(chunk_file, 'r', encoding='utf-8') as f:
-                chunk_data = json.load(f)
-            chunk_stats[i] = len(chunk_data)
-    
+    # Also save chunk -> word count (for stats)
     stats_file = base_dir / "chunk_stats.json"
     with open(stats_file, 'w', encoding='utf-8') as f:
         json.dump(chunk_stats, f, indent=2)
@@ -60,5 +60,5 @@ def create_chunk_index():
     print(f"✓ Created chunk stats: {sum(chunk_stats.values()):,} total words")
 
 if __name__ == '__main__':
-    create_chunk_index()
-
+    with instrument('create_chunk_index'):
+        create_chunk_index()
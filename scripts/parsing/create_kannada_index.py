@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Kannada -> English forward index, sharded by key hash.
+
+create_optimized_merged_dictionary.py groups definitions by Kannada word but
+writes them into one large file. This index stores the same grouping in
+small shards so a lookup only reads the shard its key hashes to:
+
+    kannada_index_metadata.json        shard count, hash, counts, prefix buckets
+    kannada_index_shard_<n>.json       {key: [{english, type, source, dict_title}, ...]}
+    kannada_index_prefix_<XXXX>.json   sorted keys starting with code point U+XXXX
+
+Keys are the cleaned Kannada word in Unicode NFC with zero-width joiners and
+non-joiners removed, so the same word typed with or without ZWJ/ZWNJ (or in
+decomposed form) finds the same entry. Shards use FNV-1a like the per-term KV
+layout; prefix search reads the prefix bucket of the first character.
+
+Usage:
+    python create_kannada_index.py build [--shards 64] [--output-dir padakanaja/kannada_index] [--no-alar] [--offline]
+    python create_kannada_index.py lookup ಮನೆ [ಮರ ...]
+    python create_kannada_index.py prefix ಮನ [--limit 20]
+"""
+
+import argparse
+import bisect
+import json
+import sys
+import time
+from collections import OrderedDict, defaultdict
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.parsing.create_optimized_merged_dictionary import load_alar, load_padakanaja_combined
+from scripts.parsing.entry_store import entry_rows
+from scripts.parsing.export_kv_bulk import fnv1a_32
+from scripts.parsing.instrumentation import instrument, phase
+from scripts.parsing.kannada_text import cache_stats, kannada_key
+
+DEFAULT_OUTPUT_DIR = 'padakanaja/kannada_index'
+DEFAULT_SHARDS = 64
+DEFAULT_CACHE_SHARDS = 8
+FORMAT_VERSION = 1
+
+def shard_for_key(key, shards):
+    return fnv1a_32(key) % shards
+
+
+def prefix_bucket(key):
+    """Prefix bucket name of a key: its first code point in hex"""
+    return f'{ord(key[0]):04X}'
+
+
+def build_forward_index(alar_entries, padakanaja_entries):
+    """{key: [definition, ...]} with Alar definitions first, duplicates dropped"""
+    index = defaultdict(list)
+    seen = set()
+
+    def add(kannada, english, type_str, source, dict_title):
+        key = kannada_key(kannada)
+        english = (english or '').strip()
+        if not key or not english:
+            return
+        signature = (key, english, source, dict_title)
+        if signature in seen:
+            return
+        seen.add(signature)
+        index[key].append({'english': english, 'type': type_str, 'source': source, 'dict_title': dict_title})
+
+    for entry in alar_entries:
+        for def_entry in entry.get('defs') or []:
+            add(entry.get('entry', ''), def_entry.get('entry', ''), def_entry.get('type', 'Noun'),
+                entry.get('source', 'alar'), entry.get('dict_title', "V. Krishna's Alar"))
+    for kannada, english, type_str, source, dict_title, _ in entry_rows(padakanaja_entries):
+        add(kannada, english, type_str, source, dict_title)
+
+    # Same order as the merged dictionary: Alar first, then by type
+    for definitions in index.values():
+        definitions.sort(key=lambda d: (0 if d['source'] == 'alar' else 1, d['type'] or ''))
+    return index
+
+
+def write_forward_index(index, output_dir, shards=DEFAULT_SHARDS):
+    """Write shards, prefix buckets and metadata; returns the metadata"""
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    for old_file in output_path.glob('kannada_index_*.json'):
+        old_file.unlink()
+
+    shard_data = defaultdict(dict)
+    buckets = defaultdict(list)
+    for key in sorted(index):
+        shard_data[shard_for_key(key, shards)][key] = index[key]
+        buckets[prefix_bucket(key)].append(key)
+
+    shard_sizes = []
+    for shard_num in range(shards):
+        shard_file = output_path / f'kannada_index_shard_{shard_num}.json'
+        with open(shard_file, 'w', encoding='utf-8') as f:
+            json.dump(shard_data.get(shard_num, {}), f, ensure_ascii=False, separators=(',', ':'))
+        shard_sizes.append(shard_file.stat().st_size)
+
+    for bucket, keys in buckets.items():
+        with open(output_path / f'kannada_index_prefix_{bucket}.json', 'w', encoding='utf-8') as f:
+            json.dump(keys, f, ensure_ascii=False, separators=(',', ':'))
+
+    metadata = {
+        'version': FORMAT_VERSION,
+        'shards': shards,
+        'hash': 'fnv1a32',
+        'normalization': 'clean+nfc+strip-zero-width',
+        'keys': len(index),
+        'definitions': sum(len(d) for d in index.values()),
+        'prefix_buckets': {bucket: len(keys) for bucket, keys in sorted(buckets.items())},
+        'max_shard_bytes': max(shard_sizes) if shard_sizes else 0
+    }
+    with open(output_path / 'kannada_index_metadata.json', 'w', encoding='utf-8') as f:
+        json.dump(metadata, f, ensure_ascii=False, indent=2)
+    return metadata
+
+
+def build(output_dir=DEFAULT_OUTPUT_DIR, shards=DEFAULT_SHARDS,
+          padakanaja_file='padakanaja/combined_dictionaries_ultra.json', include_alar=True, offline=None):
+    """Build the sharded Kannada index from Alar and the combined Padakanaja dictionary"""
+    print("=" * 80)
+    print("Building Kannada Forward Index")
+    print("=" * 80)
+    print()
+
+    alar_entries = load_alar(offline=offline) if include_alar else []
+    padakanaja_entries = load_padakanaja_combined(padakanaja_file)
+
+    with phase('build_forward_index'):
+        index = build_forward_index(alar_entries, padakanaja_entries)
+    key_cache = cache_stats()['kannada_key']
+    print(f"✓ {len(index):,} Kannada keys ({key_cache['misses']:,} distinct strings normalized, "
+          f"{key_cache['hits']:,} cache hits)")
+
+    with phase('write_shards', shards=shards):
+        metadata = write_forward_index(index, output_dir, shards)
+    print(f"✓ Wrote {shards} shards and {len(metadata['prefix_buckets'])} prefix buckets to {output_dir}")
+    print(f"  {metadata['definitions']:,} definitions, largest shard "
+          f"{metadata['max_shard_bytes'] / 1024 / 1024:.2f} MB")
+    return metadata
+
+
+class KannadaIndex:
+    """Lookups in a sharded Kannada index; shards and prefix buckets load on first use.
+
+        index = KannadaIndex('padakanaja/kannada_index')
+        index.lookup('ಮನೆ')         # [{english, type, source, dict_title}, ...]
+        index.prefix_search('ಮನ')   # [(key, definitions), ...]
+    """
+
+    def __init__(self, index_dir=DEFAULT_OUTPUT_DIR, cache_shards=DEFAULT_CACHE_SHARDS):
+        self.index_dir = Path(index_dir)
+        with open(self.index_dir / 'kannada_index_metadata.json', 'r', encoding='utf-8') as f:
+            self.metadata = json.load(f)
+        if self.metadata.get('version') != FORMAT_VERSION:
+            raise ValueError(f"Unsupported Kannada index version: {self.metadata.get('version')}")
+        self.shards = self.metadata['shards']
+        self.cache_shards = cache_shards
+        self._shards = OrderedDict()  # shard number -> {key: definitions}
+        self._buckets = {}  # prefix bucket -> sorted keys
+
+    def _shard(self, shard_num):
+        if shard_num in self._shards:
+            self._shards.move_to_end(shard_num)
+            return self._shards[shard_num]
+        with open(self.index_dir / f'kannada_index_shard_{shard_num}.json', 'r', encoding='utf-8') as f:
+            shard = json.load(f)
+        self._shards[shard_num] = shard
+        while len(self._shards) > self.cache_shards:
+            self._shards.popitem(last=False)
+        return shard
+
+    def _bucket(self, bucket):
+        if bucket not in self._buckets:
+            if bucket not in self.metadata['prefix_buckets']:
+                return []
+            with open(self.index_dir / f'kannada_index_prefix_{bucket}.json', 'r', encoding='utf-8') as f:
+                self._buckets[bucket] = json.load(f)
+        return self._buckets[bucket]
+
+    def lookup(self, word):
+        """Definitions of a Kannada word (empty if unknown)"""
+        key = kannada_key(word)
+        if not key:
+            return []
+        return self._shard(shard_for_key(key, self.shards)).get(key, [])
+
+    def __contains__(self, word):
+        return bool(self.lookup(word))
+
+    def prefix_keys(self, prefix, limit=50):
+        """Keys starting with prefix, in sorted order"""
+        key = kannada_key(prefix)
+        if not key:
+            return []
+        keys = self._bucket(prefix_bucket(key))
+        start = bisect.bisect_left(keys, key)
+        matches = []
+        for candidate in keys[start:]:
+            if not candidate.startswith(key) or len(matches) >= limit:
+                break
+            matches.append(candidate)
+        return matches
+
+    def prefix_search(self, prefix, limit=50):
+        """(key, definitions) for keys starting with prefix"""
+        return [(key, self._shard(shard_for_key(key, self.shards))[key]) for key in self.prefix_keys(prefix, limit)]
+
+
+def print_definitions(key, definitions, limit=5):
+    print(f"\n🔍 {key}: {len(definitions)} definitions")
+    for definition in definitions[:limit]:
+        print(f"  {definition['english']} [{definition['type']}] — {definition['dict_title'] or definition['source']}")
+    if len(definitions) > limit:
+        print(f"  ... {len(definitions) - limit} more")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Sharded Kannada -> English forward index')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = subparsers.add_parser('build', help='Build the index')
+    build_parser.add_argument('--output-dir', default=DEFAULT_OUTPUT_DIR, help='Output directory')
+    build_parser.add_argument('--shards', type=int, default=DEFAULT_SHARDS,
+                              help=f'Number of hash shards (default: {DEFAULT_SHARDS})')
+    build_parser.add_argument('--padakanaja', default='padakanaja/combined_dictionaries_ultra.json',
+                              help='Ultra-compact Padakanaja dictionary')
+    build_parser.add_argument('--no-alar', action='store_true', help='Build without the Alar dictionary')
+    build_parser.add_argument('--offline', action='store_true', default=None,
+                              help='Only use the local Alar snapshot (also RALA_OFFLINE=1)')
+
+    for name, help_text in [('lookup', 'Look up Kannada words'), ('prefix', 'Kannada prefix search')]:
+        sub = subparsers.add_parser(name, help=help_text)
+        sub.add_argument('words', nargs='+')
+        sub.add_argument('--index-dir', default=DEFAULT_OUTPUT_DIR, help='Index directory')
+        sub.add_argument('--limit', type=int, default=20, help='Keys to print per prefix')
+
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        build(args.output_dir, args.shards, args.padakanaja, not args.no_alar, args.offline)
+        return
+
+    index = KannadaIndex(args.index_dir)
+    for word in args.words:
+        start = time.perf_counter()
+        if args.command == 'lookup':
+            definitions = index.lookup(word)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            print_definitions(kannada_key(word), definitions)
+            print(f"  ({elapsed_ms:.2f} ms)")
+        else:
+            matches = index.prefix_search(word, args.limit)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            print(f"\n🔍 {word}*: {len(matches)} keys ({elapsed_ms:.2f} ms)")
+            for key, definitions in matches:
+                print(f"  {key} — {definitions[0]['english']}" + (f" (+{len(definitions) - 1})" if len(definitions) > 1 else ''))
+
+
+if __name__ == '__main__':
+    with instrument('create_kannada_index'):
+        main()
@@ -5,75 +5,57 @@ Create optimized merged dictionary for Cloudflare Worker:
 2. Reverse merges by Kannada word (each Kannada word appears once)
 3. All English definitions are merged and numbered
 4. Optimized for fast server-side lookup
+
+Usage:
+    python create_optimized_merged_dictionary.py [--offline]
 """
 
 import json
-import yaml
 from pathlib import Path
 from collections import defaultdict
-from urllib.request import urlopen
-import re
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.parsing.ranking import compute_posting_score, sort_postings
+from scripts.parsing.instrumentation import instrument, phase
+from scripts.parsing.kannada_text import kannada_key
+from scripts.parsing.alar_snapshot import ALAR_URL, SnapshotMissing, load_alar_entries
+from scripts.parsing.entry_store import EntryStore, entry_rows_with_also
 
-def clean_kannada_entry(text):
-    """Clean Kannada entry (remove brackets, numbers, etc.)"""
-    if not text:
-        return ''
-    # Remove content in brackets, parentheses, numbers
-    text = re.sub(r'[\(\[].*?[\)\]]', '', text)
-    text = re.sub(r'\d+', '', text)
-    return text.strip()
+def load_alar(alar_url=ALAR_URL, offline=None):
+    """Load Alar dictionary from the local snapshot (downloaded once if there is none).
 
-def load_alar(alar_url='https://raw.githubusercontent.com/alar-dict/data/master/alar.yml'):
-    """Load Alar dictionary from URL"""
-    print(f"Loading Alar dictionary from: {alar_url}")
+    Offline without a snapshot exits 1, so no output is written without Alar.
+    """
     try:
-        with urlopen(alar_url) as response:
-            data = yaml.safe_load(response)
-        print(f"✓ Loaded {len(data)} Alar entries")
-        return data
+        return load_alar_entries(alar_url, offline=offline)
+    except SnapshotMissing as e:
+        print(f"Error: {e}")
+        sys.exit(1)
     except Exception as e:
         print(f"⚠ Error loading Alar: {e}")
         import traceback
         traceback.print_exc()
         return []
 
-def load_padakanaja_combined():
-    """Load combined Padakanaja dictionary"""
-    padakanaja_file = Path('padakanaja/combined_dictionaries_ultra.json')
+def load_padakanaja_combined(padakanaja_file='padakanaja/combined_dictionaries_ultra.json'):
+    """Load combined Padakanaja dictionary into an EntryStore"""
+    padakanaja_file = Path(padakanaja_file)
     if not padakanaja_file.exists():
         print(f"⚠ Error: {padakanaja_file} not found")
-        return {}
+        return EntryStore()
     
     print(f"Loading Padakanaja dictionary from: {padakanaja_file}")
-    with open(padakanaja_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    # Expand optimized format
-    entries = []
-    if isinstance(data, dict):
-        for key, entries_list in data.items():
-            # Key format: "source|dict_title" or just "source"
-            source, dict_title = key.split('|', 1) if '|' in key else (key, '')
-            
-            # entries_list is a list of [kannada, english, type?] arrays
-            if isinstance(entries_list, list):
-                for entry_data in entries_list:
-                    if isinstance(entry_data, list) and len(entry_data) >= 2:
-                        kannada = entry_data[0]
-                        english = entry_data[1]
-                        type_str = entry_data[2] if len(entry_data) > 2 else 'Noun'
-                        entries.append({
-                            'kannada': kannada,
-                            'english': english,
-                            'type': type_str,
-                            'source': source,
-                            'dict_title': dict_title
-                        })
+    # Expand optimized format, one dictionary at a time
+    with phase('load_padakanaja'):
+        entries = EntryStore.load_ultra(padakanaja_file)
     
     print(f"✓ Loaded {len(entries)} Padakanaja entries")
     return entries
 
-def create_merged_dictionary():
+def create_merged_dictionary(offline=None):
     """Create optimized merged dictionary"""
     print("=" * 80)
     print("Creating Optimized Merged Dictionary")
@@ -81,7 +63,7 @@ def create_merged_dictionary():
     print()
     
     # Load both dictionaries
-    alar_entries = load_alar()
+    alar_entries = load_alar(offline=offline)
     padakanaja_entries = load_padakanaja_combined()
     
     # Build reverse index: Kannada -> List of English definitions
@@ -92,7 +74,7 @@ def create_merged_dictionary():
     
     print("\nProcessing Alar entries...")
     for entry in alar_entries:
-        kannada = clean_kannada_entry(entry.get('entry', ''))
+        kannada = kannada_key(entry.get('entry', ''))
         if not kannada:
             continue
         
@@ -114,22 +96,24 @@ def create_merged_dictionary():
     
     print("\nProcessing Padakanaja entries...")
     padakanaja_count = 0
-    for entry in padakanaja_entries:
-        kannada = clean_kannada_entry(entry.get('kannada', ''))
+    for (kannada, english, type_str, source, dict_title, _), also in entry_rows_with_also(padakanaja_entries):
+        kannada = kannada_key(kannada)
         if not kannada:
             continue
         
-        english = entry.get('english', '').strip()
+        english = english.strip()
         if not english:
             continue
         
         kannada_index[kannada]['definitions'].append({
             'english': english,
-            'type': entry.get('type', 'Noun'),
-            'source': entry.get('source', 'padakanaja'),
-            'dict_title': entry.get('dict_title', '')
+            'type': type_str,
+            'source': source,
+            'dict_title': dict_title
         })
-        kannada_index[kannada]['sources'].add(entry.get('source', 'padakanaja'))
+        kannada_index[kannada]['sources'].add(source)
+        # A collapsed near-duplicate also counts for the other dictionaries it was in
+        kannada_index[kannada]['sources'].update(key.split('|', 1)[0] for key in also)
         padakanaja_count += 1
     
     print(f"✓ Processed {padakanaja_count} Padakanaja entries")
@@ -188,10 +172,12 @@ def create_merged_dictionary():
                         'kannada': kannada,
                         'full_definition': def_item['english'],
                         'type': def_item['type'],
-                        'source': def_item['source']
+                        'source': def_item['source'],
+                        'score': compute_posting_score(word, def_item['english'], kannada,
+                                                       def_item['source'], def_item['type'])
                     })
     
-    # Deduplicate
+    # Deduplicate and pre-sort by relevance
     for word in english_index:
         seen = set()
         unique_entries = []
@@ -200,7 +186,7 @@ def create_merged_dictionary():
             if key not in seen:
                 seen.add(key)
                 unique_entries.append(entry)
-        english_index[word] = unique_entries
+        english_index[word] = sort_postings(unique_entries, definition_field='full_definition')
     
     reverse_index_file = Path('padakanaja/english_reverse_index.json')
     print(f"Saving English reverse index to: {reverse_index_file}")
@@ -220,5 +206,5 @@ def create_merged_dictionary():
     print("=" * 80)
 
 if __name__ == '__main__':
-    create_merged_dictionary()
-
+    with instrument('create_optimized_merged_dictionary'):
+        create_merged_dictionary(offline=True if '--offline' in sys.argv[1:] else None)
@@ -6,6 +6,7 @@ Optimized for Cloudflare KV (split into chunks < 25MB)
 Includes entry IDs for audio support - FIXED to use same IDs as audio generation
 """
 
+import argparse
 import json
 import os
 import sys
@@ -14,6 +15,15 @@ import re
 from pathlib import Path
 from collections import defaultdict
 
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.parsing.ranking import DefinitionProfile, compute_posting_scores, sort_postings
+from scripts.parsing.chunk_codec import COMPRESSIONS, chunk_file_suffix, remove_stale_chunks, write_chunk_file
+from scripts.parsing.instrumentation import instrument, phase
+from scripts.parsing.entry_store import EntryStore, entry_rows_with_also
+from scripts.parsing.json_stream import iter_json_members, json_top_level_type
+
 def load_audio_index_mapping():
     """Load audio_index.json and word_id_mapping.json to enable (kannada, english) -> entry_id lookup"""
     audio_index_path = Path('/Users/pavan/src/padakanaja-voice-corpus/audio_index.json')
@@ -121,41 +131,22 @@ def load_padakanaja(audio_index, word_id_map):
         sys.exit(1)
     
     print(f"📚 Loading Padakanaja dictionary from {input_file}...")
-    with open(input_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    entries = []
+    entries = EntryStore()
     matched_ids = 0
     unmatched_entries = []
     
     if audio_index is None or word_id_map is None:
         print("⚠ No audio index or word mapping available, skipping ID matching")
         # Still load entries but without IDs
-    if isinstance(data, dict):
-        for key, entries_list in data.items():
-            source = key.split('|')[0] if '|' in key else key
-            dict_title = key.split('|')[1] if '|' in key else ''
-            
-            if isinstance(entries_list, list):
-                for entry_data in entries_list:
-                    if isinstance(entry_data, list) and len(entry_data) >= 2:
-                        kannada = entry_data[0]
-                        english = entry_data[1]
-                        type_val = entry_data[2] if len(entry_data) > 2 else 'Noun'
-                        
-                        entries.append({
-                            'kannada': kannada,
-                            'english': english,
-                            'type': type_val,
-                            'source': source,
-                                'dict_title': dict_title,
-                                'id': ''
-                            })
+    # Dictionaries are decoded one at a time into a compact column store
+    if json_top_level_type(input_file) is dict:
+        entries = EntryStore.load_ultra(input_file)
         print(f"✓ Loaded {len(entries):,} Padakanaja entries (no IDs)")
         return entries
     
-    if isinstance(data, dict):
-        for key, entries_list in data.items():
+    # Dictionaries are decoded one at a time instead of loading the whole file
+    if json_top_level_type(input_file) is dict:
+        for key, entries_list in iter_json_members(input_file):
             source = key.split('|')[0] if '|' in key else key
             dict_title = key.split('|')[1] if '|' in key else ''
             
@@ -164,20 +155,14 @@ def load_padakanaja(audio_index, word_id_map):
                     if isinstance(entry_data, list) and len(entry_data) >= 2:
                         kannada = entry_data[0]
                         english = entry_data[1]
-                        type_val = entry_data[2] if len(entry_data) > 2 else 'Noun'
+                        type_val = entry_data[2] if len(entry_data) > 2 and entry_data[2] else 'Noun'
+                        also = entry_data[3] if len(entry_data) > 3 else ()
                         
                         # Find entry_id for this (kannada, english) pair
                         entry_id = find_entry_id_for_pair(kannada, english, word_id_map, audio_index)
                         if entry_id:
                             matched_ids += 1
-                            entries.append({
-                                'kannada': kannada,
-                                'english': english,
-                                'type': type_val,
-                                'source': source,
-                                'dict_title': dict_title,
-                                'id': entry_id
-                            })
+                            entries.append(kannada, english, type_val, source, dict_title, entry_id, also)
                         else:
                             # Store for later - we'll skip entries without audio
                             unmatched_entries.append((kannada, english, type_val, source, dict_title))
@@ -193,29 +178,34 @@ def load_padakanaja(audio_index, word_id_map):
     return entries
 
 def build_reverse_index(entries):
-    """Build English -> Kannada reverse index"""
+    """Build English -> Kannada reverse index with postings pre-sorted by relevance score.
+
+    entries is an EntryStore or any iterable of entry dicts.
+    """
     print("🔨 Building reverse index...")
     reverse_index = defaultdict(list)
     
-    for entry in entries:
-        english = entry['english']
+    for (kannada, english, type_str, source, dict_title, entry_id), also in entry_rows_with_also(entries):
         if not english:
             continue
         
-        # Split English into words and index each word
-        words = english.lower().split()
-        for word in words:
-            # Clean word (remove punctuation)
-            clean_word = ''.join(c for c in word if c.isalnum())
-            if len(clean_word) >= 2:  # Only index words with 2+ characters
-                reverse_index[clean_word].append({
-                    'kannada': entry['kannada'],
-                    'english': entry['english'],
-                    'type': entry['type'],
-                    'source': entry['source'],
-                    'dict_title': entry['dict_title'],
-                    'id': entry.get('id', '')  # Include entry ID for audio support
-                })
+        # Split English into words (punctuation removed) and index each word once per entry
+        profile = DefinitionProfile(english)
+        clean_words = [w for w in dict.fromkeys(profile.words) if len(w) >= 2]  # Only index words with 2+ characters
+        scores = compute_posting_scores(clean_words, english, kannada, source, type_str, profile=profile)
+        for clean_word, score in zip(clean_words, scores):
+            posting = {
+                'kannada': kannada,
+                'english': english,
+                'type': type_str,
+                'source': source,
+                'dict_title': dict_title,
+                'id': entry_id,  # Include entry ID for audio support
+                'score': score
+            }
+            if also:
+                posting['also'] = list(also)  # Other dictionaries of a collapsed near-duplicate
+            reverse_index[clean_word].append(posting)
     
     # Remove duplicates (same kannada-english pair)
     for word in reverse_index:
@@ -226,11 +216,53 @@ def build_reverse_index(entries):
             if key not in seen:
                 seen.add(key)
                 unique_entries.append(entry)
-        reverse_index[word] = unique_entries
+        reverse_index[word] = sort_postings(unique_entries)
     
     print(f"✓ Built reverse index: {len(reverse_index):,} unique English words")
     return dict(reverse_index)
 
+def paginate_postings(reverse_index, page_size=500):
+    """Split oversized posting lists into a head page and overflow pages.
+
+    Postings are pre-sorted by score, so the head page (stored with the term in
+    its chunk) holds the best results. The rest is cut into overflow pages of
+    page_size postings, each stored under its own key.
+
+    Returns (head_index, overflow_pages, overflow_index) where overflow_pages maps
+    (word, page_number) -> postings and overflow_index maps word -> page stats.
+    """
+    print(f"📄 Paginating posting lists (page size {page_size})...")
+    head_index = {}
+    overflow_pages = {}
+    overflow_index = {}
+    
+    for word, entries in reverse_index.items():
+        head_index[word] = entries[:page_size]
+        if len(entries) <= page_size:
+            continue
+        
+        tail = entries[page_size:]
+        pages = [tail[i:i + page_size] for i in range(0, len(tail), page_size)]
+        for page_num, page in enumerate(pages, 1):  # Page 0 is the head
+            overflow_pages[(word, page_num)] = page
+        overflow_index[word] = {
+            'total': len(entries),
+            'pages': len(pages)
+        }
+    
+    overflow_postings = sum(len(p) for p in overflow_pages.values())
+    print(f"✓ {len(overflow_index):,} words overflow into {len(overflow_pages):,} pages "
+          f"({overflow_postings:,} postings moved out of chunks)")
+    return head_index, overflow_pages, overflow_index
+
+def overflow_key(word, page_num):
+    """KV key (and file stem) of an overflow page"""
+    return f'padakanaja_reverse_index_overflow_{word}_{page_num}'
+
+def word_json_size(word, entries):
+    """Bytes a word adds to a chunk (chunks are written with ensure_ascii=False)"""
+    return len(json.dumps({word: entries}, ensure_ascii=False).encode('utf-8'))
+
 def split_into_chunks(reverse_index, max_size_mb=20):
     """Split reverse index into chunks < max_size_mb"""
     print(f"📦 Splitting reverse index into chunks < {max_size_mb}MB...")
@@ -245,9 +277,7 @@ def split_into_chunks(reverse_index, max_size_mb=20):
     
     for word, entries in sorted_words:
         # Estimate size of this word's data
-        word_data = {word: entries}
-        word_json = json.dumps(word_data)
-        word_size = len(word_json.encode('utf-8'))
+        word_size = word_json_size(word, entries)
         
         # If adding this word would exceed limit, save current chunk
         if current_size + word_size > max_size_bytes and current_chunk:
@@ -266,7 +296,7 @@ def split_into_chunks(reverse_index, max_size_mb=20):
     
     # Verify chunk sizes
     for i, chunk in enumerate(chunks, 1):
-        chunk_json = json.dumps(chunk)
+        chunk_json = json.dumps(chunk, ensure_ascii=False)
         chunk_size_mb = len(chunk_json.encode('utf-8')) / 1024 / 1024
         print(f"  Chunk {i}: {chunk_size_mb:.2f} MB ({len(chunk):,} words)")
     
@@ -278,7 +308,7 @@ def create_chunk_index(chunks):
     
     chunk_index = {}
     for chunk_num, chunk in enumerate(chunks, 1):  # Start from 1, not 0
-        for word in chunk.keys():
+        for word in chunk:
             # Use first 3 characters as prefix
             prefix = word[:3].lower()
             if prefix not in chunk_index:
@@ -296,18 +326,210 @@ def create_chunk_index(chunks):
     print(f"✓ Created chunk index: {len(chunk_index):,} prefixes")
     return chunk_index
 
+def get_chunks_for_word(word, chunk_index):
+    """Chunks that may contain a word (same routing as getChunksForWord in the Worker)"""
+    if not chunk_index or not word:
+        return [1]
+    
+    word_lower = word.lower()
+    term_routes = chunk_index.get('_terms', {})
+    if word_lower in term_routes:
+        return term_routes[word_lower]
+    
+    prefix = word_lower[:3]
+    if prefix in chunk_index:
+        return chunk_index[prefix]
+    
+    first_char = word_lower[0]
+    if first_char in chunk_index:
+        return chunk_index[first_char][:3]  # Limit to 3 chunks
+    
+    return [1]
+
+def split_into_chunks_by_layout(reverse_index, layout, max_size_mb=20):
+    """Split reverse index into chunks following a precomputed layout.
+
+    layout is a list of chunks, each a list of words (see optimize_chunk_layout.py).
+    Words missing from the layout are appended alphabetically; any chunk that
+    no longer fits max_size_mb spills into the next one.
+    """
+    print(f"📦 Splitting reverse index into chunks < {max_size_mb}MB using layout ({len(layout)} chunks)...")
+    max_size_bytes = max_size_mb * 1024 * 1024
+    placed = set()
+    groups = []
+    for layout_chunk in layout:
+        words = [w for w in layout_chunk if w in reverse_index and w not in placed]
+        placed.update(words)
+        if words:
+            groups.append(words)
+    leftover = sorted(w for w in reverse_index if w not in placed)
+    if leftover:
+        print(f"  {len(leftover):,} words not in layout, appended alphabetically")
+        groups.append(leftover)
+    
+    chunks = []
+    for words in groups:
+        current_chunk = {}
+        current_size = 0
+        for word in words:
+            word_size = word_json_size(word, reverse_index[word])
+            if current_size + word_size > max_size_bytes and current_chunk:
+                chunks.append(current_chunk)
+                current_chunk = {}
+                current_size = 0
+            current_chunk[word] = reverse_index[word]
+            current_size += word_size
+        if current_chunk:
+            chunks.append(current_chunk)
+    
+    print(f"✓ Split into {len(chunks)} chunks")
+    return chunks
+
+def normalize_query_term(word):
+    """Normalize a query word the way the Worker does before lookup"""
+    return re.sub(r'[^a-z0-9]', '', word.lower())
+
+def load_query_frequencies(freq_file):
+    """Load a query-frequency list.
+
+    Accepts a JSON object {term: count}, a JSON list of [term, count] pairs,
+    or a text file with one "term [count]" per line (count defaults to 1, so a
+    raw log of one query per line works too). Multi-word queries count once
+    for each of their words.
+    """
+    path = Path(freq_file)
+    print(f"📈 Loading query frequencies from {path}...")
+    raw = []
+    if path.suffix == '.json':
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        raw = list(data.items()) if isinstance(data, dict) else [tuple(item) for item in data]
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                parts = line.strip().split()
+                if not parts:
+                    continue
+                if len(parts) > 1 and parts[-1].isdigit():
+                    raw.append((' '.join(parts[:-1]), int(parts[-1])))
+                else:
+                    raw.append((' '.join(parts), 1))
+    
+    frequencies = defaultdict(int)
+    for query, count in raw:
+        for word in str(query).split():
+            term = normalize_query_term(word)
+            if len(term) >= 2:
+                frequencies[term] += int(count)
+    
+    print(f"✓ Loaded {len(frequencies):,} distinct query terms ({sum(frequencies.values()):,} lookups)")
+    return dict(frequencies)
+
+def build_hot_chunk(reverse_index, frequencies, max_terms=3000, max_size_kb=900):
+    """Collect the most frequently queried words into a small dedicated chunk.
+
+    Words stay in their alphabetical chunk as well; the chunk index routes
+    them to the hot chunk so a cold Worker only loads this small value.
+    Returns (hot_chunk, report).
+    """
+    print(f"🔥 Building hot chunk (up to {max_terms:,} words, < {max_size_kb}KB)...")
+    max_size_bytes = max_size_kb * 1024
+    hot_chunk = {}
+    current_size = 2
+    
+    ranked = sorted(frequencies.items(), key=lambda item: (-item[1], item[0]))
+    for term, _ in ranked:
+        if len(hot_chunk) >= max_terms:
+            break
+        if term not in reverse_index:
+            continue
+        term_size = word_json_size(term, reverse_index[term])
+        if current_size + term_size > max_size_bytes:
+            continue  # A smaller, slightly less frequent word may still fit
+        hot_chunk[term] = reverse_index[term]
+        current_size += term_size
+    
+    total_lookups = sum(frequencies.values())
+    indexed_lookups = sum(count for term, count in frequencies.items() if term in reverse_index)
+    hot_lookups = sum(frequencies[term] for term in hot_chunk)
+    report = {
+        'hot_words': len(hot_chunk),
+        'hot_size_kb': round(current_size / 1024, 1),
+        'query_terms': len(frequencies),
+        'total_lookups': total_lookups,
+        'hot_lookups': hot_lookups,
+        'coverage': round(hot_lookups / total_lookups, 4) if total_lookups else 0.0,
+        'coverage_of_indexed': round(hot_lookups / indexed_lookups, 4) if indexed_lookups else 0.0
+    }
+    
+    print(f"✓ Hot chunk: {report['hot_words']:,} words, {report['hot_size_kb']:.1f} KB")
+    print(f"  Estimated coverage: {report['coverage']:.1%} of word lookups "
+          f"({report['coverage_of_indexed']:.1%} of lookups for indexed words)")
+    return hot_chunk, report
+
+def add_term_routes(chunk_index, words, chunk_num):
+    """Route exact words to a chunk, ahead of the prefix lookup (see getChunksForWord)"""
+    term_routes = chunk_index.setdefault('_terms', {})
+    for word in words:
+        term_routes[word] = [chunk_num]
+    return chunk_index
+
+def add_layout_routes(chunk_index, chunks):
+    """Route the words of a non-alphabetical layout whose prefix spans several chunks.
+
+    A prefix route already lists every chunk holding a word with that prefix,
+    so only words whose prefix is shared with another chunk need an exact
+    route to be fetched from one chunk; routing every word would make the
+    chunk index several times larger.
+    """
+    routed = 0
+    for chunk_num, chunk in enumerate(chunks, 1):
+        words = [word for word in chunk if len(chunk_index.get(word[:3].lower(), ())) > 1]
+        add_term_routes(chunk_index, words, chunk_num)
+        routed += len(words)
+    return routed
+
 def main():
+    parser = argparse.ArgumentParser(description='Create Padakanaja reverse index chunks for Cloudflare KV')
+    parser.add_argument('--page-size', type=int, default=500,
+                        help='Postings kept with each word; the rest go to overflow pages (default: 500, the Worker maxResults)')
+    parser.add_argument('--layout', metavar='LAYOUT_FILE',
+                        help='Chunk layout from optimize_chunk_layout.py (default: alphabetical chunks)')
+    parser.add_argument('--chunk-encoding', choices=('json', 'compact'), default='json',
+                        help='json (what the Worker reads) or compact string-table encoding (see chunk_codec.py)')
+    parser.add_argument('--compression', choices=COMPRESSIONS, default='none',
+                        help='Wrapper for compact chunks (default: none)')
+    parser.add_argument('--hot-terms', metavar='FREQ_FILE',
+                        help='Query-frequency list (e.g. from logs); its most frequent words go into a small hot chunk (part0)')
+    parser.add_argument('--hot-count', type=int, default=3000,
+                        help='Maximum number of words in the hot chunk (default: 3000)')
+    parser.add_argument('--hot-max-kb', type=int, default=900,
+                        help='Size budget of the hot chunk in KB (default: 900)')
+    args = parser.parse_args()
+    
     # Load audio index and word mapping
     audio_index, word_id_map = load_audio_index_mapping()
     
     # Load Padakanaja with correct IDs
-    entries = load_padakanaja(audio_index, word_id_map)
+    with phase('load_padakanaja'):
+        entries = load_padakanaja(audio_index, word_id_map)
     
     # Build reverse index
-    reverse_index = build_reverse_index(entries)
+    with phase('build_reverse_index', entries=len(entries)):
+        reverse_index = build_reverse_index(entries)
+    
+    # Keep only the ranked head page with each word
+    with phase('paginate_postings', words=len(reverse_index)):
+        head_index, overflow_pages, overflow_index = paginate_postings(reverse_index, page_size=args.page_size)
     
     # Split into chunks
-    chunks = split_into_chunks(reverse_index, max_size_mb=20)
+    with phase('split_into_chunks', words=len(head_index)):
+        if args.layout:
+            with open(args.layout, 'r', encoding='utf-8') as f:
+                layout = json.load(f)['chunks']
+            chunks = split_into_chunks_by_layout(head_index, layout, max_size_mb=20)
+        else:
+            chunks = split_into_chunks(head_index, max_size_mb=20)
     
     # Save chunks
     print("💾 Saving chunks...")
@@ -316,25 +538,80 @@ def main():
     output_dir = script_dir.parent.parent / 'padakanaja'
     output_dir.mkdir(parents=True, exist_ok=True)
     
+    chunk_files = []
     for i, chunk in enumerate(chunks, 1):
-        output_file = output_dir / f'padakanaja_reverse_index_part{i}.json'
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(chunk, f, ensure_ascii=False, indent=0)
+        with phase('save_chunk', chunk=i, words=len(chunk)):
+            if args.chunk_encoding == 'compact':
+                output_file = output_dir / f'padakanaja_reverse_index_part{i}{chunk_file_suffix(args.compression)}'
+                write_chunk_file(chunk, output_file, args.compression)
+            else:
+                output_file = output_dir / f'padakanaja_reverse_index_part{i}.json'
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    json.dump(chunk, f, ensure_ascii=False, indent=0)
+        chunk_files.append(output_file)
         chunk_size_mb = os.path.getsize(output_file) / 1024 / 1024
         print(f"  ✓ Saved {output_file} ({chunk_size_mb:.2f} MB)")
     
-    # Create and save chunk index
-    chunk_index = create_chunk_index(chunks)
+    # Create chunk index
+    with phase('create_chunk_index', chunks=len(chunks)):
+        chunk_index = create_chunk_index(chunks)
+    if args.layout:
+        # Chunks are not alphabetical; route the words whose prefix spans several chunks
+        routed = add_layout_routes(chunk_index, chunks)
+        print(f"✓ Routed {routed:,} words whose prefix spans several chunks")
+    
+    # Hot chunk (part0) for frequently queried words
+    hot_report = None
+    if args.hot_terms:
+        frequencies = load_query_frequencies(args.hot_terms)
+        hot_chunk, hot_report = build_hot_chunk(head_index, frequencies,
+                                                max_terms=args.hot_count, max_size_kb=args.hot_max_kb)
+        hot_file = output_dir / 'padakanaja_reverse_index_part0.json'
+        with open(hot_file, 'w', encoding='utf-8') as f:
+            json.dump(hot_chunk, f, ensure_ascii=False, separators=(',', ':'))
+        chunk_files.append(hot_file)
+        print(f"  ✓ Saved {hot_file} ({os.path.getsize(hot_file) / 1024:.1f} KB)")
+        add_term_routes(chunk_index, hot_chunk.keys(), 0)
+        report_file = output_dir / 'padakanaja_reverse_index_hot_report.json'
+        with open(report_file, 'w', encoding='utf-8') as f:
+            json.dump(hot_report, f, ensure_ascii=False, indent=2)
+        print(f"✓ Saved {report_file}")
+    
+    # Earlier builds' parts (another encoding, more chunks, a hot chunk) would be read instead
+    stale = remove_stale_chunks(output_dir, chunk_files)
+    if stale:
+        print(f"🗑  Removed {len(stale)} stale chunk files")
+    
+    # Save chunk index
     index_file = output_dir / 'padakanaja_reverse_index_chunk_index.json'
     with open(index_file, 'w', encoding='utf-8') as f:
         json.dump(chunk_index, f, ensure_ascii=False, indent=2)
     print(f"✓ Saved {index_file}")
     
+    # Save overflow pages (one file per KV key) and their index
+    overflow_dir = output_dir / 'padakanaja_reverse_index_overflow'
+    if overflow_pages:
+        print(f"💾 Saving {len(overflow_pages):,} overflow pages...")
+        overflow_dir.mkdir(parents=True, exist_ok=True)
+        for (word, page_num), page in overflow_pages.items():
+            with open(overflow_dir / f'{overflow_key(word, page_num)}.json', 'w', encoding='utf-8') as f:
+                json.dump(page, f, ensure_ascii=False, separators=(',', ':'))
+    overflow_index_file = output_dir / 'padakanaja_reverse_index_overflow_index.json'
+    with open(overflow_index_file, 'w', encoding='utf-8') as f:
+        json.dump(overflow_index, f, ensure_ascii=False, separators=(',', ':'))
+    print(f"✓ Saved {overflow_index_file}")
+    
     # Save metadata
     metadata = {
         'total_words': len(reverse_index),
         'total_chunks': len(chunks),
-        'chunk_sizes': [len(chunk) for chunk in chunks]
+        'chunk_sizes': [len(chunk) for chunk in chunks],
+        'page_size': args.page_size,
+        'overflow_words': len(overflow_index),
+        'overflow_pages': len(overflow_pages),
+        'hot_chunk': hot_report,
+        'chunk_encoding': args.chunk_encoding,
+        'compression': args.compression if args.chunk_encoding == 'compact' else 'none'
     }
     metadata_file = output_dir / 'padakanaja_reverse_index_metadata.json'
     with open(metadata_file, 'w', encoding='utf-8') as f:
@@ -347,5 +624,5 @@ def main():
     print(f"   Ready for Cloudflare KV upload")
 
 if __name__ == '__main__':
-    main()
-
+    with instrument('create_padakanaja_reverse_index'):
+        main()
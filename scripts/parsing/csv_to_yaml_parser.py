@@ -14,6 +14,12 @@ import hashlib
 from pathlib import Path
 import re
 
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.parsing.instrumentation import instrument
+from scripts.parsing.kannada_text import clean_kannada
+
 
 def clean_text(text):
     """Clean and normalize text fields."""
@@ -62,22 +68,6 @@ def clean_english_word(text):
     return text
 
 
-def clean_kannada_word(text):
-    """Remove brackets and other non-text characters from Kannada words."""
-    if not text:
-        return ''
-    # Remove brackets: [], (), {}, etc.
-    cleaned = text.replace('[', '').replace(']', '').replace('(', '').replace(')', '')
-    cleaned = cleaned.replace('{', '').replace('}', '').replace('【', '').replace('】', '')
-    cleaned = cleaned.replace('「', '').replace('」', '').replace('〈', '').replace('〉', '')
-    cleaned = cleaned.replace('《', '').replace('》', '').replace('『', '').replace('』', '')
-    cleaned = cleaned.replace('〔', '').replace('〕', '').replace('［', '').replace('］', '')
-    cleaned = cleaned.replace('（', '').replace('）', '').replace('｛', '').replace('｝', '')
-    # Remove multiple spaces and trim
-    cleaned = ' '.join(cleaned.split())
-    return cleaned.strip()
-
-
 def contains_kannada_characters(text):
     """
     Check if text contains any Kannada script characters.
@@ -289,7 +279,7 @@ def parse_csv_to_yaml(csv_file_path, source_name=None, dict_title=None):
                 
                 # Create YAML entry immediately - no grouping
                 yaml_entry = {
-                    'entry': clean_kannada_word(kannada_word),  # Clean Kannada entry
+                    'entry': clean_kannada(kannada_word),  # Clean Kannada entry
                     'defs': [def_entry],  # Single definition per entry
                     'id': generate_entry_id(kannada_word, english_word, entry_index),
                     'source': source_name
@@ -373,5 +363,5 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
-
+    with instrument('csv_to_yaml_parser'):
+        main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Collapse near-duplicate dictionary entries before indexing.
+
+Exact deduplication keeps entries that differ only in case, trailing
+punctuation, non-breaking spaces or zero-width joiners ("House." vs "house",
+"ಮನೆ\\u200c" vs "ಮನೆ"). Each copy adds a posting to every word of its
+definition. Entries are grouped here by a normalized (kannada, english, type)
+key; the first entry of a group is kept as the canonical one and records the
+other dictionaries the group was found in.
+
+In the ultra-compact format a canonical entry with extra dictionaries becomes
+[kannada, english, type, ["source|dict_title", ...]] (type may be ''). The
+keys survive sharding and reordering of the dictionaries. EntryStore keeps
+them, and the reverse index lists them as "also" in the entry's postings.
+
+optimize_padakanaja_ultra.py applies the collapse when it writes the
+ultra-compact dictionary. Run this module to see what it saves:
+
+    python dedup_entries.py [--input padakanaja/combined_dictionaries_part1.json] [--output report.json]
+
+compares the reverse index built from the exact-deduplicated and the collapsed
+entries (postings, index size, chunk and overflow page counts) without
+writing any index files.
+"""
+
+import argparse
+import json
+import re
+import sys
+import unicodedata
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.parsing.entry_store import EntryStore
+from scripts.parsing.instrumentation import instrument, phase
+from scripts.parsing.json_stream import iter_json_members
+from scripts.parsing.kannada_text import INVISIBLE_RE, JOINERS_RE, normalize_kannada
+
+TRAILING_PUNCTUATION_RE = re.compile(r'[\s.,;:!?।]+$')
+
+
+def normalize_english(text):
+    """Definition as compared for duplicates: NFKC (NBSP -> space), casefolded, no trailing punctuation"""
+    text = unicodedata.normalize('NFKC', text or '')
+    text = JOINERS_RE.sub('', INVISIBLE_RE.sub('', text)).casefold()
+    text = re.sub(r'\s+', ' ', text).strip()
+    return TRAILING_PUNCTUATION_RE.sub('', text)
+
+
+def near_duplicate_key(kannada, english, type_str):
+    """Grouping key of an entry; a missing type counts as Noun like everywhere else"""
+    kannada = JOINERS_RE.sub('', normalize_kannada(kannada))
+    kannada = TRAILING_PUNCTUATION_RE.sub('', kannada)
+    return kannada, normalize_english(english), (type_str or 'Noun').strip().casefold()
+
+
+def collapse_near_duplicates(compact):
+    """Collapse near-duplicates of an ultra-compact dictionary {source|dict_title: [[k, e, t?], ...]}.
+
+    Returns (collapsed, stats); collapsed keeps the input's dictionary order.
+    """
+    canonical = {}  # key -> (dictionary of the kept entry, other dictionaries with the entry)
+    collapsed = {}
+    removed = 0
+    total = 0
+
+    for dict_key, entries in compact.items():
+        kept = []
+        for entry in entries:
+            total += 1
+            key = near_duplicate_key(entry[0], entry[1], entry[2] if len(entry) > 2 else '')
+            if key in canonical:
+                removed += 1
+                owner, also = canonical[key]
+                if dict_key != owner and dict_key not in also:
+                    also.append(dict_key)
+                continue
+            row = list(entry[:3])
+            canonical[key] = (dict_key, [])
+            kept.append((row, key))
+        if kept:
+            collapsed[dict_key] = kept
+
+    # Attach the extra dictionaries once all groups are complete
+    multi_source = 0
+    for dict_key, kept in collapsed.items():
+        rows = []
+        for row, key in kept:
+            also = canonical[key][1]
+            if also:
+                multi_source += 1
+                rows.append([row[0], row[1], row[2] if len(row) > 2 else '', also])
+            else:
+                rows.append(row)
+        collapsed[dict_key] = rows
+
+    stats = {'entries': total, 'removed': removed, 'kept': total - removed, 'multi_source': multi_source}
+    return collapsed, stats
+
+
+def index_footprint(compact):
+    """Postings, reverse index bytes and chunk count the compact dictionary would produce"""
+    from scripts.parsing.create_padakanaja_reverse_index import (
+        build_reverse_index,
+        paginate_postings,
+        split_into_chunks
+    )
+
+    reverse_index = build_reverse_index(EntryStore.from_compact(compact.items()))
+    head_index, overflow_pages, _ = paginate_postings(reverse_index)
+    chunks = split_into_chunks(head_index)
+    return {
+        'postings': sum(len(p) for p in reverse_index.values()),
+        'index_bytes': sum(len(json.dumps(c, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+                           for c in chunks),
+        'chunks': len(chunks),
+        'overflow_pages': len(overflow_pages)
+    }
+
+
+def report(input_file):
+    """Compare the index built with exact deduplication only and with near-duplicates collapsed"""
+    from scripts.parsing.optimize_padakanaja_ultra import compact_entries
+
+    print("=" * 80)
+    print("Near-Duplicate Collapse Report")
+    print("=" * 80)
+    print()
+
+    compact, _ = compact_entries(iter_json_members(input_file))
+
+    with phase('collapse_near_duplicates'):
+        collapsed, stats = collapse_near_duplicates(compact)
+    print(f"✓ {stats['removed']:,} of {stats['entries']:,} entries are near-duplicates "
+          f"({stats['removed'] / max(stats['entries'], 1) * 100:.1f}%), "
+          f"{stats['multi_source']:,} kept entries now list several dictionaries\n")
+
+    with phase('index_before'):
+        before = index_footprint(compact)
+    with phase('index_after'):
+        after = index_footprint(collapsed)
+
+    print("\n📊 Savings:")
+    for field in ('postings', 'index_bytes', 'chunks', 'overflow_pages'):
+        saved = before[field] - after[field]
+        percent = saved / before[field] * 100 if before[field] else 0
+        print(f"  {field:15s} {before[field]:>14,} -> {after[field]:>14,}  ({saved:,} saved, {percent:.1f}%)")
+    return {'collapse': stats, 'before': before, 'after': after}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Report what near-duplicate collapsing saves in the index')
+    parser.add_argument('--input', default='padakanaja/combined_dictionaries_part1.json',
+                        help='Combined dictionary JSON (input of optimize_padakanaja_ultra.py)')
+    parser.add_argument('--output', help='Save the report as JSON')
+    args = parser.parse_args()
+
+    result = report(args.input)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+        print(f"✓ Saved report to {args.output}")
+
+
+if __name__ == '__main__':
+    with instrument('dedup_entries'):
+        main()
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Compact in-memory store for expanded Padakanaja entries.
+
+Expanding the ultra-compact dictionary into one dict per entry costs ~270
+bytes of dict per entry before any of its strings, plus a separate copy of
+each entry's type string. EntryStore keeps the entries in parallel columns
+instead:
+
+    kannada, english   lists of str (the only per-entry objects)
+    type_codes         array of codes into a table of distinct types
+    dict_codes         array of codes into a table of (source, dict_title)
+    ids                {position: id} for the few entries that have one
+    also               {position: ("source|dict_title", ...)} of the other dictionaries
+                       a collapsed near-duplicate was found in (dedup_entries.py)
+
+Stages read rows() (plain tuples in FIELDS order), or entry_rows_with_also()
+where the other dictionaries matter. Iterating the store yields Entry records
+that also answer entry['english'] and entry.get('id', ''), like the dicts
+they replace.
+
+    store = EntryStore.load_ultra('padakanaja/combined_dictionaries_ultra.json')
+    for kannada, english, type_str, source, dict_title, entry_id in store.rows():
+        ...
+
+scripts/benchmarks/benchmark_entry_store.py measures the peak RSS of both
+representations.
+"""
+
+import sys
+from array import array
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.parsing.json_stream import iter_json_members
+
+FIELDS = ('kannada', 'english', 'type', 'source', 'dict_title', 'id')
+
+
+class Entry:
+    """One entry of an EntryStore; readable as a mapping of FIELDS"""
+
+    __slots__ = FIELDS
+
+    def __init__(self, kannada, english, type_str, source, dict_title, entry_id=''):
+        self.kannada = kannada
+        self.english = english
+        self.type = type_str
+        self.source = source
+        self.dict_title = dict_title
+        self.id = entry_id
+
+    def __getitem__(self, key):
+        if key not in FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in FIELDS else default
+
+    def keys(self):
+        return FIELDS
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in FIELDS}
+
+    def __repr__(self):
+        return f'Entry({self.to_dict()!r})'
+
+
+class EntryStore:
+    """Append-only column store of (kannada, english, type, source, dict_title, id) entries"""
+
+    def __init__(self):
+        self.kannada = []
+        self.english = []
+        self.type_codes = array('I')
+        self.dict_codes = array('I')
+        self.types = []  # code -> type string
+        self.dicts = []  # code -> (source, dict_title)
+        self.ids = {}  # position -> id (most entries have none)
+        self.also = {}  # position -> other "source|dict_title" keys (collapsed near-duplicates only)
+        self._type_codes = {}
+        self._dict_codes = {}
+
+    def __len__(self):
+        return len(self.kannada)
+
+    def dict_code(self, source, dict_title):
+        """Code of a (source, dict_title) pair, added on first use"""
+        key = (source, dict_title)
+        code = self._dict_codes.get(key)
+        if code is None:
+            code = self._dict_codes[key] = len(self.dicts)
+            self.dicts.append((sys.intern(source), sys.intern(dict_title)))
+        return code
+
+    def type_code(self, type_str):
+        code = self._type_codes.get(type_str)
+        if code is None:
+            code = self._type_codes[type_str] = len(self.types)
+            self.types.append(sys.intern(type_str))
+        return code
+
+    def append(self, kannada, english, type_str, source, dict_title, entry_id='', also=()):
+        if entry_id:
+            self.ids[len(self.kannada)] = entry_id
+        if also:
+            self.also[len(self.kannada)] = tuple(also)
+        self.kannada.append(kannada)
+        self.english.append(english)
+        self.type_codes.append(self.type_code(type_str))
+        self.dict_codes.append(self.dict_code(source, dict_title))
+
+    def extend_compact(self, dict_key, rows):
+        """Add the [kannada, english, type?, also?] rows of one ultra-compact dictionary"""
+        source, dict_title = dict_key.split('|', 1) if '|' in dict_key else (dict_key, '')
+        dict_code = self.dict_code(source, dict_title)
+        type_code = self.type_code
+        for row in rows:
+            if isinstance(row, list) and len(row) >= 2:
+                if len(row) > 3 and row[3]:
+                    self.also[len(self.kannada)] = tuple(row[3])
+                self.kannada.append(row[0])
+                self.english.append(row[1])
+                self.type_codes.append(type_code(row[2] if len(row) > 2 and row[2] else 'Noun'))
+                self.dict_codes.append(dict_code)
+
+    @classmethod
+    def from_compact(cls, items):
+        """Store of an ultra-compact dictionary given as (source|dict_title, rows) pairs"""
+        store = cls()
+        for dict_key, rows in items:
+            if isinstance(rows, list):
+                store.extend_compact(dict_key, rows)
+        return store
+
+    @classmethod
+    def load_ultra(cls, ultra_file):
+        """Store of combined_dictionaries_ultra.json, read one dictionary at a time"""
+        return cls.from_compact(iter_json_members(ultra_file))
+
+    def row(self, position):
+        source, dict_title = self.dicts[self.dict_codes[position]]
+        return (self.kannada[position], self.english[position], self.types[self.type_codes[position]],
+                source, dict_title, self.ids.get(position, ''))
+
+    def rows(self):
+        """(kannada, english, type, source, dict_title, id) tuples in insertion order"""
+        types = self.types
+        dicts = self.dicts
+        ids = self.ids
+        if not ids:
+            for kannada, english, type_code, dict_code in zip(self.kannada, self.english,
+                                                              self.type_codes, self.dict_codes):
+                source, dict_title = dicts[dict_code]
+                yield kannada, english, types[type_code], source, dict_title, ''
+            return
+        for position, (kannada, english, type_code, dict_code) in enumerate(
+                zip(self.kannada, self.english, self.type_codes, self.dict_codes)):
+            source, dict_title = dicts[dict_code]
+            yield kannada, english, types[type_code], source, dict_title, ids.get(position, '')
+
+    def __getitem__(self, position):
+        return Entry(*self.row(position))
+
+    def __iter__(self):
+        for row in self.rows():
+            yield Entry(*row)
+
+
+def entry_rows(entries):
+    """rows() of an EntryStore, or the same tuples from any iterable of entry mappings"""
+    if isinstance(entries, EntryStore):
+        return entries.rows()
+    return ((entry['kannada'], entry['english'], entry['type'], entry['source'], entry['dict_title'],
+             entry.get('id', '')) for entry in entries)
+
+
+def entry_rows_with_also(entries):
+    """(row, also) pairs: entry_rows() with the other "source|dict_title" keys of each entry"""
+    if isinstance(entries, EntryStore):
+        also = entries.also
+        return ((row, also.get(position, ())) for position, row in enumerate(entries.rows()))
+    return (((entry['kannada'], entry['english'], entry['type'], entry['source'], entry['dict_title'],
+              entry.get('id', '')), tuple(entry.get('also', ()))) for entry in entries)
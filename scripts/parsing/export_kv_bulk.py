@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Export the Padakanaja reverse index as per-term KV keys for bulk upload.
+
+Instead of packing thousands of words into one ~20MB chunk value, every word
+(or a small hash bucket of words) becomes its own KV key, so a lookup only
+transfers kilobytes. Output is bulk-upload JSON ([{"key", "value"}, ...])
+batched to the Cloudflare bulk API limits, for `wrangler kv bulk put`
+(see workers/upload_kv_bulk.sh).
+
+Usage:
+    python export_kv_bulk.py [--index-dir padakanaja] [--buckets 0]
+
+--buckets 0 writes one key per word (padakanaja_term_<word>); --buckets N
+hashes words into N keys (padakanaja_bucket_<n>) with FNV-1a, which the
+Worker computes the same way.
+"""
+
+import argparse
+import json
+from collections import defaultdict
+from pathlib import Path
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.parsing.chunk_codec import chunk_part, find_chunk_files, read_chunk_file
+from scripts.parsing.instrumentation import instrument
+
+# Cloudflare KV bulk API limits (per request)
+MAX_PAIRS_PER_BATCH = 10000
+MAX_BATCH_BYTES = 95 * 1024 * 1024  # 100MB limit, minus headroom for JSON framing
+MAX_KEY_BYTES = 512
+MAX_VALUE_BYTES = 25 * 1024 * 1024
+
+LAYOUT_KEY = 'padakanaja_kv_layout'
+
+
+def fnv1a_32(text):
+    """FNV-1a 32-bit hash of the UTF-8 bytes (same as fnv1a32 in the Worker)"""
+    hash_value = 0x811c9dc5
+    for byte in text.encode('utf-8'):
+        hash_value ^= byte
+        hash_value = (hash_value * 0x01000193) & 0xffffffff
+    return hash_value
+
+
+def term_key(word, buckets=0):
+    """KV key holding a word (same as getTermKey in the Worker)"""
+    if buckets > 0:
+        return f'padakanaja_bucket_{fnv1a_32(word) % buckets}'
+    return f'padakanaja_term_{word}'
+
+
+def load_reverse_index_chunks(index_dir):
+    """Load all regular reverse index chunks (the hot chunk part0 only duplicates words)"""
+    index_path = Path(index_dir)
+    reverse_index = {}
+    chunk_files = find_chunk_files(index_path)
+    for chunk_file in chunk_files:
+        if chunk_part(chunk_file)[0] == 0:
+            continue
+        print(f"  Reading {chunk_file.name}...")
+        reverse_index.update(read_chunk_file(chunk_file))
+    print(f"✓ Loaded {len(reverse_index):,} words from {len(chunk_files)} chunks")
+    return reverse_index
+
+
+def build_kv_pairs(reverse_index, buckets=0):
+    """Group words into KV values: {key: {word: postings}}"""
+    values = defaultdict(dict)
+    skipped = 0
+    for word in sorted(reverse_index):
+        key = term_key(word, buckets)
+        if len(key.encode('utf-8')) > MAX_KEY_BYTES:
+            skipped += 1
+            continue
+        values[key][word] = reverse_index[word]
+    if skipped:
+        print(f"⚠ Skipped {skipped:,} words whose key exceeds {MAX_KEY_BYTES} bytes")
+    return values
+
+
+def batch_pairs(pairs):
+    """Split (key, value_string) pairs into batches within the bulk API limits"""
+    batches = []
+    current = []
+    current_bytes = 0
+    for key, value in pairs:
+        pair_bytes = len(key.encode('utf-8')) + len(value.encode('utf-8')) + 32
+        if current and (len(current) >= MAX_PAIRS_PER_BATCH or current_bytes + pair_bytes > MAX_BATCH_BYTES):
+            batches.append(current)
+            current = []
+            current_bytes = 0
+        current.append({'key': key, 'value': value})
+        current_bytes += pair_bytes
+    if current:
+        batches.append(current)
+    return batches
+
+
+def export_kv_bulk(index_dir='padakanaja', buckets=0, output_dir=None):
+    """Write bulk-upload files for the per-term KV layout"""
+    print("=" * 80)
+    print("Exporting Per-Term KV Layout")
+    print("=" * 80)
+    print()
+
+    index_path = Path(index_dir)
+    output_path = Path(output_dir) if output_dir else index_path / 'kv_bulk'
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    reverse_index = load_reverse_index_chunks(index_path)
+    values = build_kv_pairs(reverse_index, buckets)
+
+    pairs = []
+    oversized = 0
+    value_sizes = []
+    for key, value in values.items():
+        value_json = json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+        size = len(value_json.encode('utf-8'))
+        if size > MAX_VALUE_BYTES:
+            oversized += 1
+            continue
+        value_sizes.append(size)
+        pairs.append((key, value_json))
+    if oversized:
+        print(f"⚠ Skipped {oversized:,} values over the 25MB KV limit (use more --buckets)")
+
+    # Overflow pages and their index (deep pagination) keep their keys
+    overflow_dir = index_path / 'padakanaja_reverse_index_overflow'
+    for page_file in sorted(overflow_dir.glob('*.json')) if overflow_dir.exists() else []:
+        pairs.append((page_file.stem, page_file.read_text(encoding='utf-8')))
+    for name in ('padakanaja_reverse_index_overflow_index', 'padakanaja_reverse_index_metadata'):
+        extra_file = index_path / f'{name}.json'
+        if extra_file.exists():
+            pairs.append((name, extra_file.read_text(encoding='utf-8')))
+
+    # Layout descriptor last: the Worker switches to per-term lookups once it exists
+    layout = {
+        'mode': 'bucket' if buckets > 0 else 'term',
+        'buckets': buckets,
+        'hash': 'fnv1a32',
+        'words': len(reverse_index),
+        'keys': len(values)
+    }
+    pairs.append((LAYOUT_KEY, json.dumps(layout)))
+
+    batches = batch_pairs(pairs)
+    for old_file in output_path.glob('padakanaja_kv_bulk_*.json'):
+        old_file.unlink()
+    for i, batch in enumerate(batches, 1):
+        batch_file = output_path / f'padakanaja_kv_bulk_{i}.json'
+        with open(batch_file, 'w', encoding='utf-8') as f:
+            json.dump(batch, f, ensure_ascii=False, separators=(',', ':'))
+        size_mb = batch_file.stat().st_size / 1024 / 1024
+        print(f"  ✓ {batch_file.name}: {len(batch):,} keys ({size_mb:.2f} MB)")
+
+    value_sizes.sort()
+    if value_sizes:
+        median_kb = value_sizes[len(value_sizes) // 2] / 1024
+        p99_kb = value_sizes[min(len(value_sizes) - 1, int(len(value_sizes) * 0.99))] / 1024
+        print(f"\n✓ {len(values):,} term keys: median {median_kb:.1f} KB, p99 {p99_kb:.1f} KB per lookup")
+    print(f"✓ Wrote {len(batches)} bulk file(s) to {output_path}")
+    print(f"  Upload with: ./workers/upload_kv_bulk.sh")
+    return batches
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Export per-term KV keys as bulk-upload JSON')
+    parser.add_argument('--index-dir', default='padakanaja', help='Directory with built reverse index chunks')
+    parser.add_argument('--buckets', type=int, default=0,
+                        help='Hash words into N bucket keys (default: 0 = one key per word)')
+    parser.add_argument('--output-dir', help='Output directory (default: <index-dir>/kv_bulk)')
+    args = parser.parse_args()
+
+    export_kv_bulk(args.index_dir, args.buckets, args.output_dir)
+
+
+if __name__ == '__main__':
+    with instrument('export_kv_bulk'):
+        main()
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Write the built reverse index straight into the local miniflare KV store.
+
+`wrangler dev` serves KV from .wrangler/state/v3/kv/: one SQLite file per
+namespace (key -> blob id) plus a blobs/ directory holding the values.
+Writing there directly replaces one `wrangler kv key put` per key with a
+single transaction, so a new index layout can be exercised locally seconds
+after it is built.
+
+Layouts:
+- chunks: chunk index, metadata, chunks and overflow pages under the keys the
+  Worker reads (same keys as workers/upload_reverse_index_kv.sh)
+- bulk: the per-term bulk files written by export_kv_bulk.py
+
+Stop `wrangler dev` before exporting; it keeps the store open.
+
+Usage:
+    python export_kv_local.py [--layout chunks|bulk] [--index-dir padakanaja] [--clear]
+    python export_kv_local.py --config workers/wrangler.test.toml
+"""
+
+import argparse
+import hashlib
+import hmac
+import json
+import os
+import re
+import shutil
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.parsing.chunk_codec import CHUNK_PREFIX, chunk_part, find_chunk_files, read_chunk_file
+from scripts.parsing.export_kv_bulk import LAYOUT_KEY
+from scripts.parsing.instrumentation import instrument, phase
+
+DEFAULT_STATE_DIR = '.wrangler/state/v3'
+DEFAULT_CONFIG = 'workers/wrangler.toml'
+
+# Durable Object class miniflare stores KV namespaces in
+KV_OBJECT_CLASS = 'miniflare-KVNamespaceObject'
+
+ENTRIES_SCHEMA = """
+CREATE TABLE IF NOT EXISTS _mf_entries (
+  key TEXT PRIMARY KEY,
+  blob_id TEXT NOT NULL,
+  expiration INTEGER,
+  metadata TEXT
+);
+CREATE INDEX IF NOT EXISTS _mf_entries_expiration_idx ON _mf_entries(expiration);
+"""
+
+
+def namespace_id_from_config(config_file=DEFAULT_CONFIG, binding='DICTIONARY'):
+    """KV namespace id of a binding in wrangler.toml"""
+    text = Path(config_file).read_text(encoding='utf-8')
+    for block in text.split('[[kv_namespaces]]')[1:]:
+        if re.search(rf'^\s*binding\s*=\s*"{re.escape(binding)}"', block, re.MULTILINE):
+            match = re.search(r'^\s*id\s*=\s*"([^"]+)"', block, re.MULTILINE)
+            if match:
+                return match.group(1)
+    raise ValueError(f"No KV namespace bound to {binding} in {config_file}")
+
+
+def object_id_from_name(name, object_class=KV_OBJECT_CLASS):
+    """Durable Object id for idFromName(name), as workerd derives it (names the SQLite file)"""
+    key = hashlib.sha256(object_class.encode('utf-8')).digest()
+    base = hmac.new(key, name.encode('utf-8'), hashlib.sha256).digest()[:16]
+    mac = hmac.new(key, base, hashlib.sha256).digest()[:16]
+    return (base + mac).hex()
+
+
+def new_blob_id():
+    """Random 32 bytes followed by the big-endian millisecond timestamp (miniflare's blob id format)"""
+    return os.urandom(32).hex() + int(time.time() * 1000).to_bytes(8, 'big').hex()
+
+
+class LocalKvStore:
+    """One namespace of the miniflare KV store on disk"""
+
+    def __init__(self, namespace_id, state_dir=DEFAULT_STATE_DIR):
+        kv_dir = Path(state_dir) / 'kv'
+        self.blob_dir = kv_dir / namespace_id / 'blobs'
+        self.db_file = kv_dir / KV_OBJECT_CLASS / f'{object_id_from_name(namespace_id)}.sqlite'
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.db_file)
+        self.conn.executescript(ENTRIES_SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def keys(self):
+        return [row[0] for row in self.conn.execute('SELECT key FROM _mf_entries')]
+
+    def _blob_ids(self, keys):
+        blob_ids = []
+        for key in keys:
+            row = self.conn.execute('SELECT blob_id FROM _mf_entries WHERE key = ?', (key,)).fetchone()
+            if row:
+                blob_ids.append(row[0])
+        return blob_ids
+
+    def _remove_blobs(self, blob_ids):
+        for blob_id in blob_ids:
+            (self.blob_dir / blob_id).unlink(missing_ok=True)
+
+    def put_many(self, pairs):
+        """Store (key, value) pairs in one transaction; values are bytes, str or a file Path.
+
+        Returns the number of bytes written.
+        """
+        replaced = []
+        written = []
+        total_bytes = 0
+        try:
+            with self.conn:
+                for key, value in pairs:
+                    blob_id = new_blob_id()
+                    blob_file = self.blob_dir / blob_id
+                    if isinstance(value, Path):
+                        shutil.copyfile(value, blob_file)
+                    else:
+                        blob_file.write_bytes(value.encode('utf-8') if isinstance(value, str) else value)
+                    written.append(blob_id)
+                    total_bytes += blob_file.stat().st_size
+                    replaced += self._blob_ids([key])
+                    self.conn.execute('INSERT OR REPLACE INTO _mf_entries (key, blob_id, expiration, metadata) '
+                                      'VALUES (?, ?, NULL, NULL)', (key, blob_id))
+        except BaseException:
+            self._remove_blobs(written)
+            raise
+        # Old values are only unreachable once the new rows are committed
+        self._remove_blobs(replaced)
+        return total_bytes
+
+    def delete(self, keys):
+        keys = list(keys)
+        blob_ids = self._blob_ids(keys)
+        with self.conn:
+            self.conn.executemany('DELETE FROM _mf_entries WHERE key = ?', [(key,) for key in keys])
+        self._remove_blobs(blob_ids)
+        return len(blob_ids)
+
+
+def chunk_layout_pairs(index_dir):
+    """(key, file) pairs of the chunked reverse index, keyed like upload_reverse_index_kv.sh"""
+    index_path = Path(index_dir)
+    pairs = []
+    for name in ('padakanaja_reverse_index_chunk_index', 'padakanaja_reverse_index_metadata',
+                 'padakanaja_reverse_index_overflow_index'):
+        path = index_path / f'{name}.json'
+        if path.exists():
+            pairs.append((name, path))
+    for path in find_chunk_files(index_path):
+        number, suffix = chunk_part(path)
+        key = f'{CHUNK_PREFIX}{number}'
+        if suffix == '.json':
+            pairs.append((key, path))
+        else:
+            # The Worker parses chunk values as JSON, so compact chunks are stored decoded
+            pairs.append((key, json.dumps(read_chunk_file(path), ensure_ascii=False, separators=(',', ':'))))
+    overflow_dir = index_path / 'padakanaja_reverse_index_overflow'
+    for path in sorted(overflow_dir.glob('*.json')) if overflow_dir.exists() else []:
+        pairs.append((path.stem, path))
+    return pairs
+
+
+def bulk_layout_pairs(bulk_dir):
+    """(key, value) pairs from export_kv_bulk.py bulk-upload files"""
+    pairs = []
+    for bulk_file in sorted(Path(bulk_dir).glob('padakanaja_kv_bulk_*.json'),
+                            key=lambda p: int(p.stem.rsplit('_', 1)[1])):
+        with open(bulk_file, 'r', encoding='utf-8') as f:
+            pairs.extend((item['key'], item['value']) for item in json.load(f))
+    return pairs
+
+
+def export_kv_local(index_dir='padakanaja', layout='chunks', namespace_id=None,
+                    state_dir=DEFAULT_STATE_DIR, clear=False):
+    """Write one index layout into the local KV namespace"""
+    print("=" * 80)
+    print("Exporting to Local KV Store")
+    print("=" * 80)
+    print()
+
+    namespace_id = namespace_id or namespace_id_from_config()
+    if layout == 'bulk':
+        pairs = bulk_layout_pairs(Path(index_dir) / 'kv_bulk')
+    else:
+        pairs = chunk_layout_pairs(index_dir)
+    if not pairs:
+        print(f"❌ Nothing to export for the {layout} layout in {index_dir}")
+        return None
+
+    start = time.perf_counter()
+    with LocalKvStore(namespace_id, state_dir) as store:
+        print(f"📦 Namespace {namespace_id}: {store.db_file}")
+        if clear:
+            removed = store.delete(store.keys())
+            print(f"🗑  Cleared {removed:,} existing keys")
+        elif layout == 'chunks' and LAYOUT_KEY in store.keys():
+            # The Worker prefers the per-term layout whenever its descriptor exists
+            store.delete([LAYOUT_KEY])
+            print(f"🗑  Removed {LAYOUT_KEY} so the Worker reads chunks")
+
+        with phase('write_kv', keys=len(pairs)):
+            total_bytes = store.put_many(pairs)
+        key_count = len(store.keys())
+
+    elapsed = time.perf_counter() - start
+    print(f"✓ Wrote {len(pairs):,} keys ({total_bytes / 1024 / 1024:.2f} MB) in {elapsed:.2f}s")
+    print(f"  Namespace now holds {key_count:,} keys")
+    print(f"  Start the Worker with: cd workers && npx wrangler dev --persist-to "
+          f"{os.path.relpath(Path(state_dir).parent, 'workers')}")
+    return {'keys': len(pairs), 'bytes': total_bytes, 'seconds': elapsed}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Write the built index into the local miniflare KV store')
+    parser.add_argument('--index-dir', default='padakanaja', help='Directory with built reverse index chunks')
+    parser.add_argument('--layout', choices=['chunks', 'bulk'], default='chunks',
+                        help='chunks (default) or the per-term bulk files from export_kv_bulk.py')
+    parser.add_argument('--config', default=DEFAULT_CONFIG, help='wrangler.toml with the DICTIONARY binding')
+    parser.add_argument('--namespace-id', help='KV namespace id (default: from --config)')
+    parser.add_argument('--state-dir', default=DEFAULT_STATE_DIR, help='Wrangler state directory')
+    parser.add_argument('--clear', action='store_true', help='Delete every existing key first')
+    args = parser.parse_args()
+
+    namespace_id = args.namespace_id or namespace_id_from_config(args.config)
+    result = export_kv_local(args.index_dir, args.layout, namespace_id, args.state_dir, args.clear)
+    if result is None:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    with instrument('export_kv_local'):
+        main()
@@ -1,12 +1,14 @@
 #!/usr/bin/env python3
 """
 Generate reverse index for Alar dictionary.
-Downloads Alar YAML and generates a pre-built reverse index.
+Reads the local Alar snapshot (see alar_snapshot.py) and generates a
+pre-built reverse index.
+
+Usage:
+    python generate_alar_reverse_index.py [--offline]
 """
 
-import yaml
 import json
-import requests
 from pathlib import Path
 import sys
 import re
@@ -14,39 +16,37 @@ import re
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from scripts.parsing.generate_reverse_index import (
-    clean_kannada_entry,
-    normalize_type,
-    extract_words
-)
-
-
-def download_alar_yaml(url: str = 'https://raw.githubusercontent.com/alar-dict/data/master/alar.yml'):
-    """Download Alar dictionary YAML file."""
-    print(f"Downloading Alar dictionary from: {url}")
-    response = requests.get(url)
-    response.raise_for_status()
-    return yaml.safe_load(response.text)
+from scripts.parsing.generate_reverse_index import normalize_type, extract_words
+from scripts.parsing.ranking import compute_posting_scores, sort_postings
+from scripts.parsing.instrumentation import instrument
+from scripts.parsing.kannada_text import clean_kannada
+from scripts.parsing.alar_snapshot import ALAR_URL, SnapshotMissing, load_alar_entries
 
 
 def generate_alar_reverse_index(
-    alar_url: str = 'https://raw.githubusercontent.com/alar-dict/data/master/alar.yml',
-    output_file: str = 'padakanaja/alar_reverse_index.json'
+    alar_url: str = ALAR_URL,
+    output_file: str = 'padakanaja/alar_reverse_index.json',
+    offline: bool = None
 ):
     """
     Generate reverse index for Alar dictionary.
     
     Args:
-        alar_url: URL to Alar dictionary YAML
+        alar_url: URL to Alar dictionary YAML (only fetched when there is no snapshot yet)
         output_file: Path to output JSON file
+        offline: Never download; None follows RALA_OFFLINE
     """
     print("=" * 80)
     print("Generating Alar Reverse Index")
     print("=" * 80)
     print()
     
-    # Download Alar dictionary
-    entries = download_alar_yaml(alar_url)
+    # Load Alar dictionary from the local snapshot
+    try:
+        entries = load_alar_entries(alar_url, offline=offline)
+    except SnapshotMissing as e:
+        print(f"Error: {e}")
+        sys.exit(1)
     
     if not entries or not isinstance(entries, list):
         print("Error: Invalid Alar dictionary format")
@@ -64,7 +64,7 @@ def generate_alar_reverse_index(
             continue
         
         entry_id = entry.get('id', '')
-        kannada = clean_kannada_entry(entry.get('entry', ''))
+        kannada = clean_kannada(entry.get('entry', ''))
         phone = entry.get('phone', '')
         head = entry.get('head', '')
         dict_title = entry.get('dict_title', "V. Krishna's Alar")
@@ -92,14 +92,22 @@ def generate_alar_reverse_index(
                 'source': source
             }
             
-            # Add to reverse index for each word
-            for word in words:
+            # Add to reverse index for each word (score is per word, so copy the entry)
+            scores = compute_posting_scores(words, definition, kannada, source, type_str)
+            for word, score in zip(words, scores):
                 all_english_words.add(word)
                 if word not in reverse_index:
                     reverse_index[word] = []
-                reverse_index[word].append(index_entry)
+                reverse_index[word].append({
+                    **index_entry,
+                    'score': score
+                })
                 total_entries += 1
     
+    # Store postings pre-sorted by relevance so the first page is the head of the list
+    for postings in reverse_index.values():
+        sort_postings(postings, definition_field='definition')
+    
     print(f"✓ Built reverse index:")
     print(f"  Total words: {len(reverse_index):,}")
     print(f"  Total entries: {total_entries:,}")
@@ -141,6 +149,5 @@ def generate_alar_reverse_index(
 
 
 if __name__ == '__main__':
-    generate_alar_reverse_index()
-
-
+    with instrument('generate_alar_reverse_index'):
+        generate_alar_reverse_index(offline=True if '--offline' in sys.argv[1:] else None)
@@ -2,12 +2,21 @@
 """
 Generate a pre-filtered list of English words for the glossary page.
 This is much faster than generating it on-the-fly in the browser.
+
+Usage:
+    python generate_glossary_words.py [alar.yml] [output.json] [--offline]
 """
 
-import yaml
 import json
 import re
 from pathlib import Path
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.parsing.instrumentation import instrument
+from scripts.parsing.alar_snapshot import ALAR_URL, load_alar_entries
 
 def extract_words(text):
     """Extract meaningful English words from text."""
@@ -77,19 +86,14 @@ def is_junk_word(word):
     
     return False
 
-def generate_glossary_words(yaml_url=None, yaml_file=None, output_file='glossary_words.json'):
-    """Generate filtered word list from Alar YAML."""
+def generate_glossary_words(yaml_url=None, yaml_file=None, output_file='glossary_words.json', offline=None):
+    """Generate filtered word list from Alar YAML (read through the Alar snapshot)."""
     
     # Load YAML
     if yaml_file:
-        print(f"Loading YAML from file: {yaml_file}")
-        with open(yaml_file, 'r', encoding='utf-8') as f:
-            entries = yaml.safe_load(f)
+        entries = load_alar_entries(yaml_file, offline=offline)
     elif yaml_url:
-        import urllib.request
-        print(f"Loading YAML from URL: {yaml_url}")
-        with urllib.request.urlopen(yaml_url) as response:
-            entries = yaml.safe_load(response.read().decode('utf-8'))
+        entries = load_alar_entries(yaml_url, offline=offline)
     else:
         raise ValueError("Either yaml_url or yaml_file must be provided")
     
@@ -134,26 +138,27 @@ def generate_glossary_words(yaml_url=None, yaml_file=None, output_file='glossary
     return word_list
 
 if __name__ == '__main__':
-    import sys
-    
-    # Default: use GitHub URL
-    yaml_url = 'https://raw.githubusercontent.com/alar-dict/data/master/alar.yml'
-    output_file = 'glossary_words.json'
-    
-    if len(sys.argv) > 1:
-        # If argument provided, treat as local file
-        yaml_file = sys.argv[1]
-        yaml_url = None
-    else:
-        yaml_file = None
-    
-    if len(sys.argv) > 2:
-        output_file = sys.argv[2]
-    
-    try:
-        words = generate_glossary_words(yaml_url=yaml_url, yaml_file=yaml_file, output_file=output_file)
-        print(f"\n✅ Success! Generated {len(words)} words")
-    except Exception as e:
-        print(f"\n❌ Error: {e}", file=sys.stderr)
-        sys.exit(1)
+    with instrument('generate_glossary_words'):
+        # Default: use GitHub URL
+        yaml_url = ALAR_URL
+        output_file = 'glossary_words.json'
+        offline = True if '--offline' in sys.argv[1:] else None
+        args = [arg for arg in sys.argv[1:] if arg != '--offline']
+
+        if len(args) > 0:
+            # If argument provided, treat as local file
+            yaml_file = args[0]
+            yaml_url = None
+        else:
+            yaml_file = None
+
+        if len(args) > 1:
+            output_file = args[1]
 
+        try:
+            words = generate_glossary_words(yaml_url=yaml_url, yaml_file=yaml_file, output_file=output_file,
+                                            offline=offline)
+            print(f"\n✅ Success! Generated {len(words)} words")
+        except Exception as e:
+            print(f"\n❌ Error: {e}", file=sys.stderr)
+            sys.exit(1)
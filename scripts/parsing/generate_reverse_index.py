@@ -4,7 +4,6 @@ Generate a pre-built reverse index JSON file from dictionary YAML files.
 This allows the frontend to load the index directly instead of building it client-side.
 """
 
-import yaml
 import json
 from pathlib import Path
 import sys
@@ -14,22 +13,10 @@ import re
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from scripts.parsing.batch_parse_padakanaja import get_dictionary_title
-
-
-def clean_kannada_entry(text):
-    """Remove brackets and other non-text characters from Kannada words."""
-    if not text:
-        return ''
-    # Remove brackets: [], (), {}, etc.
-    cleaned = text.replace('[', '').replace(']', '').replace('(', '').replace(')', '')
-    cleaned = cleaned.replace('{', '').replace('}', '').replace('【', '').replace('】', '')
-    cleaned = cleaned.replace('「', '').replace('」', '').replace('〈', '').replace('〉', '')
-    cleaned = cleaned.replace('《', '').replace('》', '').replace('『', '').replace('』', '')
-    cleaned = cleaned.replace('〔', '').replace('〕', '').replace('［', '').replace('］', '')
-    cleaned = cleaned.replace('（', '').replace('）', '').replace('｛', '').replace('｝', '')
-    # Remove multiple spaces and trim
-    cleaned = ' '.join(cleaned.split())
-    return cleaned.strip()
+from scripts.parsing.ranking import compute_posting_scores, sort_postings
+from scripts.parsing.instrumentation import instrument
+from scripts.parsing.kannada_text import clean_kannada
+from scripts.parsing.yaml_stream import iter_yaml_entries
 
 
 def normalize_type(type_str):
@@ -88,18 +75,13 @@ def build_reverse_index_from_yaml(yaml_file_path):
     all_english_words = set()
     
     print(f"Loading: {yaml_file_path.name}")
-    with open(yaml_file_path, 'r', encoding='utf-8') as f:
-        entries = yaml.safe_load(f)
-    
-    if not entries or not isinstance(entries, list):
-        return reverse_index, all_english_words
-    
-    for entry in entries:
+    # Entries are indexed as they are parsed; the document is never held in memory
+    for entry in iter_yaml_entries(yaml_file_path):
         if not entry.get('defs'):
             continue
         
         entry_id = entry.get('id', '')
-        kannada = clean_kannada_entry(entry.get('entry', ''))
+        kannada = clean_kannada(entry.get('entry', ''))
         phone = entry.get('phone', '')
         head = entry.get('head', '')
         dict_title = entry.get('dict_title', '')
@@ -127,12 +109,16 @@ def build_reverse_index_from_yaml(yaml_file_path):
                 'source': source
             }
             
-            # Add to reverse index for each word
-            for word in words:
+            # Add to reverse index for each word (score is per word, so copy the entry)
+            scores = compute_posting_scores(words, definition, kannada, source, type_str)
+            for word, score in zip(words, scores):
                 all_english_words.add(word)
                 if word not in reverse_index:
                     reverse_index[word] = []
-                reverse_index[word].append(index_entry)
+                reverse_index[word].append({
+                    **index_entry,
+                    'score': score
+                })
     
     return reverse_index, all_english_words
 
@@ -180,6 +166,10 @@ def generate_reverse_index(
         all_english_words.update(file_words)
         print(f"  ✓ Added {len(file_words)} words, {sum(len(e) for e in file_index.values())} entries")
     
+    # Store postings pre-sorted by relevance so the first page is the head of the list
+    for postings in combined_reverse_index.values():
+        sort_postings(postings, definition_field='definition')
+    
     print(f"\n✓ Built reverse index:")
     print(f"  Total words: {len(combined_reverse_index):,}")
     print(f"  Total entries: {total_entries:,}")
@@ -205,6 +195,5 @@ def generate_reverse_index(
 
 
 if __name__ == '__main__':
-    generate_reverse_index()
-
-
+    with instrument('generate_reverse_index'):
+        generate_reverse_index()
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Shared profiling and timing instrumentation for the pipeline scripts.
+
+Every entry point wraps its main code in instrument(), which understands:
+
+    --profile[=FILE]     write cProfile stats (default: <script>.prof)
+    --trace-memory       record tracemalloc peaks per phase (printed to stderr without --timing-log)
+    --timing-log FILE    append one JSON line with the run's phase timings
+
+The flags are removed from sys.argv before the script parses its own
+arguments, so they work with argparse and sys.argv scripts alike. A bare
+--profile never takes the next argument as its file (it may be the script's
+own positional argument); name the file with --profile=FILE. The
+environment variables RALA_PROFILE_DIR, RALA_TRACE_MEMORY=1 and
+RALA_TIMING_LOG do the same for runs started by other tools.
+
+Scripts and library functions mark phases with phase(); outside an
+instrumented run it does nothing:
+
+    if __name__ == '__main__':
+        with instrument('create_padakanaja_reverse_index'):
+            main()
+
+    with phase('build_reverse_index', entries=len(entries)):
+        ...
+"""
+
+import argparse
+import cProfile
+import json
+import os
+import resource
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+
+_active = None  # Instrumentation of the running script, if any
+
+
+def peak_rss_mb():
+    """Peak resident set size in MB (since the last /proc/self/clear_refs reset on Linux)"""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss / 1024 / 1024 if sys.platform == 'darwin' else max_rss / 1024  # bytes on macOS, KB on Linux
+
+
+class Instrumentation:
+    """Collects phase timings (and optionally profile and memory peaks) for one script run"""
+
+    def __init__(self, script, profile_file=None, trace_memory=False, timing_log=None):
+        self.script = script
+        self.profile_file = profile_file
+        self.trace_memory = trace_memory
+        self.timing_log = timing_log
+        self.phases = []
+        self._stack = []  # Open phases: [name, start, peak bytes seen by enclosing phase]
+        self._peak = 0  # Run-wide tracemalloc peak (phase() resets the counter)
+        self._profiler = None
+        self._started = None
+        self._start_time = None
+
+    @classmethod
+    def from_argv(cls, script):
+        """Take the instrumentation flags out of sys.argv (falling back to environment variables)"""
+        parser = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+        parser.add_argument('--trace-memory', action='store_true')
+        parser.add_argument('--timing-log')
+        args, remaining = parser.parse_known_args(sys.argv[1:])
+
+        # --profile takes its file only as --profile=FILE, so it never swallows a positional
+        profile = None
+        argv = []
+        for arg in remaining:
+            if arg == '--profile':
+                profile = ''
+            elif arg.startswith('--profile='):
+                profile = arg[len('--profile='):]
+            else:
+                argv.append(arg)
+        sys.argv = sys.argv[:1] + argv
+
+        profile_file = None
+        if profile is not None:
+            profile_file = profile or f'{script}.prof'
+        elif os.environ.get('RALA_PROFILE_DIR'):
+            profile_file = str(Path(os.environ['RALA_PROFILE_DIR']) / f'{script}.prof')
+
+        trace_memory = args.trace_memory or os.environ.get('RALA_TRACE_MEMORY') == '1'
+        timing_log = args.timing_log or os.environ.get('RALA_TIMING_LOG')
+        return cls(script, profile_file, trace_memory, timing_log)
+
+    @property
+    def enabled(self):
+        return bool(self.profile_file or self.trace_memory or self.timing_log)
+
+    def start(self):
+        self._started = time.strftime('%Y-%m-%dT%H:%M:%S')
+        self._start_time = time.perf_counter()
+        if self.trace_memory:
+            tracemalloc.start()
+        if self.profile_file:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+
+    def finish(self, status='ok'):
+        if self._profiler:
+            self._profiler.disable()
+            Path(self.profile_file).parent.mkdir(parents=True, exist_ok=True)
+            self._profiler.dump_stats(self.profile_file)
+            print(f"📈 Profile written to {self.profile_file} (view with: python -m pstats {self.profile_file})",
+                  file=sys.stderr)
+
+        record = {
+            'script': self.script,
+            'argv': sys.argv[1:],
+            'started': self._started,
+            'seconds': round(time.perf_counter() - self._start_time, 4),
+            'status': status,
+            'phases': self.phases
+        }
+        if self.trace_memory:
+            peak = max(self._peak, tracemalloc.get_traced_memory()[1])
+            record['tracemalloc_peak_mb'] = round(peak / 1024 / 1024, 2)
+            tracemalloc.stop()
+        if self.profile_file:
+            record['profile'] = self.profile_file
+
+        if self.timing_log:
+            Path(self.timing_log).parent.mkdir(parents=True, exist_ok=True)
+            with open(self.timing_log, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        elif self.trace_memory:
+            # No log to keep the peaks in, so show them
+            print(f"🧠 tracemalloc peak: {record['tracemalloc_peak_mb']:.2f} MB", file=sys.stderr)
+            for phase_record in self.phases:
+                print(f"  {phase_record['name']}: {phase_record['tracemalloc_peak_mb']:.2f} MB "
+                      f"in {phase_record['seconds']:.2f}s", file=sys.stderr)
+        return record
+
+    @contextmanager
+    def phase(self, name, **fields):
+        if self.trace_memory and self._stack:
+            # Fold the enclosing phase's peak so far before the counter is reset for this one
+            self._stack[-1][2] = max(self._stack[-1][2], tracemalloc.get_traced_memory()[1])
+        if self.trace_memory:
+            self._peak = max(self._peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+        path = '/'.join([entry[0] for entry in self._stack] + [name])
+        start = time.perf_counter()
+        self._stack.append([name, start, 0])
+        try:
+            yield
+        finally:
+            _, _, inner_peak = self._stack.pop()
+            record = {
+                'name': path,
+                'start': round(start - self._start_time, 4),
+                'seconds': round(time.perf_counter() - start, 4)
+            }
+            if self.trace_memory:
+                peak = max(inner_peak, tracemalloc.get_traced_memory()[1])
+                record['tracemalloc_peak_mb'] = round(peak / 1024 / 1024, 2)
+                self._peak = max(self._peak, peak)
+                if self._stack:
+                    self._stack[-1][2] = max(self._stack[-1][2], peak)
+            record.update(fields)
+            self.phases.append(record)
+
+
+@contextmanager
+def instrument(script):
+    """Run the enclosed entry-point code with the instrumentation requested on the command line"""
+    global _active
+    instrumentation = Instrumentation.from_argv(script)
+    if not instrumentation.enabled:
+        yield instrumentation
+        return
+
+    _active = instrumentation
+    instrumentation.start()
+    status = 'ok'
+    try:
+        yield instrumentation
+    except SystemExit as exit_error:
+        if exit_error.code not in (None, 0):
+            status = f'exit {exit_error.code}'
+        raise
+    except BaseException as error:
+        status = f'error: {type(error).__name__}: {error}'
+        raise
+    finally:
+        _active = None
+        instrumentation.finish(status)
+
+
+@contextmanager
+def phase(name, **fields):
+    """Mark a named phase of the running script (no-op when not instrumented)"""
+    if _active is None:
+        yield
+        return
+    with _active.phase(name, **fields):
+        yield
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Incremental reader for large JSON files (combined dictionaries, index chunks).
+
+json.load materialises the whole document; the combined and ultra-compact
+dictionaries and the reverse index chunks are tens of megabytes each, and
+most readers only walk their top level once. These generators read the file
+in blocks and decode one top-level value at a time with the stdlib decoder:
+
+    for key, value in iter_json_members('padakanaja/combined_dictionaries_ultra.json'):
+        ...
+    for item in iter_json_items('padakanaja/combined_dictionaries.json'):
+        ...
+
+Only the value being decoded (plus one read block) is held in memory. A value
+larger than the buffer is retried with a doubled buffer, so total work stays
+close to a single json.load.
+
+Usage:
+    python json_stream.py FILE [--compare]   # top-level values, time and peak memory (vs json.load)
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.parsing.instrumentation import instrument
+
+BLOCK_SIZE = 1 << 20  # Characters read at a time
+WHITESPACE = ' \t\n\r'
+
+
+class _Reader:
+    """Text buffer over a file that decodes JSON values and tokens at a position"""
+
+    def __init__(self, f, block_size=BLOCK_SIZE):
+        self.f = f
+        self.block_size = block_size
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self, size):
+        """Append at least size characters (fewer at end of file); False at EOF"""
+        if self.eof:
+            return False
+        # Drop what was consumed before growing the buffer
+        if self.pos:
+            self.buffer = self.buffer[self.pos:]
+            self.pos = 0
+        data = self.f.read(size)
+        if not data:
+            self.eof = True
+            return False
+        self.buffer += data
+        return True
+
+    def peek(self):
+        """Next non-whitespace character ('' at end of file)"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill(self.block_size):
+                return ''
+
+    def expect(self, chars):
+        char = self.peek()
+        if char == '' or char not in chars:
+            raise json.JSONDecodeError(f"Expected one of {chars!r}", self.buffer, self.pos)
+        self.pos += 1
+        return char
+
+    def value(self):
+        """Decode the JSON value at the current position"""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                # Most likely cut off by the buffer; retry with twice as much text
+                if not self._fill(max(self.block_size, len(self.buffer))):
+                    raise
+                continue
+            # A number at the buffer end ("12", "1.", "1e+") may continue in the next block
+            if isinstance(value, (int, float)) and end > len(self.buffer) - 3 and not self.eof:
+                self._fill(self.block_size)
+                continue
+            self.pos = end
+            return value
+
+
+def _open(source):
+    return open(source, 'r', encoding='utf-8')
+
+
+def json_top_level_type(source):
+    """dict or list, from the first character of the document"""
+    with _open(source) as f:
+        char = _Reader(f, 4096).peek()
+    if char == '{':
+        return dict
+    if char == '[':
+        return list
+    raise ValueError(f"{source}: top level is not an object or array")
+
+
+def iter_json_members(source, block_size=BLOCK_SIZE):
+    """Yield (key, value) for each member of a top-level JSON object, in file order"""
+    with _open(source) as f:
+        reader = _Reader(f, block_size)
+        reader.expect('{')
+        if reader.peek() == '}':
+            return
+        while True:
+            key = reader.value()
+            if not isinstance(key, str):
+                raise json.JSONDecodeError("Expected an object key", reader.buffer, reader.pos)
+            reader.expect(':')
+            yield key, reader.value()
+            if reader.expect(',}') == '}':
+                return
+
+
+def iter_json_items(source, block_size=BLOCK_SIZE):
+    """Yield each item of a top-level JSON array, in file order"""
+    with _open(source) as f:
+        reader = _Reader(f, block_size)
+        reader.expect('[')
+        if reader.peek() == ']':
+            return
+        while True:
+            yield reader.value()
+            if reader.expect(',]') == ']':
+                return
+
+
+def iter_json_top_level(source, block_size=BLOCK_SIZE):
+    """(key, value) of an object's members or (index, item) of an array's items"""
+    if json_top_level_type(source) is dict:
+        yield from iter_json_members(source, block_size)
+    else:
+        yield from enumerate(iter_json_items(source, block_size))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Stream the top-level values of a JSON file')
+    parser.add_argument('file', help='JSON file with a top-level object or array')
+    parser.add_argument('--compare', action='store_true', help='Also time json.load')
+    args = parser.parse_args()
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = sum(1 for _ in iter_json_top_level(args.file))
+    seconds = time.perf_counter() - start
+    peak_mb = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    tracemalloc.stop()
+    print(f"📄 {args.file}: {count:,} top-level values")
+    print(f"  streaming: {seconds:8.2f}s  peak {peak_mb:8.1f} MB")
+
+    if args.compare:
+        tracemalloc.start()
+        start = time.perf_counter()
+        with _open(args.file) as f:
+            json.load(f)
+        seconds = time.perf_counter() - start
+        peak_mb = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+        tracemalloc.stop()
+        print(f"  json.load: {seconds:8.2f}s  peak {peak_mb:8.1f} MB")
+
+
+if __name__ == '__main__':
+    with instrument('json_stream'):
+        main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Kannada text normalization shared by every pipeline stage.
+
+All cleaning goes through one normalization step, so the same word gets the
+same key in the YAML files, the reverse indexes, the merged dictionary and
+the Kannada index:
+
+    normalize_kannada(text)    NFC, invisible characters and stray joiners removed, whitespace collapsed
+    clean_kannada(text)        + bracket characters removed ("(ಮನೆ)" -> "ಮನೆ")
+    kannada_key(text)          + bracketed annotations, digits and all ZWJ/ZWNJ removed
+                               ("ಮನೆ (೧)" -> "ಮನೆ"); lookup key of the Kannada index and the
+                               merged dictionary
+    clean_kannada_display(text) + quotes, <> and ASCII digits removed; same as cleanKannadaEntry
+                               in the Worker and js/dictionary.js, for result formatting
+
+The dictionaries repeat the same Kannada strings across entries, dictionaries
+and stages, so each function memoises its results: a distinct string is
+normalized once per process. cache_stats() reports the hit rates.
+
+Usage:
+    python kannada_text.py "ಮನೆ (೧)" [...]
+"""
+
+import re
+import sys
+import unicodedata
+from functools import lru_cache
+
+CACHE_SIZE = 1 << 20  # Distinct strings kept per function (bounded for full-corpus builds)
+
+# Invisible characters that never change how a word renders
+INVISIBLE_RE = re.compile(r'[\u200B\u2060\uFEFF\u00AD]')
+# ZWNJ/ZWJ after a Kannada letter choose how it renders: a conjunct or an explicit virama
+# (ಅಡ್\u200cಹಾಕ್ vs ಅಡ್ಹಾಕ್), and a word-final virama (ಮೌಲ್ಯ್\u200c). Displayed text keeps those;
+# a joiner that follows anything else does nothing. Keys drop them all.
+JOINERS_RE = re.compile(r'[\u200C\u200D]+')
+STRAY_JOINERS_RE = re.compile(r'(?<![\u0C80-\u0CFF\u200C\u200D])[\u200C\u200D]+')
+BRACKETS_RE = re.compile(r'[\[\](){}【】「」〈〉《》『』〔〕［］（）｛｝]')
+ANNOTATION_RE = re.compile(r'[\(\[].*?[\)\]]')
+DIGITS_RE = re.compile(r'\d+')
+WHITESPACE_RE = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def normalize_kannada(text):
+    """NFC with invisible characters and stray joiners removed and whitespace collapsed"""
+    if not text:
+        return ''
+    text = unicodedata.normalize('NFC', text)
+    text = STRAY_JOINERS_RE.sub('', INVISIBLE_RE.sub('', text))
+    return WHITESPACE_RE.sub(' ', text).strip()
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def clean_kannada(text):
+    """Normalized text without bracket characters (the text inside is kept)"""
+    if not text:
+        return ''
+    cleaned = BRACKETS_RE.sub('', normalize_kannada(text))
+    return WHITESPACE_RE.sub(' ', cleaned).strip()
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def kannada_key(text):
+    """Lookup key: normalized text without bracketed annotations, digits or brackets"""
+    if not text:
+        return ''
+    normalized = JOINERS_RE.sub('', normalize_kannada(text))
+    key = clean_kannada(DIGITS_RE.sub('', ANNOTATION_RE.sub('', normalized)))
+    # A word written entirely in brackets keeps its text
+    return key or clean_kannada(DIGITS_RE.sub('', normalized))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def clean_kannada_display(text):
+    """Same as cleanKannadaEntry in the Worker and js/dictionary.js (JS \\d is ASCII-only)"""
+    if not text:
+        return ''
+    cleaned = BRACKETS_RE.sub('', normalize_kannada(text))
+    cleaned = re.sub(r'[<>"\']', '', cleaned)
+    cleaned = re.sub(r'[0-9]+', '', cleaned)
+    return WHITESPACE_RE.sub(' ', cleaned).strip()
+
+
+def cache_stats():
+    """Hits, misses and cached strings of each normalization cache"""
+    stats = {}
+    for func in (normalize_kannada, clean_kannada, kannada_key, clean_kannada_display):
+        info = func.cache_info()
+        stats[func.__name__] = {'hits': info.hits, 'misses': info.misses, 'size': info.currsize}
+    return stats
+
+
+def clear_caches():
+    for func in (normalize_kannada, clean_kannada, kannada_key, clean_kannada_display):
+        func.cache_clear()
+
+
+if __name__ == '__main__':
+    for arg in sys.argv[1:]:
+        print(f"{arg!r}")
+        print(f"  normalize: {normalize_kannada(arg)!r}")
+        print(f"  clean:     {clean_kannada(arg)!r}")
+        print(f"  key:       {kannada_key(arg)!r}")
+        print(f"  display:   {clean_kannada_display(arg)!r}")
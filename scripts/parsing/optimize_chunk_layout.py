@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Optimize the reverse index chunk layout from a query log.
+
+Multi-word queries often need words that sit in different alphabetical chunks,
+so the Worker fetches several ~20MB values. This stage reads a query log,
+groups words that are often queried together into the same chunk (under the
+byte budget) and reports the expected KV fetches per query before and after,
+along with the size of the chunk index the Worker loads for every query (a
+layout needs exact routes for words whose prefix spans several chunks).
+
+Usage:
+    python optimize_chunk_layout.py <query_log> [--index-dir padakanaja] [--max-size-mb 20]
+
+The layout is written to padakanaja/padakanaja_reverse_index_layout.json;
+rebuild with `create_padakanaja_reverse_index.py --layout <file>` to apply it.
+"""
+
+import argparse
+import json
+import sys
+from collections import defaultdict
+from itertools import combinations
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.parsing.create_padakanaja_reverse_index import (add_layout_routes, create_chunk_index,
+                                                              get_chunks_for_word, normalize_query_term,
+                                                              word_json_size)
+from scripts.parsing.instrumentation import instrument
+
+
+def load_query_log(log_file):
+    """Load queries from a log file.
+
+    JSON lines use their 'q', 'query' or 'title' field (e.g. requests.jsonl);
+    any other line is taken as one raw query.
+    """
+    queries = []
+    with open(log_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith('{'):
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    record = None
+                if isinstance(record, dict):
+                    line = record.get('q') or record.get('query') or record.get('title') or ''
+            queries.append(line)
+    print(f"✓ Loaded {len(queries):,} queries from {log_file}")
+    return queries
+
+
+def query_terms(query, known_words):
+    """Distinct indexed words of a query, normalized like the Worker"""
+    terms = set()
+    for word in query.split():
+        term = normalize_query_term(word)
+        if len(term) >= 2 and term in known_words:
+            terms.add(term)
+    return terms
+
+
+def load_current_layout(index_dir):
+    """Load word sizes and the current chunk index from built reverse index chunks"""
+    index_path = Path(index_dir)
+    with open(index_path / 'padakanaja_reverse_index_chunk_index.json', 'r', encoding='utf-8') as f:
+        chunk_index = json.load(f)
+
+    word_sizes = {}
+    chunk_sizes = {}
+    chunk_files = sorted(index_path.glob('padakanaja_reverse_index_part*.json'),
+                         key=lambda p: int(p.stem.rsplit('part', 1)[1]))
+    for chunk_file in chunk_files:
+        chunk_num = int(chunk_file.stem.rsplit('part', 1)[1])
+        print(f"  Reading {chunk_file.name}...")
+        with open(chunk_file, 'r', encoding='utf-8') as f:
+            chunk = json.load(f)
+        # Sizes are estimated the same way split_into_chunks does, so before/after compare
+        sizes = {word: word_json_size(word, entries) for word, entries in chunk.items()}
+        chunk_sizes[chunk_num] = sum(sizes.values())
+        if chunk_num != 0:  # Hot chunk duplicates words of the regular chunks
+            word_sizes.update(sizes)
+
+    print(f"✓ Loaded {len(word_sizes):,} words from {len(chunk_sizes)} chunks")
+    return word_sizes, chunk_index, chunk_sizes
+
+
+def build_layout(word_sizes, query_term_sets, max_size_mb=20):
+    """Assign words to chunks so that words queried together share a chunk.
+
+    Greedy agglomerative clustering: word pairs are visited by descending
+    co-occurrence count and their groups are merged while the merged group
+    fits the byte budget. Groups are then packed into chunks, most-queried
+    first, and words never seen in the log fill the rest alphabetically.
+    """
+    print("🔗 Clustering co-queried words...")
+    max_size_bytes = max_size_mb * 1024 * 1024
+
+    pair_counts = defaultdict(int)
+    word_counts = defaultdict(int)
+    for terms in query_term_sets:
+        for term in terms:
+            word_counts[term] += 1
+        for pair in combinations(sorted(terms), 2):
+            pair_counts[pair] += 1
+
+    # Union-find over queried words
+    parent = {word: word for word in word_counts}
+    group_size = {word: word_sizes[word] for word in word_counts}
+
+    def find(word):
+        while parent[word] != word:
+            parent[word] = parent[parent[word]]
+            word = parent[word]
+        return word
+
+    merges = 0
+    for (a, b), _ in sorted(pair_counts.items(), key=lambda item: (-item[1], item[0])):
+        root_a, root_b = find(a), find(b)
+        if root_a == root_b or group_size[root_a] + group_size[root_b] > max_size_bytes:
+            continue
+        parent[root_b] = root_a
+        group_size[root_a] += group_size[root_b]
+        merges += 1
+
+    groups = defaultdict(list)
+    for word in word_counts:
+        groups[find(word)].append(word)
+    group_weight = {root: sum(word_counts[w] for w in words) for root, words in groups.items()}
+    ordered_groups = [sorted(groups[root]) for root in
+                      sorted(groups, key=lambda root: (-group_weight[root], root))]
+    print(f"✓ {merges:,} merges -> {len(ordered_groups):,} groups of queried words")
+
+    # Pack groups first-fit into chunks, never splitting a group
+    chunks = []
+    chunk_bytes = []
+    for words in ordered_groups:
+        size = sum(word_sizes[w] for w in words)
+        for i in range(len(chunks)):
+            if chunk_bytes[i] + size <= max_size_bytes:
+                chunks[i].extend(words)
+                chunk_bytes[i] += size
+                break
+        else:
+            chunks.append(list(words))
+            chunk_bytes.append(size)
+
+    # Fill with unqueried words alphabetically
+    for word in sorted(w for w in word_sizes if w not in word_counts):
+        size = word_sizes[word]
+        if not chunks or chunk_bytes[-1] + size > max_size_bytes:
+            chunks.append([])
+            chunk_bytes.append(0)
+        chunks[-1].append(word)
+        chunk_bytes[-1] += size
+
+    print(f"✓ Layout: {len(chunks)} chunks")
+    return chunks, chunk_bytes
+
+
+def chunk_index_bytes(chunk_index):
+    """Size of the chunk index as create_padakanaja_reverse_index.py saves it"""
+    return len(json.dumps(chunk_index, ensure_ascii=False, indent=2).encode('utf-8'))
+
+
+def layout_chunk_index(chunks, current_chunk_index):
+    """Chunk index a rebuild with the layout would write (hot chunk routes carried over)"""
+    chunk_index = create_chunk_index(chunks)
+    add_layout_routes(chunk_index, chunks)
+    hot_routes = {word: route for word, route in current_chunk_index.get('_terms', {}).items() if route == [0]}
+    if hot_routes:
+        chunk_index.setdefault('_terms', {}).update(hot_routes)
+    return chunk_index
+
+
+def fetch_stats(query_term_sets, chunks_for_term, chunk_sizes):
+    """Expected cold-cache KV fetches and bytes per query"""
+    fetch_counts = []
+    fetched_bytes = []
+    for terms in query_term_sets:
+        needed = set()
+        for term in terms:
+            needed.update(chunks_for_term(term))
+        fetch_counts.append(len(needed))
+        fetched_bytes.append(sum(chunk_sizes.get(c, 0) for c in needed))
+
+    if not fetch_counts:
+        return {'queries': 0, 'mean_fetches': 0.0, 'p95_fetches': 0, 'max_fetches': 0,
+                'multi_fetch_share': 0.0, 'mean_mb': 0.0}
+
+    fetch_counts.sort()
+    return {
+        'queries': len(fetch_counts),
+        'mean_fetches': round(sum(fetch_counts) / len(fetch_counts), 3),
+        'p95_fetches': fetch_counts[min(len(fetch_counts) - 1, int(len(fetch_counts) * 0.95))],
+        'max_fetches': fetch_counts[-1],
+        'multi_fetch_share': round(sum(1 for c in fetch_counts if c > 1) / len(fetch_counts), 4),
+        'mean_mb': round(sum(fetched_bytes) / len(fetched_bytes) / 1024 / 1024, 2)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Optimize reverse index chunk layout from a query log')
+    parser.add_argument('query_log', help='Query log (JSON lines such as requests.jsonl, or one query per line)')
+    parser.add_argument('--index-dir', default='padakanaja', help='Directory with built reverse index chunks')
+    parser.add_argument('--max-size-mb', type=float, default=20, help='Byte budget per chunk in MB (default: 20)')
+    parser.add_argument('--output', help='Layout file (default: <index-dir>/padakanaja_reverse_index_layout.json)')
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("Optimizing Reverse Index Chunk Layout")
+    print("=" * 80)
+    print()
+
+    word_sizes, chunk_index, current_chunk_sizes = load_current_layout(args.index_dir)
+    queries = load_query_log(args.query_log)
+    query_term_sets = [t for t in (query_terms(q, word_sizes) for q in queries) if t]
+    print(f"✓ {len(query_term_sets):,} queries hit indexed words")
+
+    chunks, chunk_bytes = build_layout(word_sizes, query_term_sets, args.max_size_mb)
+    new_chunk_sizes = {num: size for num, size in enumerate(chunk_bytes, 1)}
+
+    new_chunk_index = layout_chunk_index(chunks, chunk_index)
+
+    before = fetch_stats(query_term_sets, lambda t: get_chunks_for_word(t, chunk_index), current_chunk_sizes)
+    after = fetch_stats(query_term_sets, lambda t: get_chunks_for_word(t, new_chunk_index), new_chunk_sizes)
+    before['chunk_index_kb'] = round(chunk_index_bytes(chunk_index) / 1024, 1)
+    after['chunk_index_kb'] = round(chunk_index_bytes(new_chunk_index) / 1024, 1)
+
+    print("\n📊 Expected KV fetches per query (cold cache):")
+    print(f"  Before: {before['mean_fetches']:.2f} fetches, {before['mean_mb']:.2f} MB "
+          f"({before['multi_fetch_share']:.1%} of queries need >1 chunk), "
+          f"chunk index {before['chunk_index_kb']:,.1f} KB")
+    print(f"  After:  {after['mean_fetches']:.2f} fetches, {after['mean_mb']:.2f} MB "
+          f"({after['multi_fetch_share']:.1%} of queries need >1 chunk), "
+          f"chunk index {after['chunk_index_kb']:,.1f} KB")
+
+    output_file = Path(args.output) if args.output else Path(args.index_dir) / 'padakanaja_reverse_index_layout.json'
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump({
+            'max_size_mb': args.max_size_mb,
+            'query_log': str(args.query_log),
+            'report': {'before': before, 'after': after},
+            'chunks': chunks
+        }, f, ensure_ascii=False, separators=(',', ':'))
+    print(f"\n✓ Saved layout to {output_file}")
+    print(f"  Apply with: python create_padakanaja_reverse_index.py --layout {output_file}")
+
+
+if __name__ == '__main__':
+    with instrument('optimize_chunk_layout'):
+        main()
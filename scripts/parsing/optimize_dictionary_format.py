@@ -8,6 +8,12 @@ Uses compact format: [kannada, english, type] instead of verbose objects.
 import json
 from pathlib import Path
 from typing import List, Dict, Any
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.parsing.instrumentation import instrument
 
 
 def optimize_entries(entries: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -107,15 +113,12 @@ def optimize_file(input_file: str, output_file: str):
 
 
 if __name__ == '__main__':
-    import sys
-    
-    if len(sys.argv) < 2:
-        print("Usage: python optimize_dictionary_format.py <input_file> [output_file]")
-        sys.exit(1)
-    
-    input_file = sys.argv[1]
-    output_file = sys.argv[2] if len(sys.argv) > 2 else input_file.replace('.json', '_optimized.json')
-    
-    optimize_file(input_file, output_file)
+    with instrument('optimize_dictionary_format'):
+        if len(sys.argv) < 2:
+            print("Usage: python optimize_dictionary_format.py <input_file> [output_file]")
+            sys.exit(1)
 
+        input_file = sys.argv[1]
+        output_file = sys.argv[2] if len(sys.argv) > 2 else input_file.replace('.json', '_optimized.json')
 
+        optimize_file(input_file, output_file)
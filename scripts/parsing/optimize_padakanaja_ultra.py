@@ -1,32 +1,36 @@
 #!/usr/bin/env python3
 """
 Ultra-compact format for padakanaja dictionary:
-1. Remove duplicates
-2. Flatten structure: {source|dict_title: [[k, e, t?], ...]}
+1. Remove duplicates, then collapse near-duplicates (dedup_entries.py; --exact-only skips this)
+2. Flatten structure: {source|dict_title: [[k, e, t?, also?], ...]} (also: source|dict_title keys of other dictionaries with the entry)
 3. Use compact JSON (no spaces)
 """
 
 import json
 from pathlib import Path
 from collections import defaultdict
+import sys
 
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-def optimize_padakanaja(input_file, output_file):
-    """Create ultra-compact format with duplicates removed."""
-    print(f"Loading: {input_file}")
-    with open(input_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    original_size = len(json.dumps(data, ensure_ascii=False))
-    print(f"Original size: {original_size / 1024 / 1024:.2f} MB")
-    
-    # Build compact format and remove duplicates
+from scripts.parsing.dedup_entries import collapse_near_duplicates
+from scripts.parsing.instrumentation import instrument
+from scripts.parsing.json_stream import iter_json_members
+
+
+def compact_entries(data):
+    """Flatten {source: {dict_title: entries}} to {source|dict_title: [[k, e, t?], ...]} without exact duplicates.
+
+    data is the dictionary or an iterable of its (source, dicts) members.
+    Returns (compact, stats).
+    """
     compact = {}
     seen_entries = set()
     duplicates = 0
     total_entries = 0
     
-    for source, dicts in data.items():
+    for source, dicts in data.items() if isinstance(data, dict) else data:
         for dict_title, entries in dicts.items():
             # Flatten key: source|dict_title
             key = f"{source}|{dict_title}"
@@ -61,6 +65,26 @@ def optimize_padakanaja(input_file, output_file):
             if compact_entries:
                 compact[key] = compact_entries
     
+    return compact, {'total': total_entries, 'duplicates': duplicates, 'unique': len(seen_entries)}
+
+
+def optimize_padakanaja(input_file, output_file, near_duplicates=True):
+    """Create ultra-compact format with duplicates (and near-duplicates) removed."""
+    print(f"Loading: {input_file}")
+    original_size = Path(input_file).stat().st_size
+    print(f"Original size: {original_size / 1024 / 1024:.2f} MB")
+    
+    # Build compact format and remove duplicates, one source at a time
+    compact, stats = compact_entries(iter_json_members(input_file))
+    total_entries = stats['total']
+    duplicates = stats['duplicates']
+    unique_entries = stats['unique']
+    
+    # Entries differing only in case, punctuation or invisible characters
+    if near_duplicates:
+        compact, near_stats = collapse_near_duplicates(compact)
+        unique_entries = near_stats['kept']
+    
     # Save ultra-compact format (no spaces, no indentation)
     with open(output_file, 'w', encoding='utf-8') as f:
         json.dump(compact, f, ensure_ascii=False, separators=(',', ':'))
@@ -71,7 +95,10 @@ def optimize_padakanaja(input_file, output_file):
     print(f"\nOptimization results:")
     print(f"  Total entries processed: {total_entries:,}")
     print(f"  Duplicates removed: {duplicates:,} ({duplicates/total_entries*100:.1f}%)")
-    print(f"  Unique entries: {len(seen_entries):,}")
+    if near_duplicates:
+        print(f"  Near-duplicates collapsed: {near_stats['removed']:,} "
+              f"({near_stats['multi_source']:,} entries now list several dictionaries)")
+    print(f"  Unique entries: {unique_entries:,}")
     print(f"  Compact size: {compact_size / 1024 / 1024:.2f} MB")
     print(f"  Reduction: {reduction:.1f}%")
     print(f"  Saved: {(original_size - compact_size) / 1024 / 1024:.2f} MB")
@@ -80,10 +107,10 @@ def optimize_padakanaja(input_file, output_file):
 
 
 if __name__ == '__main__':
-    input_file = 'padakanaja/combined_dictionaries_part1.json'
-    output_file = 'padakanaja/combined_dictionaries_ultra.json'
-    
-    optimize_padakanaja(input_file, output_file)
-    print(f"\n✓ Saved ultra-compact format to: {output_file}")
-
-
+    with instrument('optimize_padakanaja_ultra'):
+        input_file = 'padakanaja/combined_dictionaries_part1.json'
+        output_file = 'padakanaja/combined_dictionaries_ultra.json'
+        
+        # --exact-only keeps near-duplicates (only byte-identical entries are dropped)
+        optimize_padakanaja(input_file, output_file, near_duplicates='--exact-only' not in sys.argv[1:])
+        print(f"\n✓ Saved ultra-compact format to: {output_file}")
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Static relevance scoring for reverse index postings.
+
+Mirrors the query-time ranking in js/search.js (getDefinitionPriority /
+getMatchQuality) so the index builders can store every posting list
+pre-sorted. The first page of results is then simply the head of the list.
+
+Score is an integer, higher = more relevant. Components, most significant first:
+1. Match priority (exact definition, match at end, match anywhere, Kannada description penalty)
+2. Source priority (Alar first, as in create_optimized_merged_dictionary)
+3. Part of speech
+4. Definition length (shorter definitions first)
+5. Word position (earlier occurrence of the term first)
+"""
+
+import re
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.parsing.kannada_text import clean_kannada_display
+
+# Worst value returned by get_definition_priority (no match + description penalty)
+MAX_PRIORITY = 9
+
+# Lower = better, same order as the grammar map in csv_to_yaml_parser.py
+TYPE_PRIORITY = {
+    'Noun': 0,
+    'Verb': 1,
+    'Adjective': 2,
+    'Adverb': 3,
+}
+DEFAULT_TYPE_PRIORITY = 4
+
+PRIORITY_WEIGHT = 100000
+SOURCE_WEIGHT = 50000
+TYPE_WEIGHT = 10000
+LENGTH_WEIGHT = 100
+MAX_LENGTH_POINTS = 99
+MAX_POSITION_POINTS = 99
+
+FINAL_PERIOD_RE = re.compile(r'\.\s*$')
+
+
+@lru_cache(maxsize=4096)
+def count_words(text):
+    """Count words in a Kannada entry (same as countWords in js/dictionary.js)."""
+    if not text:
+        return 0
+    return len(clean_kannada_display(text).split())
+
+
+def is_description(kannada):
+    """Whether a Kannada entry has more than 2 words (a description, not a headword).
+
+    Cleaning only removes characters, so an entry of at most 2 raw words never
+    needs cleaning; most entries are headwords and skip it.
+    """
+    return bool(kannada) and len(kannada.split()) > 2 and count_words(kannada) > 2
+
+
+class DefinitionProfile:
+    """Term-independent parts of a definition, computed once for all the terms it is indexed under"""
+
+    __slots__ = ('lower', 'exact', 'body', 'words')
+
+    def __init__(self, definition):
+        self.lower = definition.strip().lower()
+        # Definition without its final period, compared with the term for an exact match
+        self.exact = FINAL_PERIOD_RE.sub('', self.lower).strip()
+        # Text before a final period (None without one), for the end-of-definition tiers
+        self.body = self.lower[:-1].rstrip() if self.lower.endswith('.') else None
+        self.words = tuple(''.join(c for c in w if c.isalnum()) for w in self.lower.split())
+
+
+def _match_quality(profile, search_lower):
+    """get_match_quality against a precomputed DefinitionProfile"""
+    # 0: Exact full-word match - definition is exactly the search word
+    if profile.exact == search_lower:
+        return 0
+
+    # Tiers 1 and 2 need the term right before a final period. Plain string
+    # checks: a regex built per search word would be compiled for every
+    # posting, as the patterns outnumber the re module cache.
+    body = profile.body
+    if body is not None and search_lower and body.endswith(search_lower):
+        start = len(body) - len(search_lower)
+        # 1: Search term is fully between ";" and "." at the end (";\s+[^;]*?term\s*\.$")
+        semicolon = body.rfind(';', 0, start)
+        if semicolon != -1 and semicolon + 1 < start and body[semicolon + 1].isspace():
+            return 1
+        # 2: Search term is at the end (before final period)
+        return 2
+
+    # 3: Match anywhere in definition
+    if search_lower in profile.lower:
+        return 3
+
+    # 4: Partial word match (for multi-word queries)
+    words = search_lower.split()
+    if len(words) > 1 and any(word in profile.lower for word in words):
+        return 4
+
+    return 5
+
+
+def get_match_quality(definition, search_word):
+    """
+    Match quality of search_word within definition (lower = better).
+    Same tiers as getMatchQuality in js/search.js.
+    """
+    return _match_quality(DefinitionProfile(definition), search_word.lower())
+
+
+def get_definition_priority(definition, search_word, kannada=''):
+    """
+    Priority of a definition for search_word (lower = better).
+    Kannada entries with more than 2 words are descriptions and get a +4 penalty.
+    """
+    if not definition:
+        return MAX_PRIORITY
+    priority = get_match_quality(definition, search_word)
+    if is_description(kannada):
+        priority += 4
+    return priority
+
+
+def get_word_position(definition, term):
+    """Index of the first definition word equal to term (len(words) if absent)."""
+    words = DefinitionProfile(definition).words
+    try:
+        return words.index(term.lower())
+    except ValueError:
+        return len(words)
+
+
+def compute_posting_scores(terms, definition, kannada='', source='', type_str='', profile=None):
+    """Static relevance scores of one entry for each of terms (the words it is indexed under).
+
+    Everything but the match tier and word position depends on the entry
+    alone, so it is computed once rather than once per term. A caller that
+    already built the DefinitionProfile (for the words to index) passes it in.
+    """
+    definition = definition or ''
+    if not definition:
+        return [MAX_LENGTH_POINTS * LENGTH_WEIGHT + MAX_POSITION_POINTS
+                + (1 if source == 'alar' else 0) * SOURCE_WEIGHT
+                + (DEFAULT_TYPE_PRIORITY - TYPE_PRIORITY.get(type_str, DEFAULT_TYPE_PRIORITY)) * TYPE_WEIGHT
+                for _ in terms]
+
+    profile = profile or DefinitionProfile(definition)
+    base = (
+        (1 if source == 'alar' else 0) * SOURCE_WEIGHT
+        + (DEFAULT_TYPE_PRIORITY - TYPE_PRIORITY.get(type_str, DEFAULT_TYPE_PRIORITY)) * TYPE_WEIGHT
+        + max(0, MAX_LENGTH_POINTS - len(profile.words)) * LENGTH_WEIGHT
+    )
+    penalty = 4 if is_description(kannada) else 0
+    scores = []
+    for term in terms:
+        term_lower = term.lower()
+        priority = _match_quality(profile, term_lower) + penalty
+        try:
+            position = profile.words.index(term_lower)
+        except ValueError:
+            position = len(profile.words)
+        scores.append(
+            (MAX_PRIORITY - priority) * PRIORITY_WEIGHT
+            + base
+            + max(0, MAX_POSITION_POINTS - position)
+        )
+    return scores
+
+
+def compute_posting_score(term, definition, kannada='', source='', type_str=''):
+    """Compute the static relevance score of a (term, entry) pair."""
+    return compute_posting_scores((term,), definition, kannada, source, type_str)[0]
+
+
+def sort_postings(postings, definition_field='english'):
+    """Sort postings in place by score (descending), then Kannada for stable output."""
+    postings.sort(key=lambda p: (-p.get('score', 0), p.get('kannada', ''), p.get(definition_field, '')))
+    return postings
@@ -11,6 +11,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from scripts.parsing.batch_parse_padakanaja import get_dictionary_title_mapping, get_dictionary_title
+from scripts.parsing.instrumentation import instrument
 
 
 def get_canonical_filename(dict_name):
@@ -136,13 +137,13 @@ def rename_dictionary_files(padakanaja_dir='padakanaja', dry_run=True):
 
 
 if __name__ == '__main__':
-    import argparse
+    with instrument('rename_dictionaries'):
+        import argparse
     
-    parser = argparse.ArgumentParser(description='Rename dictionary files to canonical names')
-    parser.add_argument('--execute', action='store_true', help='Actually perform the renames (default is dry-run)')
-    parser.add_argument('--dir', default='padakanaja', help='Directory containing dictionary files')
+        parser = argparse.ArgumentParser(description='Rename dictionary files to canonical names')
+        parser.add_argument('--execute', action='store_true', help='Actually perform the renames (default is dry-run)')
+        parser.add_argument('--dir', default='padakanaja', help='Directory containing dictionary files')
     
-    args = parser.parse_args()
+        args = parser.parse_args()
     
-    rename_dictionary_files(args.dir, dry_run=not args.execute)
-
+        rename_dictionary_files(args.dir, dry_run=not args.execute)
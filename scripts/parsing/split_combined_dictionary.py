@@ -8,6 +8,12 @@ import yaml
 from pathlib import Path
 import sys
 
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.parsing.instrumentation import instrument
+from scripts.parsing.yaml_stream import iter_yaml_entries
+
 def split_combined_dictionary(
     input_file: str = 'padakanaja/combined_dictionaries.yml',
     chunk_size_mb: float = 70.0,
@@ -29,8 +35,7 @@ def split_combined_dictionary(
         return
     
     print(f"Loading combined dictionary: {input_file}")
-    with open(input_path, 'r', encoding='utf-8') as f:
-        all_entries = yaml.safe_load(f)
+    all_entries = list(iter_yaml_entries(input_path))
     
     if not all_entries or not isinstance(all_entries, list):
         print("Error: Invalid YAML file or empty entries")
@@ -115,6 +120,5 @@ def split_combined_dictionary(
 
 
 if __name__ == '__main__':
-    split_combined_dictionary()
-
-
+    with instrument('split_combined_dictionary'):
+        split_combined_dictionary()
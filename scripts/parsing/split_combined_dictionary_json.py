@@ -8,6 +8,12 @@ import json
 from pathlib import Path
 import sys
 
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.parsing.instrumentation import instrument
+from scripts.parsing.json_stream import iter_json_items, iter_json_members, json_top_level_type
+
 def split_combined_dictionary_json(
     input_file: str = 'padakanaja/combined_dictionaries.json',
     chunk_size_mb: float = 70.0,
@@ -29,23 +35,17 @@ def split_combined_dictionary_json(
         return
     
     print(f"Loading combined dictionary: {input_file}")
-    with open(input_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    # Handle both optimized format (object) and regular format (array)
-    if isinstance(data, dict):
+    # Handle both optimized format (object) and regular format (array).
+    # The file is streamed twice (count, then split), so only the chunk being built is in memory.
+    optimized = json_top_level_type(input_path) is dict
+    if optimized:
         # Optimized format: {source: {dict_title: [[k, e, t?], ...]}}
-        # Count total entries
-        total_entries = sum(len(entries_list) for source_dict in data.values() for entries_list in source_dict.values())
-        all_entries = data  # Keep as optimized format
+        total_entries = sum(len(entries_list) for _, source_dict in iter_json_members(input_path)
+                            for entries_list in source_dict.values())
         print(f"Detected optimized format (grouped by source)")
-    elif isinstance(data, list):
-        # Regular format: array of entries
-        all_entries = data
-        total_entries = len(all_entries)
     else:
-        print("Error: Invalid JSON file format")
-        return
+        # Regular format: array of entries
+        total_entries = sum(1 for _ in iter_json_items(input_path))
     
     if total_entries == 0:
         print("Error: No entries found")
@@ -64,121 +64,73 @@ def split_combined_dictionary_json(
     print(f"Target entries per chunk: {target_entries_per_chunk:,}")
     print()
     
-    # Split into chunks
-    chunks = []
+    # Split into chunks, saving each one as soon as it is complete
+    chunk_counts = []
+    
+    def save_chunk(chunk, entry_count):
+        chunk_filename = f'combined_dictionaries_part{len(chunk_counts) + 1}.json'
+        chunk_path = output_path / chunk_filename
+        with open(chunk_path, 'w', encoding='utf-8') as f:
+            if optimized:
+                # Use compact format (no spaces) for optimized format
+                json.dump(chunk, f, ensure_ascii=False, separators=(',', ':'))
+            else:
+                json.dump(chunk, f, ensure_ascii=False, indent=2)
+        chunk_counts.append(entry_count)
+        saved_size_mb = chunk_path.stat().st_size / (1024 * 1024)
+        print(f"  ✓ {chunk_filename}: {entry_count:,} entries ({saved_size_mb:.2f} MB)")
     
-    if isinstance(all_entries, dict):
+    def encoded_size_mb(chunk):
+        if optimized:
+            text = json.dumps(chunk, ensure_ascii=False, separators=(',', ':'))
+        else:
+            text = json.dumps(chunk, ensure_ascii=False, indent=2)
+        return len(text.encode('utf-8')) / (1024 * 1024)
+    
+    if optimized:
         # Optimized format: split by iterating through sources and dict_titles
         current_chunk = {}
         current_entry_count = 0
         
-        for source, dicts in all_entries.items():
+        for source, dicts in iter_json_members(input_path):
             if source not in current_chunk:
                 current_chunk[source] = {}
             
             for dict_title, entries_list in dicts.items():
-                current_chunk[source][dict_title] = entries_list
+                current_chunk.setdefault(source, {})[dict_title] = entries_list
                 current_entry_count += len(entries_list)
                 
-                # Check if we should start a new chunk
-                if current_entry_count >= target_entries_per_chunk:
-                    # Write a temporary chunk to check size
-                    temp_chunk_path = output_path / 'temp_chunk.json'
-                    with open(temp_chunk_path, 'w', encoding='utf-8') as f:
-                        json.dump(current_chunk, f, ensure_ascii=False, separators=(',', ':'))
-                    
-                    temp_size_mb = temp_chunk_path.stat().st_size / (1024 * 1024)
-                    temp_chunk_path.unlink()
-                    
-                    # If we're close to the limit, save this chunk
-                    if temp_size_mb >= chunk_size_mb * 0.8:
-                        chunks.append(current_chunk)
-                        print(f"Chunk {len(chunks)}: {current_entry_count:,} entries (~{temp_size_mb:.2f} MB)")
-                        current_chunk = {}
-                        current_entry_count = 0
+                # Start a new chunk once this one is close to the limit
+                if current_entry_count >= target_entries_per_chunk and \
+                        encoded_size_mb(current_chunk) >= chunk_size_mb * 0.8:
+                    save_chunk(current_chunk, current_entry_count)
+                    current_chunk = {}
+                    current_entry_count = 0
         
         # Add remaining entries as final chunk
         if current_entry_count > 0:
-            chunks.append(current_chunk)
-            temp_chunk_path = output_path / 'temp_chunk.json'
-            with open(temp_chunk_path, 'w', encoding='utf-8') as f:
-                json.dump(current_chunk, f, ensure_ascii=False, separators=(',', ':'))
-            temp_size_mb = temp_chunk_path.stat().st_size / (1024 * 1024)
-            temp_chunk_path.unlink()
-            print(f"Chunk {len(chunks)}: {current_entry_count:,} entries (~{temp_size_mb:.2f} MB)")
+            save_chunk(current_chunk, current_entry_count)
     else:
         # Regular format: array of entries
         current_chunk = []
         
-        for i, entry in enumerate(all_entries):
+        for entry in iter_json_items(input_path):
             current_chunk.append(entry)
             
-            # Check if we should start a new chunk
-            if len(current_chunk) >= target_entries_per_chunk:
-                # Write a temporary chunk to check size
-                temp_chunk_path = output_path / 'temp_chunk.json'
-                with open(temp_chunk_path, 'w', encoding='utf-8') as f:
-                    json.dump(current_chunk, f, ensure_ascii=False, indent=2)
-                
-                temp_size_mb = temp_chunk_path.stat().st_size / (1024 * 1024)
-                temp_chunk_path.unlink()
-                
-                # If we're close to the limit, save this chunk
-                if temp_size_mb >= chunk_size_mb * 0.8:
-                    chunks.append(current_chunk)
-                    print(f"Chunk {len(chunks)}: {len(current_chunk):,} entries (~{temp_size_mb:.2f} MB)")
-                    current_chunk = []
+            # Start a new chunk once this one is close to the limit
+            if len(current_chunk) >= target_entries_per_chunk and \
+                    encoded_size_mb(current_chunk) >= chunk_size_mb * 0.8:
+                save_chunk(current_chunk, len(current_chunk))
+                current_chunk = []
         
         # Add remaining entries as final chunk
         if current_chunk:
-            chunks.append(current_chunk)
-            temp_chunk_path = output_path / 'temp_chunk.json'
-            with open(temp_chunk_path, 'w', encoding='utf-8') as f:
-                json.dump(current_chunk, f, ensure_ascii=False, indent=2)
-            temp_size_mb = temp_chunk_path.stat().st_size / (1024 * 1024)
-            temp_chunk_path.unlink()
-            print(f"Chunk {len(chunks)}: {len(current_chunk):,} entries (~{temp_size_mb:.2f} MB)")
-    
-    print(f"\nSplit into {len(chunks)} chunks")
-    print()
-    
-    # Save chunks as JSON
-    print("Saving chunks...")
-    for i, chunk in enumerate(chunks, 1):
-        chunk_filename = f'combined_dictionaries_part{i}.json'
-        chunk_path = output_path / chunk_filename
-        
-        # Count entries in chunk
-        if isinstance(chunk, dict):
-            chunk_entry_count = sum(len(entries_list) for source_dict in chunk.values() for entries_list in source_dict.values())
-            # Use compact format (no spaces) for optimized format
-            with open(chunk_path, 'w', encoding='utf-8') as f:
-                json.dump(chunk, f, ensure_ascii=False, separators=(',', ':'))
-        else:
-            chunk_entry_count = len(chunk)
-            with open(chunk_path, 'w', encoding='utf-8') as f:
-                json.dump(chunk, f, ensure_ascii=False, indent=2)
-        
-        chunk_size_mb = chunk_path.stat().st_size / (1024 * 1024)
-        print(f"  ✓ {chunk_filename}: {chunk_entry_count:,} entries ({chunk_size_mb:.2f} MB)")
+            save_chunk(current_chunk, len(current_chunk))
     
-    print(f"\n✓ Successfully split into {len(chunks)} chunks")
+    print(f"\n✓ Successfully split into {len(chunk_counts)} chunks")
     
     # Verify all entries are accounted for
-    if isinstance(all_entries, dict):
-        # For optimized format, count entries in chunks
-        total_chunk_entries = 0
-        for chunk in chunks:
-            if isinstance(chunk, dict):
-                for source_dict in chunk.values():
-                    for entries_list in source_dict.values():
-                        total_chunk_entries += len(entries_list)
-            else:
-                # Fallback: if chunk is somehow a list
-                total_chunk_entries += len(chunk)
-    else:
-        total_chunk_entries = sum(len(c) for c in chunks)
-    
+    total_chunk_entries = sum(chunk_counts)
     if total_chunk_entries != total_entries:
         print(f"⚠ Warning: Entry count mismatch! Original: {total_entries}, Chunks: {total_chunk_entries}")
     else:
@@ -186,5 +138,5 @@ def split_combined_dictionary_json(
 
 
 if __name__ == '__main__':
-    split_combined_dictionary_json()
-
+    with instrument('split_combined_dictionary_json'):
+        split_combined_dictionary_json()
@@ -5,6 +5,12 @@ Split large JSON files for Cloudflare KV (25MB limit per value)
 
 import json
 from pathlib import Path
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.parsing.instrumentation import instrument
 
 def split_json_file(input_file, output_prefix, max_size_mb=20):
     """Split a JSON file into chunks under max_size_mb"""
@@ -57,19 +63,19 @@ def split_json_file(input_file, output_prefix, max_size_mb=20):
     return len(chunks)
 
 if __name__ == '__main__':
-    # Split English reverse index (this is what we'll use for fast lookup)
-    split_json_file(
-        'padakanaja/english_reverse_index.json',
-        'english_reverse_index',
-        max_size_mb=20
-    )
-    
-    # Also create a metadata file with chunk count
-    metadata = {
-        'chunks': len(list(Path('padakanaja').glob('english_reverse_index_part*.json'))),
-        'total_words': 103585  # From the merge script output
-    }
-    with open('padakanaja/english_reverse_index_metadata.json', 'w') as f:
-        json.dump(metadata, f, indent=2)
-    print(f"✓ Created metadata file")
+    with instrument('split_for_kv'):
+        # Split English reverse index (this is what we'll use for fast lookup)
+        split_json_file(
+            'padakanaja/english_reverse_index.json',
+            'english_reverse_index',
+            max_size_mb=20
+        )
 
+        # Also create a metadata file with chunk count
+        metadata = {
+            'chunks': len(list(Path('padakanaja').glob('english_reverse_index_part*.json'))),
+            'total_words': 103585  # From the merge script output
+        }
+        with open('padakanaja/english_reverse_index_metadata.json', 'w') as f:
+            json.dump(metadata, f, indent=2)
+        print(f"✓ Created metadata file")
@@ -7,6 +7,11 @@ import json
 from pathlib import Path
 import sys
 
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.parsing.instrumentation import instrument
+
 def split_reverse_index(
     input_file: str = 'padakanaja/reverse_index.json',
     chunk_size_mb: float = 70.0,
@@ -118,5 +123,5 @@ def split_reverse_index(
 
 
 if __name__ == '__main__':
-    split_reverse_index()
-
+    with instrument('split_reverse_index'):
+        split_reverse_index()
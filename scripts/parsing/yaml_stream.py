@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Streaming reader for YAML dictionary files (alar.yml, combined_dictionaries.yml).
+
+yaml.safe_load composes the node tree of the whole document before it
+constructs a single entry, so peak memory is the node tree plus the result.
+Every dictionary file is one top-level list of entries; this reader walks
+the parser's events and composes and constructs one list item at a time:
+
+    for entry in iter_yaml_entries('alar.yml'):
+        ...
+
+Anchors stay registered for the whole document, so an alias to an earlier
+entry resolves as it would with safe_load. Events come from libyaml when
+PyYAML was built with it (same speed as CSafeLoader, without the tree).
+
+Usage:
+    python yaml_stream.py FILE [--compare]   # entries, time and peak memory (vs yaml.safe_load)
+"""
+
+import argparse
+import io
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import yaml
+from yaml.composer import Composer
+from yaml.constructor import SafeConstructor
+from yaml.events import DocumentEndEvent, SequenceEndEvent, SequenceStartEvent, StreamEndEvent
+from yaml.resolver import Resolver
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.parsing.instrumentation import instrument
+
+if yaml.__with_libyaml__:
+    from yaml.cyaml import CParser
+
+    class StreamingLoader(CParser, Composer, SafeConstructor, Resolver):
+        """libyaml events with PyYAML's composer, so single nodes can be composed"""
+
+        def __init__(self, stream):
+            CParser.__init__(self, stream)
+            Composer.__init__(self)
+            SafeConstructor.__init__(self)
+            Resolver.__init__(self)
+else:
+    StreamingLoader = yaml.SafeLoader
+
+
+def _expect_end_of_stream(loader):
+    """Consume the end of the only document; a second document is a ValueError (as with safe_load)"""
+    if not loader.check_event(DocumentEndEvent):
+        raise ValueError(f"Expected the end of the document, found {type(loader.peek_event()).__name__}")
+    loader.get_event()
+    if not loader.check_event(StreamEndEvent):
+        mark = loader.peek_event().start_mark
+        raise ValueError(f"Expected a single document in the stream, found another at line {mark.line + 1}")
+
+
+def iter_yaml_entries(source):
+    """Yield the items of a YAML document's top-level list one at a time.
+
+    source is a path, an open file or the document as bytes. An empty
+    document yields nothing; any other non-list document, or more than one
+    document, is a ValueError. A second document is only noticed after the
+    first one's entries have been yielded.
+    """
+    if isinstance(source, (str, Path)):
+        with open(source, 'rb') as f:
+            yield from iter_yaml_entries(f)
+        return
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+
+    loader = StreamingLoader(source)
+    try:
+        loader.get_event()  # StreamStart
+        if loader.check_event(StreamEndEvent):
+            return
+        loader.get_event()  # DocumentStart
+
+        if not loader.check_event(SequenceStartEvent):
+            # Not a list: compose it only to tell an empty document from a wrong one
+            root = loader.construct_document(loader.compose_node(None, None))
+            if root is not None:
+                raise ValueError(f"Expected a list of entries, found {type(root).__name__}")
+            _expect_end_of_stream(loader)
+            return
+
+        sequence_start = loader.peek_event()
+        if sequence_start.anchor is not None:
+            raise ValueError("Anchored top-level list is not supported by the streaming reader")
+        loader.get_event()
+        while not loader.check_event(SequenceEndEvent):
+            yield loader.construct_document(loader.compose_node(None, None))
+        loader.get_event()  # SequenceEnd
+        loader.anchors = {}
+        _expect_end_of_stream(loader)
+    finally:
+        loader.dispose()
+
+
+def measure(func):
+    """(result, seconds, peak traced MB) of func()"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        result = func()
+        return result, time.perf_counter() - start, tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Stream the entries of a YAML dictionary file')
+    parser.add_argument('file', help='YAML file with a top-level list of entries')
+    parser.add_argument('--compare', action='store_true', help='Also time yaml.safe_load (C loader if available)')
+    args = parser.parse_args()
+
+    count, seconds, peak_mb = measure(lambda: sum(1 for _ in iter_yaml_entries(args.file)))
+    print(f"📄 {args.file}: {count:,} entries")
+    print(f"  streaming:  {seconds:8.2f}s  peak {peak_mb:8.1f} MB")
+    if args.compare:
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+        def load_all():
+            with open(args.file, 'rb') as f:
+                return len(yaml.load(f, Loader=loader))
+        count, seconds, peak_mb = measure(load_all)
+        print(f"  {loader.__name__ + ':':11s} {seconds:8.2f}s  peak {peak_mb:8.1f} MB")
+
+
+if __name__ == '__main__':
+    with instrument('yaml_stream'):
+        main()
@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""
+rala-build: run the dictionary pipeline as a dependency graph.
+
+Each stage declares its script, input and output files and the stages it
+depends on. A stage runs only when it is out of date:
+- it has never been built, or one of its outputs is missing
+- the content of one of its inputs changed (SHA-256, cached by size/mtime)
+- its script, a scripts/ module the script imports (directly or through
+  another module), or its arguments changed
+
+Per-file stages (CSV -> YAML parsing) only reprocess the inputs that
+changed, so editing one CSV re-parses that CSV and then rebuilds what
+depends on the combined data. Stages whose dependencies are done run
+concurrently (e.g. the Alar and Padakanaja indexes).
+
+Build state lives in .rala_build/ (state.json, per-stage logs and the
+timing log written by the scripts' instrumentation).
+
+Usage:
+    python scripts/rala_build.py                  # build everything that is out of date
+    python scripts/rala_build.py kv_export        # a target and what it depends on
+    python scripts/rala_build.py --dry-run        # show what would run and why
+    python scripts/rala_build.py --list
+    python scripts/rala_build.py scrape           # manual stages only run when named
+"""
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+BUILD_DIR = ROOT / '.rala_build'
+STATE_FILE = BUILD_DIR / 'state.json'
+ALAR_SNAPSHOT = '.rala_build/alar/alar_snapshot.json'  # see scripts/parsing/alar_snapshot.py
+REVERSE_INDEX_CHUNKS = ['padakanaja/padakanaja_reverse_index_part*.json',
+                        'padakanaja/padakanaja_reverse_index_part*.rchunk*']  # see chunk_codec.py
+REVERSE_INDEX_OVERFLOW = ['padakanaja/padakanaja_reverse_index_overflow/*.json',
+                          'padakanaja/padakanaja_reverse_index_overflow_index.json']
+
+
+class Stage:
+    """One pipeline step: a script with declared inputs, outputs and dependencies.
+
+    inputs/outputs are glob patterns relative to the repository root; a
+    pattern starting with '!' excludes matches. A per_file stage maps each
+    input X.csv to X.yml next to it and gets the changed inputs as arguments.
+    """
+
+    def __init__(self, name, script, inputs=(), outputs=(), deps=(), args=(),
+                 per_file_suffix=None, manual=False, description=''):
+        self.name = name
+        self.script = script
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.deps = list(deps)
+        self.args = list(args)
+        self.per_file_suffix = per_file_suffix
+        self.manual = manual
+        self.description = description
+
+    def command(self, extra_args=()):
+        return [sys.executable, str(ROOT / self.script), *self.args, *extra_args]
+
+    def output_for(self, input_path):
+        """Output of one input of a per-file stage"""
+        return str(Path(input_path).with_suffix(self.per_file_suffix))
+
+
+STAGES = [
+    Stage('scrape', 'scripts/scraping/scraper_simple.py',
+          outputs=['padakanaja/*.csv'], args=['--headless'], manual=True,
+          description='Scrape dictionaries from padakanaja.karnataka.gov.in (network, manual)'),
+    Stage('parse', 'scripts/parsing/batch_parse_padakanaja.py',
+          inputs=['padakanaja/*.csv'], outputs=['padakanaja/*.yml', '!padakanaja/combined_dictionaries*'],
+          deps=['scrape'], per_file_suffix='.yml',
+          description='Parse each CSV into a YAML dictionary'),
+    Stage('combine', 'scripts/parsing/combine_dictionaries.py',
+          inputs=['padakanaja/*.yml', '!padakanaja/combined_dictionaries*'],
+          outputs=['padakanaja/combined_dictionaries_part*.json'], deps=['parse'],
+          description='Combine the YAML dictionaries into optimized JSON chunks'),
+    Stage('optimize', 'scripts/parsing/optimize_padakanaja_ultra.py',
+          inputs=['padakanaja/combined_dictionaries_part1.json'],
+          outputs=['padakanaja/combined_dictionaries_ultra.json'], deps=['combine'],
+          description='Deduplicate into the ultra-compact format'),
+    Stage('padakanaja_index', 'scripts/parsing/create_padakanaja_reverse_index.py',
+          inputs=['padakanaja/combined_dictionaries_ultra.json'],
+          outputs=[*REVERSE_INDEX_CHUNKS, *REVERSE_INDEX_OVERFLOW,
+                   'padakanaja/padakanaja_reverse_index_chunk_index.json',
+                   'padakanaja/padakanaja_reverse_index_metadata.json'],
+          deps=['optimize'],
+          description='Build the Padakanaja reverse index chunks'),
+    Stage('shard_packs', 'scripts/parsing/build_shard_packs.py',
+          inputs=['padakanaja/combined_dictionaries_ultra.json'],
+          outputs=['padakanaja/shards/shard_manifest.json', 'padakanaja/shards/padakanaja_shard_*.json.gz'],
+          deps=['optimize'],
+          description='Split Padakanaja into small gzipped shard packs for the web client'),
+    Stage('alar_snapshot', 'scripts/parsing/alar_snapshot.py',
+          outputs=[ALAR_SNAPSHOT], args=['ingest'],
+          description='Download alar.yml once into a local snapshot (--force to refresh)'),
+    Stage('alar_index', 'scripts/parsing/generate_alar_reverse_index.py',
+          inputs=[ALAR_SNAPSHOT],
+          outputs=['padakanaja/alar_reverse_index_part*.json', 'padakanaja/alar_reverse_index_metadata.json'],
+          deps=['alar_snapshot'], args=['--offline'],
+          description='Build the Alar reverse index'),
+    Stage('alar_client_index', 'scripts/parsing/build_alar_client_index.py',
+          inputs=[ALAR_SNAPSHOT],
+          outputs=['padakanaja/alar_client_index.bin', 'padakanaja/alar_client_index.bin.gz'],
+          deps=['alar_snapshot'], args=['build', '--offline'],
+          description='Build the compact Alar index the web client reads with typed arrays'),
+    Stage('build_manifest', 'scripts/parsing/build_manifest.py',
+          inputs=['padakanaja/combined_dictionaries_ultra.json', 'padakanaja/alar_client_index.bin'],
+          outputs=['padakanaja/build_manifest.json'], deps=['optimize', 'alar_client_index'], args=['build'],
+          description='Hash the client dictionary shards and indexes, and write deltas from earlier builds'),
+    Stage('kannada_index', 'scripts/parsing/create_kannada_index.py',
+          inputs=['padakanaja/combined_dictionaries_ultra.json', ALAR_SNAPSHOT],
+          outputs=['padakanaja/kannada_index/kannada_index_metadata.json'], deps=['optimize', 'alar_snapshot'],
+          args=['build', '--offline'],
+          description='Build the sharded Kannada -> English index'),
+    Stage('kv_export', 'scripts/parsing/export_kv_bulk.py',
+          inputs=[*REVERSE_INDEX_CHUNKS, *REVERSE_INDEX_OVERFLOW,
+                  'padakanaja/padakanaja_reverse_index_metadata.json'],
+          outputs=['padakanaja/kv_bulk/padakanaja_kv_bulk_*.json'], deps=['padakanaja_index'],
+          description='Export per-term KV bulk-upload files'),
+    Stage('kv_local', 'scripts/parsing/export_kv_local.py',
+          inputs=['padakanaja/padakanaja_reverse_index_*.json', *REVERSE_INDEX_CHUNKS, *REVERSE_INDEX_OVERFLOW],
+          outputs=['.wrangler/state/v3/kv/miniflare-KVNamespaceObject/*.sqlite'], deps=['padakanaja_index'],
+          manual=True, description='Load the chunks into the local wrangler dev KV store (optional)'),
+    Stage('sqlite', 'scripts/search/sqlite_search.py',
+          inputs=['padakanaja/combined_dictionaries_ultra.json', ALAR_SNAPSHOT],
+          outputs=['padakanaja/rala_dictionary.sqlite'], deps=['optimize', 'alar_snapshot'],
+          args=['build', '--offline'], manual=True,
+          description='Bulk-load Alar and Padakanaja into an SQLite FTS5 database (optional)'),
+]
+
+
+def expand(patterns):
+    """Files matching glob patterns (relative to ROOT), minus '!' exclusions"""
+    included = set()
+    excluded = set()
+    for pattern in patterns:
+        target = excluded if pattern.startswith('!') else included
+        for path in ROOT.glob(pattern.lstrip('!')):
+            if path.is_file():
+                target.add(path.relative_to(ROOT).as_posix())
+    return sorted(included - excluded)
+
+
+@lru_cache(maxsize=None)
+def script_modules(script):
+    """The script and every repository module it imports, transitively (paths relative to ROOT)"""
+    modules = []
+    pending = [script]
+    while pending:
+        path = pending.pop()
+        if path in modules or not (ROOT / path).is_file():
+            continue
+        modules.append(path)
+        tree = ast.parse((ROOT / path).read_text(encoding='utf-8'), filename=path)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+                names = [node.module]
+            elif isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            else:
+                continue
+            for name in names:
+                if name == 'scripts' or name.startswith('scripts.'):
+                    pending.append(name.replace('.', '/') + '.py')
+    return sorted(modules)
+
+
+class BuildState:
+    """Fingerprints of the last successful run of each stage, with a file digest cache"""
+
+    def __init__(self, path=STATE_FILE):
+        self.path = path
+        self.data = {'digests': {}, 'stages': {}}
+        if path.exists():
+            with open(path, 'r', encoding='utf-8') as f:
+                self.data = json.load(f)
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix('.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f, ensure_ascii=False, indent=1)
+        os.replace(tmp, self.path)
+
+    def digest(self, relative_path):
+        """SHA-256 of a file, reusing the cached value while size and mtime are unchanged"""
+        stat = (ROOT / relative_path).stat()
+        cached = self.data['digests'].get(relative_path)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            return cached[2]
+        sha = hashlib.sha256()
+        with open(ROOT / relative_path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                sha.update(block)
+        self.data['digests'][relative_path] = [stat.st_size, stat.st_mtime_ns, sha.hexdigest()]
+        return sha.hexdigest()
+
+    def command_fingerprint(self, stage):
+        modules = [(path, self.digest(path)) for path in script_modules(stage.script)]
+        return hashlib.sha256(json.dumps([modules, stage.args]).encode('utf-8')).hexdigest()
+
+    def inputs_fingerprint(self, stage):
+        digests = [(path, self.digest(path)) for path in expand(stage.inputs)]
+        return hashlib.sha256(json.dumps(digests).encode('utf-8')).hexdigest()
+
+    def plan(self, stage):
+        """(reasons, extra_args, record) for a stage; no reasons means it is up to date"""
+        previous = self.data['stages'].get(stage.name)
+        command = self.command_fingerprint(stage)
+        reasons = []
+        if previous is None:
+            reasons.append('never built')
+        elif previous['command'] != command:
+            reasons.append('script, modules or arguments changed')
+        if not expand(stage.outputs):
+            reasons.append('outputs missing')
+
+        if stage.per_file_suffix:
+            files = {path: self.digest(path) for path in expand(stage.inputs)}
+            built_files = previous.get('files', {}) if previous and not reasons else {}
+            changed = [path for path, digest in files.items()
+                       if built_files.get(path) != digest or not (ROOT / stage.output_for(path)).exists()]
+            record = {'command': command, 'files': files}
+            if reasons:
+                return reasons, [], record
+            if changed:
+                return [f'{len(changed)} of {len(files)} inputs changed'], changed, record
+            return [], [], record
+
+        inputs = self.inputs_fingerprint(stage)
+        if previous and previous.get('inputs') != inputs:
+            reasons.append('inputs changed')
+        return reasons, [], {'command': command, 'inputs': inputs}
+
+    def record(self, stage, record):
+        self.data['stages'][stage.name] = {**record, 'built': time.strftime('%Y-%m-%dT%H:%M:%S')}
+
+
+def select_stages(targets):
+    """Targets plus their transitive dependencies, in declaration order"""
+    by_name = {stage.name: stage for stage in STAGES}
+    if not targets:
+        targets = [stage.name for stage in STAGES if not stage.manual]
+    unknown = [t for t in targets if t not in by_name]
+    if unknown:
+        raise SystemExit(f"❌ Unknown stage(s): {', '.join(unknown)} (see --list)")
+
+    selected = set()
+    pending = list(targets)
+    while pending:
+        name = pending.pop()
+        if name in selected:
+            continue
+        # Manual stages are only pulled in when named explicitly
+        if by_name[name].manual and name not in targets:
+            continue
+        selected.add(name)
+        pending.extend(by_name[name].deps)
+    return [stage for stage in STAGES if stage.name in selected]
+
+
+def run_stage(stage, extra_args):
+    """Run a stage's script from the repository root, logging its output"""
+    log_dir = BUILD_DIR / 'logs'
+    log_dir.mkdir(parents=True, exist_ok=True)
+    env = {**os.environ, 'RALA_TIMING_LOG': str(BUILD_DIR / 'timings.jsonl'), 'PYTHONUNBUFFERED': '1'}
+    start = time.perf_counter()
+    with open(log_dir / f'{stage.name}.log', 'w', encoding='utf-8') as log:
+        result = subprocess.run(stage.command(extra_args), cwd=ROOT, env=env,
+                                stdout=log, stderr=subprocess.STDOUT)
+    return result.returncode, time.perf_counter() - start
+
+
+def build(stages, jobs=2, force=False, dry_run=False):
+    """Run out-of-date stages, dependencies first, independent ones concurrently.
+
+    Returns the names of failed stages.
+    """
+    state = BuildState()
+    selected = {stage.name for stage in stages}
+    done = set()
+    failed = []
+    blocked = set()
+    would_run = set()  # --dry-run: stages that would run, so their dependents would too
+    running = {}
+    pending = list(stages)
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        while pending or running:
+            for stage in list(pending):
+                deps = [d for d in stage.deps if d in selected]
+                if any(d in failed or d in blocked for d in deps):
+                    pending.remove(stage)
+                    blocked.add(stage.name)
+                    print(f"⏭  {stage.name}: skipped (dependency failed)")
+                    continue
+                if not all(d in done for d in deps):
+                    continue
+                pending.remove(stage)
+
+                reasons, extra_args, record = state.plan(stage)
+                if force and not reasons:
+                    reasons = ['forced']
+                if dry_run and not reasons:
+                    reasons = [f'{d} would run' for d in deps if d in would_run]
+                if not reasons:
+                    print(f"✓  {stage.name}: up to date")
+                    done.add(stage.name)
+                    continue
+                if dry_run:
+                    print(f"▶  {stage.name}: would run ({', '.join(reasons)})")
+                    would_run.add(stage.name)
+                    done.add(stage.name)
+                    continue
+                print(f"▶  {stage.name}: running ({', '.join(reasons)})")
+                running[executor.submit(run_stage, stage, extra_args)] = (stage, record)
+
+            if not running:
+                continue
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                stage, record = running.pop(future)
+                returncode, seconds = future.result()
+                if returncode == 0:
+                    state.record(stage, record)
+                    state.save()
+                    done.add(stage.name)
+                    print(f"✅ {stage.name}: done in {seconds:.1f}s")
+                else:
+                    failed.append(stage.name)
+                    print(f"❌ {stage.name}: failed (exit {returncode}), see {BUILD_DIR / 'logs' / (stage.name + '.log')}")
+
+    if not dry_run:
+        state.save()
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Incremental, dependency-tracked build of the Rala dictionary data')
+    parser.add_argument('targets', nargs='*', help='Stages to build (default: all non-manual stages)')
+    parser.add_argument('--jobs', '-j', type=int, default=2, help='Stages run concurrently (default: 2)')
+    parser.add_argument('--force', action='store_true', help='Run the selected stages even if up to date')
+    parser.add_argument('--dry-run', '-n', action='store_true', help='Only show what would run and why')
+    parser.add_argument('--list', action='store_true', help='List stages and exit')
+    args = parser.parse_args()
+
+    if args.list:
+        for stage in STAGES:
+            deps = f" (after {', '.join(stage.deps)})" if stage.deps else ''
+            manual = ' [manual]' if stage.manual else ''
+            print(f"  {stage.name:18s} {stage.description}{deps}{manual}")
+        return
+
+    print("=" * 80)
+    print("rala-build")
+    print("=" * 80)
+    print()
+
+    start = time.perf_counter()
+    failed = build(select_stages(args.targets), args.jobs, args.force, args.dry_run)
+    print(f"\n{'❌' if failed else '✅'} Build {'failed' if failed else 'finished'} in {time.perf_counter() - start:.1f}s")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Local search engine over the built reverse index.
+
+Mirrors searchWithReverseIndex in workers/src/index.js so queries can be run
+and compared offline against freshly built artefacts:
+- single word: postings of the word (or one overflow page with --page)
+- several words: entries whose definition contains every word as a whole word,
+  exact-phrase matches first; the rarest word's overflow pages are read too
+  (up to MAX_MULTIWORD_PAGES), and --page selects the next MAX_RESULTS matches
+- dedup by kannada + english, capped at MAX_RESULTS per page
+
+Postings come from the chunk directory (JSON or compact chunks, loaded
+through an LRU chunk cache) or from a binary index file (binary_index.py).
+
+Usage:
+    python rala_search.py "house" [--index-dir padakanaja] [--page 1] [--json]
+    python rala_search.py --queries queries.txt [--output results.jsonl] [--baseline old.jsonl]
+"""
+
+import argparse
+import json
+import math
+import re
+import sys
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.parsing.binary_index import IndexReader
+from scripts.parsing.chunk_codec import COMPRESSIONS, chunk_file_suffix, read_chunk_file
+from scripts.parsing.create_padakanaja_reverse_index import get_chunks_for_word, normalize_query_term
+from scripts.parsing.kannada_text import clean_kannada_display
+from scripts.parsing.optimize_chunk_layout import load_query_log
+
+MAX_RESULTS = 500  # Same as maxResults in the Worker
+MAX_MULTIWORD_PAGES = 10  # Same as MAX_MULTIWORD_PAGES in the Worker
+DEFAULT_CACHE_CHUNKS = 16  # Covers the 13 regular chunks plus the hot chunk
+
+
+def contains_whole_word(text, word):
+    """Same as containsWholeWord in the Worker (JS \\b only knows ASCII word characters)"""
+    if not text or not word:
+        return False
+    return re.search(rf'\b{re.escape(word)}\b', text, re.IGNORECASE | re.ASCII) is not None
+
+
+def format_result(entry, matched_word, match_type):
+    """Result object in the Worker's response shape"""
+    return {
+        'kannada': clean_kannada_display(entry.get('kannada')),
+        'definition': entry.get('english'),
+        'type': entry.get('type') or 'Noun',
+        'source': entry.get('source') or '',
+        'dict_title': entry.get('dict_title') or '',
+        'id': entry.get('id') or '',
+        'also': entry.get('also') or [],
+        'matchedWord': matched_word,
+        'matchType': match_type
+    }
+
+
+class ChunkSource:
+    """Postings from a chunk directory, read through an LRU cache of decoded chunks"""
+
+    def __init__(self, index_dir, cache_chunks=DEFAULT_CACHE_CHUNKS):
+        self.index_dir = Path(index_dir)
+        self.cache_chunks = cache_chunks
+        self._cache = OrderedDict()  # chunk number -> chunk
+        self.hits = 0
+        self.misses = 0
+        self.loads = []  # (chunk number, load ms)
+
+        with open(self.index_dir / 'padakanaja_reverse_index_chunk_index.json', 'r', encoding='utf-8') as f:
+            self.chunk_index = json.load(f)
+        overflow_index_file = self.index_dir / 'padakanaja_reverse_index_overflow_index.json'
+        self.overflow_index = {}
+        if overflow_index_file.exists():
+            with open(overflow_index_file, 'r', encoding='utf-8') as f:
+                self.overflow_index = json.load(f)
+
+    def _chunk_file(self, chunk_num):
+        stem = f'padakanaja_reverse_index_part{chunk_num}'
+        candidates = [self.index_dir / f'{stem}.json']
+        candidates += [self.index_dir / f'{stem}{chunk_file_suffix(c)}' for c in COMPRESSIONS]
+        existing = [candidate for candidate in candidates if candidate.exists()]
+        # Newest wins, as in find_chunk_files: an older build's part in another encoding is stale
+        return max(existing, key=lambda path: path.stat().st_mtime) if existing else None
+
+    def get_chunk(self, chunk_num):
+        """Decoded chunk (empty if missing), loading and evicting as needed"""
+        if chunk_num in self._cache:
+            self.hits += 1
+            self._cache.move_to_end(chunk_num)
+            return self._cache[chunk_num]
+
+        self.misses += 1
+        start = time.perf_counter()
+        chunk_file = self._chunk_file(chunk_num)
+        chunk = read_chunk_file(chunk_file) if chunk_file else {}
+        self.loads.append((chunk_num, (time.perf_counter() - start) * 1000))
+
+        self._cache[chunk_num] = chunk
+        while len(self._cache) > self.cache_chunks:
+            self._cache.popitem(last=False)
+        return chunk
+
+    def postings(self, word):
+        """Posting lists of a word, one per chunk that holds it (like loadPostingsForWord)"""
+        posting_lists = []
+        for chunk_num in get_chunks_for_word(word, self.chunk_index):
+            chunk = self.get_chunk(chunk_num)
+            if word in chunk:
+                posting_lists.append(chunk[word])
+        return posting_lists
+
+    def overflow_page(self, word, page):
+        """Overflow page of a word (pages >= 1; page 0 is stored in the chunk)"""
+        page_file = (self.index_dir / 'padakanaja_reverse_index_overflow' /
+                     f'padakanaja_reverse_index_overflow_{word}_{page}.json')
+        if not page_file.exists():
+            return []
+        with open(page_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def overflow_stats(self, word):
+        """{'total', 'pages'} of a word with overflow pages (pages excludes the head), else None"""
+        return self.overflow_index.get(word)
+
+    def stats(self):
+        return {
+            'cached_chunks': len(self._cache),
+            'hits': self.hits,
+            'misses': self.misses,
+            'load_ms': round(sum(ms for _, ms in self.loads), 1)
+        }
+
+
+class BinaryIndexSource:
+    """Postings from a binary index file, paged like the chunk head + overflow pages"""
+
+    def __init__(self, index_file, page_size=MAX_RESULTS):
+        self.reader = IndexReader(index_file)
+        self.page_size = page_size
+
+    def postings(self, word):
+        postings = self.reader.lookup(word, limit=self.page_size)
+        return [postings] if postings else []
+
+    def overflow_page(self, word, page):
+        return self.reader.lookup(word, limit=self.page_size, offset=page * self.page_size)
+
+    def overflow_stats(self, word):
+        total = self.reader.posting_count_for(word)
+        if total <= self.page_size:
+            return None
+        return {'total': total, 'pages': math.ceil(total / self.page_size) - 1}
+
+    def stats(self):
+        return {'terms': len(self.reader)}
+
+
+class SearchEngine:
+    """Worker query semantics over a local posting source"""
+
+    def __init__(self, source, max_results=MAX_RESULTS):
+        self.source = source
+        self.max_results = max_results
+
+    @classmethod
+    def open(cls, index_dir='padakanaja', binary_index=None, cache_chunks=DEFAULT_CACHE_CHUNKS):
+        """Engine over a chunk directory, or over a binary index file if given"""
+        if binary_index:
+            return cls(BinaryIndexSource(binary_index))
+        return cls(ChunkSource(index_dir, cache_chunks))
+
+    def search(self, query, page=0):
+        """Results of searchWithReverseIndex(query, env, page)"""
+        return self.search_page(query, page)['results']
+
+    def search_page(self, query, page=0):
+        """Search like searchWithReverseIndex: {'results', 'total', 'pages', 'truncated'}"""
+        empty = {'results': [], 'total': 0, 'pages': 0, 'truncated': False}
+        query_lower = query.lower().strip()
+        words = query_lower.split()
+        if not words:
+            return empty
+
+        if len(words) > 1:
+            return self._search_all_words(query_lower, words, page)
+
+        word = words[0]
+        clean_word = normalize_query_term(word)
+        if len(clean_word) < 2:
+            return empty
+
+        if page > 0:
+            posting_lists = [self.source.overflow_page(clean_word, page)]
+        else:
+            posting_lists = self.source.postings(clean_word)
+
+        results = []
+        seen = set()
+        for postings in posting_lists:
+            for entry in postings:
+                key = f"{entry.get('kannada')}-{entry.get('english')}"
+                if key not in seen and len(results) < self.max_results:
+                    seen.add(key)
+                    results.append(format_result(entry, word, 'direct'))
+
+        stats = self.source.overflow_stats(clean_word)
+        return {
+            'results': results,
+            'total': stats['total'] if stats else len(results),
+            'pages': stats['pages'] + 1 if stats else (1 if results else 0),
+            'truncated': False
+        }
+
+    def _search_all_words(self, exact_phrase, words, page=0):
+        clean_words = [normalize_query_term(w) for w in words]
+        index_words = [w for w in clean_words if len(w) >= 2]
+        posting_lists = {w: self.source.postings(w) for w in index_words}
+
+        # Every all-words match is in the rarest word's posting list: read its
+        # overflow pages too (the other words contribute their head only)
+        truncated = False
+        rarest = min(index_words, key=lambda w: (self.source.overflow_stats(w) or {}).get('total', 0),
+                     default=None)
+        stats = self.source.overflow_stats(rarest) if rarest else None
+        if stats:
+            page_count = min(stats['pages'], MAX_MULTIWORD_PAGES)
+            truncated = stats['pages'] > page_count
+            posting_lists[rarest] = posting_lists[rarest] + [
+                self.source.overflow_page(rarest, n) for n in range(1, page_count + 1)]
+
+        # Union of all candidates, first occurrence of each key wins
+        candidates = {}
+        for clean_word in index_words:
+            for postings in posting_lists[clean_word]:
+                for entry in postings:
+                    key = f"{entry.get('kannada')}-{entry.get('english')}"
+                    candidates.setdefault(key, entry)
+
+        exact_phrase_results = []
+        all_words_results = []
+        for entry in candidates.values():
+            english = entry.get('english') or ''
+            if not all(contains_whole_word(english, w) for w in clean_words):
+                continue
+            if exact_phrase in english.lower():
+                exact_phrase_results.append(format_result(entry, exact_phrase, 'exact-phrase'))
+            else:
+                all_words_results.append(format_result(entry, exact_phrase, 'all-words'))
+
+        matches = exact_phrase_results + all_words_results
+        return {
+            'results': matches[page * self.max_results:(page + 1) * self.max_results],
+            'total': len(matches),
+            'pages': math.ceil(len(matches) / self.max_results),
+            'truncated': truncated
+        }
+
+
+def result_signature(query, results, top=10):
+    """Compact record of a query's results for regression comparison"""
+    return {
+        'query': query,
+        'count': len(results),
+        'top': [[r['kannada'], r['definition']] for r in results[:top]]
+    }
+
+
+def run_queries(engine, queries, output_file=None, baseline_file=None):
+    """Run a batch of queries; optionally save signatures and compare them with a baseline.
+
+    Returns the number of queries whose results differ from the baseline.
+    """
+    print(f"🔍 Running {len(queries):,} queries...")
+    signatures = []
+    timings = []
+    for query in queries:
+        start = time.perf_counter()
+        results = engine.search(query)
+        timings.append((time.perf_counter() - start) * 1000)
+        signatures.append(result_signature(query, results))
+
+    timings.sort()
+    total_s = sum(timings) / 1000
+    if timings:
+        p50 = timings[len(timings) // 2]
+        p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+        print(f"✓ {len(queries):,} queries in {total_s:.2f}s (p50 {p50:.2f} ms, p95 {p95:.2f} ms)")
+    print(f"  Source: {engine.source.stats()}")
+
+    if output_file:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            for signature in signatures:
+                f.write(json.dumps(signature, ensure_ascii=False) + '\n')
+        print(f"✓ Saved results to {output_file}")
+
+    differences = 0
+    if baseline_file:
+        baseline = {}
+        with open(baseline_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    baseline[record['query']] = record
+        for signature in signatures:
+            expected = baseline.get(signature['query'])
+            if expected is None:
+                continue
+            if expected['count'] != signature['count'] or expected['top'] != signature['top']:
+                differences += 1
+                if differences <= 20:
+                    print(f"  ⚠ {signature['query']!r}: {expected['count']} -> {signature['count']} results")
+        if differences:
+            print(f"❌ {differences:,} queries differ from {baseline_file}")
+        else:
+            print(f"✓ All queries match {baseline_file}")
+    return differences
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Search the built reverse index locally (Worker semantics)')
+    parser.add_argument('query', nargs='?', help='Query to run')
+    parser.add_argument('--index-dir', default='padakanaja', help='Directory with built reverse index chunks')
+    parser.add_argument('--binary-index', help='Search a binary index file instead of the chunks')
+    parser.add_argument('--cache-chunks', type=int, default=DEFAULT_CACHE_CHUNKS,
+                        help=f'Decoded chunks kept in the LRU cache (default: {DEFAULT_CACHE_CHUNKS})')
+    parser.add_argument('--page', type=int, default=0,
+                        help='Overflow page (single word) or page of matches (several words)')
+    parser.add_argument('--limit', type=int, default=20, help='Results to print')
+    parser.add_argument('--json', action='store_true', help='Print the Worker JSON response')
+    parser.add_argument('--queries', help='Run every query of a log file (one per line or JSON lines)')
+    parser.add_argument('--output', help='Save per-query result signatures (JSON lines) with --queries')
+    parser.add_argument('--baseline', help='Compare --queries results with saved signatures; exit 1 on differences')
+    args = parser.parse_args()
+
+    if not args.query and not args.queries:
+        parser.error('a query or --queries is required')
+
+    engine = SearchEngine.open(args.index_dir, args.binary_index, args.cache_chunks)
+
+    if args.queries:
+        differences = run_queries(engine, load_query_log(args.queries), args.output, args.baseline)
+        sys.exit(1 if differences else 0)
+
+    query = args.query.strip()
+    start = time.perf_counter()
+    response = engine.search_page(query, page=args.page)
+    results = response['results']
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    if args.json:
+        print(json.dumps({'query': query, 'page': args.page, 'results': results, 'count': len(results),
+                          'total': response['total'], 'pages': response['pages'],
+                          'truncated': response['truncated']}, ensure_ascii=False, indent=2))
+        return
+
+    print(f"🔍 {query!r}: {len(results)} results in {elapsed_ms:.1f} ms "
+          f"(page {args.page + 1} of {response['pages']}, {response['total']:,} total"
+          f"{', truncated' if response['truncated'] else ''})")
+    for result in results[:args.limit]:
+        print(f"  {result['kannada']} — {result['definition']} [{result['matchType']}]")
+    if len(results) > args.limit:
+        print(f"  ... {len(results) - args.limit} more")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the search Worker.
+
+Serves GET /?q=<query>[&page=N] with the Worker's JSON response, CORS headers
+and error shapes, straight from the locally built index files (see
+rala_search.py), so index formats and chunk layouts can be load-tested on
+one machine before anything is uploaded to KV.
+
+Connections are handled by asyncio (HTTP/1.1 keep-alive). Searches are
+CPU-bound and share one bounded chunk cache, so they run one at a time on a
+worker thread while the event loop keeps accepting and reading requests.
+
+Extra endpoint: GET /_stats returns request counters and chunk cache stats.
+Every search response carries X-Rala-Cache: HIT when no chunk had to be
+loaded for it, MISS otherwise.
+
+Usage:
+    python search_server.py [--index-dir padakanaja] [--port 8787] [--cache-chunks 16]
+    curl "http://localhost:8787/?q=house"
+"""
+
+import argparse
+import asyncio
+import json
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.search.rala_search import DEFAULT_CACHE_CHUNKS, SearchEngine
+
+MAX_HEADER_BYTES = 64 * 1024
+
+REASONS = {200: 'OK', 400: 'Bad Request', 500: 'Internal Server Error'}
+
+
+def parse_page(value):
+    """Same as Math.max(0, parseInt(value || '0', 10) || 0) in the Worker"""
+    match = re.match(r'\s*([+-]?\d+)', value or '0')
+    return max(0, int(match.group(1))) if match else 0
+
+
+class SearchServer:
+    """Asyncio HTTP server answering Worker-style search requests"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='search')
+        self.started = time.time()
+        self.requests = 0
+        self.errors = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def _search(self, query, page):
+        """Run a search and report whether it was served without loading chunks"""
+        misses_before = getattr(self.engine.source, 'misses', 0)
+        response = self.engine.search_page(query, page=page)
+        return response, getattr(self.engine.source, 'misses', 0) == misses_before
+
+    def _cors_headers(self, headers):
+        return {
+            'Access-Control-Allow-Origin': headers.get('origin') or '*',
+            'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
+            'Access-Control-Allow-Headers': 'Content-Type',
+            'Access-Control-Max-Age': '86400',
+        }
+
+    async def handle_request(self, method, target, headers):
+        """Return (status, headers, body bytes) for one request"""
+        cors_headers = self._cors_headers(headers)
+        if method == 'OPTIONS':
+            return 200, cors_headers, b''
+
+        json_headers = {**cors_headers, 'Content-Type': 'application/json'}
+        url = urlsplit(target)
+        params = parse_qs(url.query, keep_blank_values=True)
+
+        if url.path == '/_stats':
+            return 200, json_headers, json.dumps(self.stats(), separators=(',', ':')).encode('utf-8')
+
+        query = (params.get('q') or [''])[0]
+        page = parse_page((params.get('page') or ['0'])[0])
+        if not query.strip():
+            self.errors += 1
+            body = {'error': 'Query parameter "q" is required'}
+            return 400, json_headers, json.dumps(body, separators=(',', ':')).encode('utf-8')
+
+        try:
+            loop = asyncio.get_running_loop()
+            response, cache_hit = await loop.run_in_executor(self.executor, self._search, query.strip(), page)
+        except Exception as error:
+            self.errors += 1
+            print(f"❌ Error for {query!r}: {error}")
+            body = {'error': 'Internal server error', 'message': str(error)}
+            return 500, json_headers, json.dumps(body, separators=(',', ':')).encode('utf-8')
+
+        if cache_hit:
+            self.cache_hits += 1
+        else:
+            self.cache_misses += 1
+        results = response['results']
+        body = {'query': query.strip(), 'page': page, 'results': results, 'count': len(results),
+                'total': response['total'], 'pages': response['pages'], 'truncated': response['truncated']}
+        return 200, {**json_headers, 'X-Rala-Cache': 'HIT' if cache_hit else 'MISS'}, \
+            json.dumps(body, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    async def handle_connection(self, reader, writer):
+        """Serve requests on one connection until it is closed"""
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+
+                lines = head.decode('latin-1').split('\r\n')
+                try:
+                    method, target, version = lines[0].split(' ', 2)
+                except ValueError:
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    if ':' in line:
+                        name, value = line.split(':', 1)
+                        headers[name.strip().lower()] = value.strip()
+
+                content_length = int(headers.get('content-length') or 0)
+                if content_length:
+                    await reader.readexactly(content_length)  # Body is ignored, like the Worker
+
+                self.requests += 1
+                status, response_headers, body = await self.handle_request(method.upper(), target, headers)
+
+                keep_alive = (version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close')
+                response_headers['Content-Length'] = str(len(body))
+                response_headers['Connection'] = 'keep-alive' if keep_alive else 'close'
+                head_lines = [f'HTTP/1.1 {status} {REASONS.get(status, "")}']
+                head_lines += [f'{name}: {value}' for name, value in response_headers.items()]
+                writer.write(('\r\n'.join(head_lines) + '\r\n\r\n').encode('latin-1') + body)
+                await writer.drain()
+
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    def stats(self):
+        return {
+            'uptime_s': round(time.time() - self.started, 1),
+            'requests': self.requests,
+            'errors': self.errors,
+            'cache_hits': self.cache_hits,
+            'cache_misses': self.cache_misses,
+            'source': self.engine.source.stats()
+        }
+
+    async def serve(self, host, port):
+        server = await asyncio.start_server(self.handle_connection, host, port, limit=MAX_HEADER_BYTES)
+        print(f"🚀 Serving on http://{host}:{port}/?q=house (Ctrl+C to stop)")
+        async with server:
+            await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local asyncio stand-in for the search Worker')
+    parser.add_argument('--index-dir', default='padakanaja', help='Directory with built reverse index chunks')
+    parser.add_argument('--binary-index', help='Serve from a binary index file instead of the chunks')
+    parser.add_argument('--cache-chunks', type=int, default=DEFAULT_CACHE_CHUNKS,
+                        help=f'Decoded chunks kept in memory (default: {DEFAULT_CACHE_CHUNKS})')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8787, help='Port (default: 8787, same as wrangler dev)')
+    args = parser.parse_args()
+
+    engine = SearchEngine.open(args.index_dir, args.binary_index, args.cache_chunks)
+    server = SearchServer(engine)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print(f"\n✓ Stopped after {server.requests:,} requests")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+"""
+SQLite FTS5 search backend.
+
+Bulk-loads every Alar and Padakanaja entry into one SQLite file with an FTS5
+index over the English definition and the Kannada entry, and searches it with
+the Worker's result shape:
+- one word: entries whose definition contains the word
+- several words: entries containing all of them, exact-phrase matches first
+- "quoted words": exact phrase only
+- word*: prefix match; w*rd: wildcard (* is one letter, space or hyphen, as in js/search.js)
+- Kannada text: matched against the Kannada column
+
+Results are ranked by bm25 and deduplicated by kannada + english.
+
+Usage:
+    python sqlite_search.py build [--padakanaja FILE] [--alar-url URL | --no-alar] [--offline] [--output FILE]
+    python sqlite_search.py search "house" [--db FILE] [--page 1] [--json]
+    python sqlite_search.py benchmark --queries queries.txt [--db FILE] [--index-dir padakanaja]
+"""
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.parsing.alar_snapshot import ALAR_URL
+from scripts.parsing.create_optimized_merged_dictionary import load_alar, load_padakanaja_combined
+from scripts.parsing.entry_store import entry_rows
+from scripts.parsing.generate_reverse_index import normalize_type
+from scripts.parsing.instrumentation import instrument, phase
+from scripts.parsing.kannada_text import clean_kannada
+from scripts.parsing.optimize_chunk_layout import load_query_log
+from scripts.search.rala_search import DEFAULT_CACHE_CHUNKS, MAX_RESULTS, SearchEngine, format_result
+
+DEFAULT_DB = 'padakanaja/rala_dictionary.sqlite'
+
+# unicode61 treats Kannada vowel signs and viramas as separators, which would split
+# ಮನೆ into ಮ + ನ; declaring the combining marks (and ZWJ/ZWNJ) as token characters
+# keeps Kannada words whole.
+KANNADA_MARKS = ''.join(chr(c) for c in [*range(0x0C81, 0x0C84), 0x0CBC, *range(0x0CBE, 0x0CCE),
+                                         0x0CD5, 0x0CD6, 0x0CE2, 0x0CE3, 0x200C, 0x200D])
+TOKENIZER = f"unicode61 tokenchars '{KANNADA_MARKS}'"
+
+KANNADA_RE = re.compile(r'[\u0C80-\u0CFF]')
+
+SCHEMA = """
+CREATE TABLE entries (
+    id INTEGER PRIMARY KEY,
+    kannada TEXT NOT NULL,
+    definition TEXT NOT NULL,
+    type TEXT,
+    source TEXT,
+    dict_title TEXT,
+    corpus TEXT NOT NULL,
+    entry_id TEXT,
+    head TEXT,
+    phone TEXT
+);
+CREATE VIRTUAL TABLE entries_fts USING fts5(
+    definition, kannada,
+    content='entries', content_rowid='id',
+    tokenize="{tokenizer}"
+);
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+
+def iter_alar_rows(entries):
+    """(kannada, definition, type, source, dict_title, corpus, entry_id, head, phone) per Alar definition"""
+    for entry in entries:
+        kannada = clean_kannada(entry.get('entry', ''))
+        for def_entry in entry.get('defs') or []:
+            if not def_entry.get('entry'):
+                continue
+            yield (kannada, def_entry['entry'], normalize_type(def_entry.get('type', '')),
+                   entry.get('source', 'alar'), entry.get('dict_title', "V. Krishna's Alar"), 'alar',
+                   str(entry.get('id', '')), entry.get('head', ''), entry.get('phone', ''))
+
+
+def iter_padakanaja_rows(entries):
+    """Same row shape for the expanded Padakanaja entries"""
+    for kannada, english, type_str, source, dict_title, _ in entry_rows(entries):
+        yield kannada, english, type_str, source, dict_title, 'padakanaja', None, None, None
+
+
+def build_database(output_file=DEFAULT_DB, padakanaja_file='padakanaja/combined_dictionaries_ultra.json',
+                   alar_url=ALAR_URL, offline=None):
+    """Bulk-load the dictionaries into a fresh SQLite file and build its FTS5 index"""
+    print("=" * 80)
+    print("Building SQLite FTS5 Dictionary")
+    print("=" * 80)
+    print()
+
+    alar_entries = load_alar(alar_url, offline) if alar_url else []
+    padakanaja_entries = load_padakanaja_combined(padakanaja_file)
+
+    # Build next to the target and swap it in, so a running server never sees a half-built file
+    output_path = Path(output_file)
+    tmp_path = output_path.with_name(output_path.name + '.tmp')
+    tmp_path.unlink(missing_ok=True)
+
+    conn = sqlite3.connect(tmp_path)
+    conn.execute('PRAGMA journal_mode = OFF')
+    conn.execute('PRAGMA synchronous = OFF')
+    conn.executescript(SCHEMA.format(tokenizer=TOKENIZER.replace('"', '""')))
+
+    insert = 'INSERT INTO entries (kannada, definition, type, source, dict_title, corpus, entry_id, head, phone) ' \
+             'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)'
+    with phase('load_entries'):
+        with conn:
+            conn.executemany(insert, iter_alar_rows(alar_entries))
+            conn.executemany(insert, iter_padakanaja_rows(padakanaja_entries))
+    counts = dict(conn.execute('SELECT corpus, COUNT(*) FROM entries GROUP BY corpus').fetchall())
+    print(f"✓ Loaded {sum(counts.values()):,} entries ({counts})")
+
+    print("🔍 Building FTS5 index...")
+    with phase('build_fts'):
+        with conn:
+            conn.execute("INSERT INTO entries_fts (entries_fts) VALUES ('rebuild')")
+            conn.execute("INSERT INTO entries_fts (entries_fts) VALUES ('optimize')")
+            conn.executemany('INSERT INTO meta (key, value) VALUES (?, ?)', [
+                ('built', time.strftime('%Y-%m-%dT%H:%M:%S')),
+                ('counts', json.dumps(counts)),
+            ])
+    conn.execute('VACUUM')
+    conn.close()
+    os.replace(tmp_path, output_path)
+
+    size_mb = output_path.stat().st_size / 1024 / 1024
+    print(f"✓ Saved {output_path} ({size_mb:.2f} MB)")
+    return counts
+
+
+def fts_string(text):
+    """FTS5 string literal (tokenized by the index tokenizer, so 'well-known' becomes a phrase)"""
+    return '"' + text.replace('"', '""') + '"'
+
+
+def wildcard_to_regex(pattern):
+    """Same as wildcardToRegex in js/search.js: * is one letter, space or hyphen"""
+    return re.compile(re.escape(pattern).replace(r'\*', r'[a-zA-Z\s-]'), re.IGNORECASE)
+
+
+class SqliteSearch:
+    """Query API over a database written by build_database.
+
+        with SqliteSearch('padakanaja/rala_dictionary.sqlite') as db:
+            results = db.search('house')
+    """
+
+    def __init__(self, db_file=DEFAULT_DB, max_results=MAX_RESULTS):
+        if not Path(db_file).exists():
+            raise FileNotFoundError(f"{db_file} not found (run: python sqlite_search.py build)")
+        self.conn = sqlite3.connect(f'file:{db_file}?mode=ro', uri=True, check_same_thread=False)
+        self.max_results = max_results
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _plan(self, query):
+        """(fts expression, regex filters, exact phrase, match type) for a query"""
+        query = query.strip()
+        if KANNADA_RE.search(query):
+            terms = [fts_string(w.rstrip('*')) + ('*' if w.endswith('*') else '') for w in query.split()]
+            return 'kannada : (' + ' '.join(terms) + ')', [], None, 'kannada'
+
+        query_lower = query.lower()
+        if len(query_lower) > 2 and query_lower[0] == '"' and query_lower[-1] == '"':
+            phrase = query_lower[1:-1].strip()
+            return 'definition : ' + fts_string(phrase), [], phrase, 'exact-phrase'
+
+        terms = []
+        filters = []
+        words = query_lower.split()
+        for word in words:
+            if '*' not in word:
+                terms.append(fts_string(word))
+                continue
+            literal = word.split('*', 1)[0]
+            if literal:
+                terms.append(fts_string(literal) + '*')
+            # A trailing * is a plain prefix; anything else is checked against the wildcard pattern
+            if word.rstrip('*') != literal or word.count('*') > 1:
+                filters.append(wildcard_to_regex(word))
+
+        if not terms:
+            return None, filters, None, 'wildcard'
+        expression = 'definition : (' + ' '.join(terms) + ')'
+        if filters:
+            return expression, filters, None, 'wildcard'
+        if any(w.endswith('*') for w in words):
+            return expression, [], None, 'prefix'
+        if len(words) > 1:
+            return expression, [], query_lower, 'all-words'
+        return expression, [], None, 'direct'
+
+    def search(self, query, page=0, corpus=None):
+        """Worker-shaped results for a query, one page of max_results.
+
+        corpus limits results to 'alar' or 'padakanaja'.
+        """
+        expression, filters, phrase, match_type = self._plan(query)
+        if expression is None:
+            # A leading wildcard has no indexable prefix; refuse rather than scan every row
+            return []
+
+        sql = 'SELECT e.kannada, e.definition, e.type, e.source, e.dict_title, e.entry_id ' \
+              'FROM entries_fts JOIN entries e ON e.id = entries_fts.rowid WHERE entries_fts MATCH ?'
+        params = [expression]
+        if corpus:
+            sql += ' AND e.corpus = ?'
+            params.append(corpus)
+        if match_type == 'all-words':
+            # Exact-phrase matches first, like the Worker
+            sql += ' ORDER BY instr(lower(e.definition), ?) = 0, bm25(entries_fts)'
+            params.append(phrase)
+        else:
+            sql += ' ORDER BY bm25(entries_fts)'
+
+        results = []
+        seen = set()
+        skip = page * self.max_results
+        for kannada, definition, type_str, source, dict_title, entry_id in self.conn.execute(sql, params):
+            if filters and not all(f.search(definition) for f in filters):
+                continue
+            key = f"{kannada}-{definition}"
+            if key in seen:
+                continue
+            seen.add(key)
+            if skip:
+                skip -= 1
+                continue
+            entry_match = match_type
+            if match_type == 'all-words':
+                entry_match = 'exact-phrase' if phrase in definition.lower() else 'all-words'
+            entry = {'kannada': kannada, 'english': definition, 'type': type_str,
+                     'source': source, 'dict_title': dict_title, 'id': entry_id}
+            results.append(format_result(entry, phrase or query.strip().lower(), entry_match))
+            if len(results) >= self.max_results:
+                break
+        return results
+
+    def stats(self):
+        return dict(self.conn.execute('SELECT key, value FROM meta').fetchall())
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+def time_queries(search, queries):
+    """(per-query ms sorted, per-query result keys) for a search callable"""
+    timings = []
+    keys = []
+    for query in queries:
+        start = time.perf_counter()
+        results = search(query)
+        timings.append((time.perf_counter() - start) * 1000)
+        keys.append({(r['kannada'], r['definition']) for r in results})
+    return sorted(timings), keys
+
+
+def benchmark(db_file, index_dir, queries, output_file=None, cache_chunks=DEFAULT_CACHE_CHUNKS):
+    """Compare the SQLite backend with the JSON-chunk engine on the same queries.
+
+    The chunk index only holds Padakanaja, so SQLite is restricted to that corpus
+    for a like-for-like comparison. Overlap is the share of chunk-engine results
+    that SQLite also returns.
+    """
+    report = {'queries': len(queries), 'engines': {}}
+    keys = {}
+
+    start = time.perf_counter()
+    engine = SearchEngine.open(index_dir, cache_chunks=cache_chunks)
+    chunk_open_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    db = SqliteSearch(db_file)
+    sqlite_open_ms = (time.perf_counter() - start) * 1000
+
+    for name, open_ms, search in [
+        ('json_chunks', chunk_open_ms, engine.search),
+        ('sqlite_fts5', sqlite_open_ms, lambda q: db.search(q, corpus='padakanaja')),
+    ]:
+        print(f"⏱  {name}: {len(queries):,} queries...")
+        with phase(name):
+            timings, keys[name] = time_queries(search, queries)
+        report['engines'][name] = {
+            'open_ms': round(open_ms, 2),
+            'total_s': round(sum(timings) / 1000, 3),
+            'mean_ms': round(sum(timings) / len(timings), 3),
+            'p50_ms': round(percentile(timings, 0.50), 3),
+            'p95_ms': round(percentile(timings, 0.95), 3),
+            'p99_ms': round(percentile(timings, 0.99), 3),
+            'results': sum(len(k) for k in keys[name]),
+        }
+    db.close()
+
+    reference = keys['json_chunks']
+    found = sum(len(ref & got) for ref, got in zip(reference, keys['sqlite_fts5']))
+    expected = sum(len(ref) for ref in reference)
+    report['overlap'] = round(found / expected, 4) if expected else None
+
+    print()
+    for name, stats in report['engines'].items():
+        print(f"  {name:12s} open {stats['open_ms']:8.1f} ms | p50 {stats['p50_ms']:7.2f} ms | "
+              f"p95 {stats['p95_ms']:7.2f} ms | p99 {stats['p99_ms']:7.2f} ms | total {stats['total_s']:.2f}s")
+    print(f"  Overlap with JSON-chunk results: {report['overlap']}")
+
+    if output_file:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"✓ Saved report to {output_file}")
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='SQLite FTS5 dictionary backend')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = subparsers.add_parser('build', help='Build the SQLite database')
+    build_parser.add_argument('--padakanaja', default='padakanaja/combined_dictionaries_ultra.json',
+                              help='Ultra-compact Padakanaja dictionary')
+    build_parser.add_argument('--alar-url', default=ALAR_URL,
+                              help='Alar YAML URL or local file (URLs are only fetched when there is no snapshot)')
+    build_parser.add_argument('--no-alar', action='store_true', help='Build without the Alar dictionary')
+    build_parser.add_argument('--offline', action='store_true', default=None,
+                              help='Only use the local Alar snapshot (also RALA_OFFLINE=1)')
+    build_parser.add_argument('--output', default=DEFAULT_DB, help=f'Database file (default: {DEFAULT_DB})')
+
+    search_parser = subparsers.add_parser('search', help='Search the database')
+    search_parser.add_argument('query')
+    search_parser.add_argument('--db', default=DEFAULT_DB, help='Database file')
+    search_parser.add_argument('--page', type=int, default=0, help='Result page')
+    search_parser.add_argument('--corpus', choices=['alar', 'padakanaja'], help='Only search one dictionary set')
+    search_parser.add_argument('--limit', type=int, default=20, help='Results to print')
+    search_parser.add_argument('--json', action='store_true', help='Print the Worker JSON response')
+
+    bench_parser = subparsers.add_parser('benchmark', help='Compare with the JSON-chunk engine')
+    bench_parser.add_argument('--queries', required=True, help='Query log (one per line or JSON lines)')
+    bench_parser.add_argument('--db', default=DEFAULT_DB, help='Database file')
+    bench_parser.add_argument('--index-dir', default='padakanaja', help='Directory with built reverse index chunks')
+    bench_parser.add_argument('--cache-chunks', type=int, default=DEFAULT_CACHE_CHUNKS,
+                              help=f'Chunk cache size of the JSON-chunk engine (default: {DEFAULT_CACHE_CHUNKS})')
+    bench_parser.add_argument('--output', help='Save the report as JSON')
+
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        build_database(args.output, args.padakanaja, None if args.no_alar else args.alar_url, args.offline)
+    elif args.command == 'benchmark':
+        benchmark(args.db, args.index_dir, load_query_log(args.queries), args.output, args.cache_chunks)
+    else:
+        with SqliteSearch(args.db) as db:
+            start = time.perf_counter()
+            results = db.search(args.query, page=args.page, corpus=args.corpus)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+        if args.json:
+            print(json.dumps({'query': args.query, 'page': args.page, 'results': results, 'count': len(results)},
+                             ensure_ascii=False, indent=2))
+            return
+        print(f"🔍 {args.query!r}: {len(results)} results in {elapsed_ms:.1f} ms")
+        for result in results[:args.limit]:
+            print(f"  {result['kannada']} — {result['definition']} [{result['matchType']}]")
+        if len(results) > args.limit:
+            print(f"  ... {len(results) - args.limit} more")
+
+
+if __name__ == '__main__':
+    with instrument('sqlite_search'):
+        main()
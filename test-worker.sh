@@ -1,7 +1,7 @@
 #!/bin/bash
 # Quick test script for Worker API
 
-WORKER_URL="https://rala-search.rala-search.workers.dev"
+WORKER_URL="${WORKER_URL:-https://rala-search.rala-search.workers.dev}"  # e.g. WORKER_URL=http://localhost:8787 for search_server.py
 QUERY="${1:-hello}"
 
 echo "🧪 Testing Worker API..."
@@ -2,11 +2,20 @@
 // test-ui.js - Tests for UI functions (link generation, formatting, etc.)
 // ============================================================================
 
-// Mock cleanKannadaEntry function (copy from ui.js)
+// Mock cleanKannadaEntry function (copy from dictionary.js)
+function normalizeKannada(text) {
+    if (!text) return '';
+    return text.normalize('NFC')
+        .replace(/[\u200B\u2060\uFEFF\u00AD]/g, '')
+        .replace(/(?<![\u0C80-\u0CFF\u200C\u200D])[\u200C\u200D]+/g, '')
+        .replace(/\s+/g, ' ').trim();
+}
+
 function cleanKannadaEntry(text) {
     if (!text) return '';
-    let cleaned = text.replace(/[\[\](){}【】「」〈〉《》『』〔〕［］（）｛｝]/g, '');
+    let cleaned = normalizeKannada(text).replace(/[\[\](){}【】「」〈〉《》『』〔〕［］（）｛｝]/g, '');
     cleaned = cleaned.replace(/[<>"']/g, '');
+    cleaned = cleaned.replace(/\d+/g, '');
     cleaned = cleaned.replace(/\s+/g, ' ').trim();
     return cleaned;
 }
@@ -138,6 +147,22 @@ function testCleanKannadaEntry() {
         {
             input: '',
             expected: ''
+        },
+        {
+            input: 'ಆಕಾಶ 2',
+            expected: 'ಆಕಾಶ'
+        },
+        {
+            input: 'ಆಕಾಶ ೨',
+            expected: 'ಆಕಾಶ ೨'
+        },
+        {
+            input: 'ಕನ್\u200cನಡ',
+            expected: 'ಕನ್\u200cನಡ'
+        },
+        {
+            input: '\u200cಕನ್ನಡ\u200b',
+            expected: 'ಕನ್ನಡ'
         }
     ];
     
@@ -36,6 +36,7 @@ async function loadChunkIndex(env) {
 }
 
 // Load specific chunks from KV
+const chunkPromises = new Map(); // chunkNumber -> in-flight load, shared by concurrent lookups
 async function loadChunks(chunkNumbers, env) {
     const chunksToLoad = chunkNumbers.filter(num => !chunkCache.has(num));
     
@@ -43,17 +44,24 @@ async function loadChunks(chunkNumbers, env) {
         return; // All chunks already loaded
     }
     
-    const loadPromises = chunksToLoad.map(async (chunkNum) => {
-        try {
-            const chunkKey = `padakanaja_reverse_index_part${chunkNum}`;
-            const data = await env.DICTIONARY.get(chunkKey, 'json');
-            if (data) {
-                chunkCache.set(chunkNum, data);
-                console.log(`Loaded chunk ${chunkNum} (${Object.keys(data).length} words)`);
-            }
-        } catch (error) {
-            console.error(`Failed to load chunk ${chunkNum}:`, error);
+    const loadPromises = chunksToLoad.map((chunkNum) => {
+        if (!chunkPromises.has(chunkNum)) {
+            chunkPromises.set(chunkNum, (async () => {
+                try {
+                    const chunkKey = `padakanaja_reverse_index_part${chunkNum}`;
+                    const data = await env.DICTIONARY.get(chunkKey, 'json');
+                    if (data) {
+                        chunkCache.set(chunkNum, data);
+                        console.log(`Loaded chunk ${chunkNum} (${Object.keys(data).length} words)`);
+                    }
+                } catch (error) {
+                    console.error(`Failed to load chunk ${chunkNum}:`, error);
+                } finally {
+                    chunkPromises.delete(chunkNum);
+                }
+            })());
         }
+        return chunkPromises.get(chunkNum);
     });
     
     await Promise.all(loadPromises);
@@ -66,6 +74,13 @@ function getChunksForWord(word, chunkIndex) {
     }
     
     const wordLower = word.toLowerCase();
+    
+    // Exact-word routes (e.g. the small hot chunk 0) take precedence over prefixes
+    const termRoutes = chunkIndex._terms;
+    if (termRoutes && Object.prototype.hasOwnProperty.call(termRoutes, wordLower)) {
+        return termRoutes[wordLower];
+    }
+    
     const prefix = wordLower.substring(0, 3);
     
     if (prefix in chunkIndex) {
@@ -83,10 +98,131 @@ function getChunksForWord(word, chunkIndex) {
     return [1];
 }
 
+// Load an overflow page of a word's postings (pages >= 1; page 0 is stored in the chunk)
+async function loadOverflowPage(word, page, env) {
+    const pageKey = `padakanaja_reverse_index_overflow_${word}_${page}`;
+    try {
+        return (await env.DICTIONARY.get(pageKey, 'json')) || [];
+    } catch (error) {
+        console.error(`Failed to load overflow page ${pageKey}:`, error);
+        return [];
+    }
+}
+
+// Posting stats of words with overflow pages: {word: {total, pages}} (pages excludes the head)
+let overflowIndex;
+let overflowIndexPromise = null;
+const MAX_MULTIWORD_PAGES = 10; // Overflow pages read per multi-word query
+
+async function loadOverflowIndex(env) {
+    if (overflowIndex !== undefined) {
+        return overflowIndex;
+    }
+    
+    if (!overflowIndexPromise) {
+        overflowIndexPromise = env.DICTIONARY.get('padakanaja_reverse_index_overflow_index', 'json')
+            .catch(() => null)
+            .then(data => {
+                overflowIndex = data || {};
+                return overflowIndex;
+            });
+    }
+    return overflowIndexPromise;
+}
+
+// Per-term KV layout (written by scripts/parsing/export_kv_bulk.py); null = chunked layout
+let kvLayout;
+let kvLayoutPromise = null;
+const termCache = new Map(); // KV key -> {word: postings}
+const TERM_CACHE_LIMIT = 5000;
+
+async function loadKvLayout(env) {
+    if (kvLayout !== undefined) {
+        return kvLayout;
+    }
+    
+    if (!kvLayoutPromise) {
+        kvLayoutPromise = env.DICTIONARY.get('padakanaja_kv_layout', 'json')
+            .catch(() => null)
+            .then(data => {
+                kvLayout = data || null;
+                return kvLayout;
+            });
+    }
+    return kvLayoutPromise;
+}
+
+// FNV-1a 32-bit hash of the UTF-8 bytes (same as fnv1a_32 in export_kv_bulk.py)
+function fnv1a32(text) {
+    let hash = 0x811c9dc5;
+    for (const byte of new TextEncoder().encode(text)) {
+        hash ^= byte;
+        hash = Math.imul(hash, 0x01000193) >>> 0;
+    }
+    return hash;
+}
+
+// KV key holding a word in the per-term layout (a single word or a small hash bucket)
+function getTermKey(word, layout) {
+    if (layout.buckets > 0) {
+        return `padakanaja_bucket_${fnv1a32(word) % layout.buckets}`;
+    }
+    return `padakanaja_term_${word}`;
+}
+
+// Get the posting lists of a word (one per chunk or key that holds it)
+async function loadPostingsForWord(word, env) {
+    const layout = await loadKvLayout(env);
+    
+    if (layout) {
+        const key = getTermKey(word, layout);
+        let value = termCache.get(key);
+        if (!value) {
+            let data;
+            try {
+                data = await env.DICTIONARY.get(key, 'json');
+            } catch (error) {
+                // Not cached: a failed read must not hide the bucket's words until the isolate recycles
+                console.error(`Failed to load ${key}:`, error);
+                return [];
+            }
+            if (termCache.size >= TERM_CACHE_LIMIT) {
+                termCache.delete(termCache.keys().next().value); // Evict oldest
+            }
+            value = data || {}; // null: no word of the index falls in this key
+            termCache.set(key, value);
+        }
+        return Object.prototype.hasOwnProperty.call(value, word) ? [value[word]] : [];
+    }
+    
+    const index = await loadChunkIndex(env);
+    const chunkNumbers = getChunksForWord(word, index);
+    await loadChunks(chunkNumbers, env);
+    
+    const postingLists = [];
+    for (const chunkNum of chunkNumbers) {
+        const chunk = chunkCache.get(chunkNum);
+        if (chunk && word in chunk) {
+            postingLists.push(chunk[word]);
+        }
+    }
+    return postingLists;
+}
+
+// Same as normalize_kannada in scripts/parsing/kannada_text.py: NFC, invisible
+// characters and joiners that do not follow a Kannada letter removed
+function normalizeKannada(text) {
+    if (!text) return '';
+    return text.normalize('NFC')
+        .replace(/[\u200B\u2060\uFEFF\u00AD]/g, '')
+        .replace(/(?<![\u0C80-\u0CFF\u200C\u200D])[\u200C\u200D]+/g, '')
+        .replace(/\s+/g, ' ').trim();
+}
+
 // Clean Kannada entry
 function cleanKannadaEntry(text) {
     if (!text) return '';
-    let cleaned = text.replace(/[\[\](){}【】「」〈〉《》『』〔〕［］（）｛｝]/g, '');
+    let cleaned = normalizeKannada(text).replace(/[\[\](){}【】「」〈〉《》『』〔〕［］（）｛｝]/g, '');
     cleaned = cleaned.replace(/[<>"']/g, '');
     cleaned = cleaned.replace(/\d+/g, '');
     cleaned = cleaned.replace(/\s+/g, ' ').trim();
@@ -102,51 +238,53 @@ function containsWholeWord(text, word) {
 }
 
 // Search using reverse index (O(1) lookup)
-async function searchWithReverseIndex(query, env) {
+// Returns {results, total, pages, truncated}: page > 0 reads the word's overflow page
+// (single word) or the next maxResults matches (several words)
+async function searchWithReverseIndex(query, env, page = 0) {
     const queryLower = query.toLowerCase().trim();
     const words = queryLower.split(/\s+/).filter(w => w.length > 0);
+    const maxResults = 500;
     
     if (words.length === 0) {
-        return [];
+        return { results: [], total: 0, pages: 0, truncated: false };
     }
     
     const isMultiWord = words.length > 1;
-    const maxResults = 500;
-    
-    // Load chunk index
-    const index = await loadChunkIndex(env);
+    const overflow = await loadOverflowIndex(env);
     
     // For multi-word: collect all candidate entries, then filter to those containing all words
     if (isMultiWord) {
         const exactPhrase = queryLower;
         const exactPhraseResults = [];
         const allWordsResults = [];
-        const seen = new Set();
         
         // Step 1: Collect all candidate entries (union of all word results)
         const candidateEntries = new Map(); // key -> entry data
         
-        // Load all chunks for all words first
-        const allChunkNumbers = new Set();
-        for (const word of words) {
-            const cleanWord = word.replace(/[^a-z0-9]/gi, '').toLowerCase();
-            if (cleanWord.length < 2) continue;
-            const chunks = getChunksForWord(cleanWord, index);
-            chunks.forEach(c => allChunkNumbers.add(c));
+        // Load postings for all words in parallel
+        const cleanWords = words
+            .map(word => word.replace(/[^a-z0-9]/gi, '').toLowerCase())
+            .filter(cleanWord => cleanWord.length >= 2);
+        const postingsByWord = await Promise.all(cleanWords.map(cleanWord => loadPostingsForWord(cleanWord, env)));
+        
+        // A chunk only holds a word's head page. Every all-words match is in the
+        // posting list of the rarest word, so read that one in full (up to
+        // MAX_MULTIWORD_PAGES overflow pages) and flag the response if it is cut.
+        let truncated = false;
+        const postingTotal = w => (overflow[w] ? overflow[w].total : 0);
+        const rarest = cleanWords.reduce((best, w) => (postingTotal(w) < postingTotal(best) ? w : best), cleanWords[0]);
+        if (rarest && overflow[rarest]) {
+            const pageCount = Math.min(overflow[rarest].pages, MAX_MULTIWORD_PAGES);
+            truncated = overflow[rarest].pages > pageCount;
+            const pageNumbers = Array.from({ length: pageCount }, (_, i) => i + 1);
+            const pages = await Promise.all(pageNumbers.map(n => loadOverflowPage(rarest, n, env)));
+            postingsByWord[cleanWords.indexOf(rarest)].push(...pages);
         }
-        await loadChunks(Array.from(allChunkNumbers), env);
         
         // Collect all entries that match any word
-        for (const word of words) {
-            const cleanWord = word.replace(/[^a-z0-9]/gi, '').toLowerCase();
-            if (cleanWord.length < 2) continue;
-            
-            const chunkNumbers = getChunksForWord(cleanWord, index);
-            for (const chunkNum of chunkNumbers) {
-                const chunk = chunkCache.get(chunkNum);
-                if (!chunk || !(cleanWord in chunk)) continue;
-                
-                for (const entry of chunk[cleanWord]) {
+        for (const postingLists of postingsByWord) {
+            for (const postings of postingLists) {
+                for (const entry of postings) {
                     const key = `${entry.kannada}-${entry.english}`;
                     if (!candidateEntries.has(key)) {
                         candidateEntries.set(key, entry);
@@ -156,9 +294,7 @@ async function searchWithReverseIndex(query, env) {
         }
         
         // Step 2: Filter candidates to only those containing ALL words
-        for (const [key, entry] of candidateEntries) {
-            if (seen.has(key) || exactPhraseResults.length + allWordsResults.length >= maxResults) break;
-            
+        for (const entry of candidateEntries.values()) {
             const defLower = entry.english.toLowerCase();
             
             // Check if all words are present
@@ -171,7 +307,6 @@ async function searchWithReverseIndex(query, env) {
             
             // Exact phrase match (highest priority)
             if (defLower.includes(exactPhrase)) {
-                seen.add(key);
                 exactPhraseResults.push({
                     kannada: cleanKannadaEntry(entry.kannada),
                     definition: entry.english,
@@ -179,12 +314,12 @@ async function searchWithReverseIndex(query, env) {
                     source: entry.source || '',
                     dict_title: entry.dict_title || '',
                     id: entry.id || '',
+                    also: entry.also || [],
                     matchedWord: exactPhrase,
                     matchType: 'exact-phrase'
                 });
             } else {
                 // All words present as whole words
-                seen.add(key);
                 allWordsResults.push({
                     kannada: cleanKannadaEntry(entry.kannada),
                     definition: entry.english,
@@ -192,14 +327,21 @@ async function searchWithReverseIndex(query, env) {
                     source: entry.source || '',
                     dict_title: entry.dict_title || '',
                     id: entry.id || '',
+                    also: entry.also || [],
                     matchedWord: exactPhrase,
                     matchType: 'all-words'
                 });
             }
         }
         
-        // Return: exact phrase first, then all words
-        return [...exactPhraseResults, ...allWordsResults].slice(0, maxResults);
+        // Return: exact phrase first, then all words, maxResults per page
+        const matches = [...exactPhraseResults, ...allWordsResults];
+        return {
+            results: matches.slice(page * maxResults, (page + 1) * maxResults),
+            total: matches.length,
+            pages: Math.ceil(matches.length / maxResults),
+            truncated
+        };
     } else {
         // Single word search (original logic)
         const results = [];
@@ -207,16 +349,16 @@ async function searchWithReverseIndex(query, env) {
         const word = words[0];
         const cleanWord = word.replace(/[^a-z0-9]/gi, '').toLowerCase();
         
-        if (cleanWord.length < 2) return [];
+        if (cleanWord.length < 2) {
+            return { results: [], total: 0, pages: 0, truncated: false };
+        }
         
-        const chunkNumbers = getChunksForWord(cleanWord, index);
-        await loadChunks(chunkNumbers, env);
+        const postingLists = page > 0
+            ? [await loadOverflowPage(cleanWord, page, env)]
+            : await loadPostingsForWord(cleanWord, env);
         
-        for (const chunkNum of chunkNumbers) {
-            const chunk = chunkCache.get(chunkNum);
-            if (!chunk || !(cleanWord in chunk)) continue;
-            
-            for (const entry of chunk[cleanWord]) {
+        for (const postings of postingLists) {
+            for (const entry of postings) {
                 const key = `${entry.kannada}-${entry.english}`;
                 if (!seen.has(key) && results.length < maxResults) {
                     seen.add(key);
@@ -227,6 +369,7 @@ async function searchWithReverseIndex(query, env) {
                         source: entry.source || '',
                         dict_title: entry.dict_title || '',
                         id: entry.id || '',
+                        also: entry.also || [],
                         matchedWord: word,
                         matchType: 'direct'
                     });
@@ -234,7 +377,14 @@ async function searchWithReverseIndex(query, env) {
             }
         }
         
-        return results;
+        // Words with overflow pages: head page plus stats.pages overflow pages
+        const stats = overflow[cleanWord];
+        return {
+            results,
+            total: stats ? stats.total : results.length,
+            pages: stats ? stats.pages + 1 : (results.length > 0 ? 1 : 0),
+            truncated: false
+        };
     }
 }
 
@@ -259,6 +409,7 @@ export default {
             // Get query
             const url = new URL(request.url);
             const query = url.searchParams.get('q') || '';
+            const page = Math.max(0, parseInt(url.searchParams.get('page') || '0', 10) || 0);
             
             if (!query || query.trim().length === 0) {
                 return new Response(JSON.stringify({ 
@@ -270,12 +421,16 @@ export default {
             }
             
             // Search using reverse index
-            const results = await searchWithReverseIndex(query.trim(), env);
+            const { results, total, pages, truncated } = await searchWithReverseIndex(query.trim(), env, page);
             
             return new Response(JSON.stringify({
                 query: query.trim(),
+                page: page,
                 results: results,
-                count: results.length
+                count: results.length,
+                total: total,
+                pages: pages,
+                truncated: truncated
             }), {
                 headers: { ...corsHeaders, 'Content-Type': 'application/json' }
             });
@@ -0,0 +1,25 @@
+#!/bin/bash
+# Upload the per-term KV layout (scripts/parsing/export_kv_bulk.py) with bulk puts
+# Run from the project root: ./workers/upload_kv_bulk.sh [namespace-id]
+set -e
+
+KV_NAMESPACE_ID="${1:-c0d0459e763b45c2816c8d26fb4771a1}"
+BULK_DIR="padakanaja/kv_bulk"
+
+echo "🚀 Uploading per-term reverse index to Cloudflare KV..."
+echo "⚠️  Namespace ID: $KV_NAMESPACE_ID"
+echo ""
+
+if [ ! -d "$BULK_DIR" ]; then
+    echo "❌ Error: $BULK_DIR not found. Run scripts/parsing/export_kv_bulk.py first."
+    exit 1
+fi
+
+# Files are numbered so the layout key (last batch) lands after every term key
+for file in $(ls "$BULK_DIR"/padakanaja_kv_bulk_*.json | sort -V); do
+    echo "📤 Uploading $(basename "$file")..."
+    npx wrangler kv bulk put --namespace-id=$KV_NAMESPACE_ID --remote "$file"
+done
+
+echo ""
+echo "✅ Per-term reverse index uploaded!"
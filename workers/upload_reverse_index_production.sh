@@ -16,14 +16,26 @@ npx wrangler kv key put --namespace-id=$PROD_KV_NAMESPACE_ID --remote padakanaja
 echo "📤 Uploading metadata..."
 npx wrangler kv key put --namespace-id=$PROD_KV_NAMESPACE_ID --remote padakanaja_reverse_index_metadata --path padakanaja/padakanaja_reverse_index_metadata.json
 
-# Upload all chunks
+# Upload all chunks (part0 is the optional hot chunk)
 echo "📤 Uploading chunks..."
-for i in {1..13}; do
+for i in {0..13}; do
     if [ -f "padakanaja/padakanaja_reverse_index_part${i}.json" ]; then
         echo "  Uploading chunk ${i}/13..."
         npx wrangler kv key put --namespace-id=$PROD_KV_NAMESPACE_ID --remote padakanaja_reverse_index_part${i} --path padakanaja/padakanaja_reverse_index_part${i}.json
     fi
 done
 
+# Upload overflow pages (posting lists longer than one page)
+if [ -f "padakanaja/padakanaja_reverse_index_overflow_index.json" ]; then
+    echo "📤 Uploading overflow index..."
+    npx wrangler kv key put --namespace-id=$PROD_KV_NAMESPACE_ID --remote padakanaja_reverse_index_overflow_index --path padakanaja/padakanaja_reverse_index_overflow_index.json
+fi
+if [ -d "padakanaja/padakanaja_reverse_index_overflow" ]; then
+    echo "📤 Uploading overflow pages..."
+    for page in padakanaja/padakanaja_reverse_index_overflow/*.json; do
+        npx wrangler kv key put --namespace-id=$PROD_KV_NAMESPACE_ID --remote "$(basename "$page" .json)" --path "$page"
+    done
+fi
+
 echo ""
 echo "✅ Reverse index uploaded to production!"